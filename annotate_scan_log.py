@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Annotate a receiver scan log with Band, Service_Type and Primary_Use.
+
+Reads a CSV log or one frequency per line from a file or stdin and streams
+each record back out with the matching allocations appended. Records flow
+through generators, so memory stays bounded regardless of log size.
+
+Examples:
+    python annotate_scan_log.py scan.csv > annotated.csv
+    rtl_power ... | python annotate_scan_log.py --format lines --unit Hz
+    python annotate_scan_log.py big.csv --workers 4 --chunk-size 50000
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+
+from frequency_index import FrequencyIndex
+from frequency_streams import BUFFER_SIZE, UNIT_EXPONENTS, chunked, ordered_parallel_map, parse_frequency
+
+ANNOTATION_FIELDS = ["Band", "Service_Type", "Primary_Use"]
+
+# Index used by annotate_chunk(); built lazily once per process
+_worker_index = None
+
+
+class ColumnError(ValueError):
+    """Raised when the requested frequency column is not in the log's header."""
+
+
+def read_rows(stream, fmt="auto"):
+    """Yield each record of the log as a list of fields."""
+    if fmt == "auto":
+        first = stream.readline()
+        if not first:
+            return
+        fmt = "csv" if "," in first else "lines"
+        lines = _chain_line(first, stream)
+    else:
+        lines = stream
+
+    if fmt == "csv":
+        yield from csv.reader(lines)
+    else:
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield [line]
+
+
+def _chain_line(first, stream):
+    """Yield an already-read line followed by the rest of the stream."""
+    yield first
+    yield from stream
+
+
+def resolve_column(header, column):
+    """Return the position of the frequency column in a header row."""
+    if column is None:
+        for i, name in enumerate(header):
+            if "freq" in name.lower():
+                return i
+        return 0
+    if column.isdigit():
+        return int(column)
+    if column not in header:
+        raise ColumnError(f"no column {column!r} in the header; available columns: "
+                          f"{', '.join(repr(name) for name in header)}")
+    return header.index(column)
+
+
+def annotate_rows(rows, index, column=0, exponent=0):
+    """Yield each row with Band, Service_Type and Primary_Use fields appended."""
+    for row in rows:
+        frequency = parse_frequency(row[column], exponent) if column < len(row) else None
+        matches = index.lookup(frequency) if frequency is not None else []
+        yield row + ["; ".join(str(entry[field]) for entry in matches) for field in ANNOTATION_FIELDS]
+
+
+def annotate_chunk(task):
+    """Annotate one chunk of rows in a worker process."""
+    global _worker_index
+    if _worker_index is None:
+        _worker_index = FrequencyIndex()
+    rows, column, exponent = task
+    return list(annotate_rows(rows, _worker_index, column, exponent))
+
+
+def annotate_stream(source, dest, fmt="auto", column=None, unit="MHz", workers=0, chunk_size=10000):
+    """Annotate every record from source and write CSV to dest. Returns the record count."""
+    exponent = UNIT_EXPONENTS[unit]
+    rows = read_rows(source, fmt)
+    writer = csv.writer(dest)
+
+    first = next(rows, None)
+    if first is None:
+        return 0
+
+    # A first record whose frequency field is not numeric is a header
+    position = resolve_column(first, column)
+    if position >= len(first) or parse_frequency(first[position]) is None:
+        writer.writerow(first + ANNOTATION_FIELDS)
+    else:
+        if len(first) == 1:
+            writer.writerow([f"Frequency_{unit}"] + ANNOTATION_FIELDS)
+        rows = _chain_line(first, rows)
+
+    count = 0
+    if workers > 0:
+        tasks = ((chunk, position, exponent) for chunk in chunked(rows, chunk_size))
+        for annotated in ordered_parallel_map(annotate_chunk, tasks, workers):
+            writer.writerows(annotated)
+            count += len(annotated)
+    else:
+        index = FrequencyIndex()
+        for annotated in annotate_rows(rows, index, position, exponent):
+            writer.writerow(annotated)
+            count += 1
+    return count
+
+
+def main():
+    """Annotate a scan log from a file or stdin."""
+    parser = argparse.ArgumentParser(description="Annotate a frequency scan log with allocation data.")
+    parser.add_argument("input", nargs="?", default="-", help="log file to read (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="file to write (default: stdout)")
+    parser.add_argument("--format", choices=["auto", "csv", "lines"], default="auto",
+                        help="input format (default: detect from the first line)")
+    parser.add_argument("--column", help="frequency column name or position in CSV input")
+    parser.add_argument("--unit", choices=sorted(UNIT_EXPONENTS), default="MHz",
+                        help="unit of the logged frequencies (default: MHz)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="annotate chunks in this many worker processes (default: in-process)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="records per worker chunk")
+    args = parser.parse_args()
+
+    if args.input == "-":
+        source = io.open(sys.stdin.fileno(), "r", buffering=BUFFER_SIZE, newline="", closefd=False)
+    else:
+        source = open(args.input, "r", buffering=BUFFER_SIZE, newline="")
+    if args.output == "-":
+        dest = io.open(sys.stdout.fileno(), "w", buffering=BUFFER_SIZE, newline="", closefd=False)
+    else:
+        dest = open(args.output, "w", buffering=BUFFER_SIZE, newline="")
+
+    try:
+        with source, dest:
+            count = annotate_stream(source, dest, args.format, args.column, args.unit,
+                                    args.workers, args.chunk_size)
+    except BrokenPipeError:
+        # Downstream consumer (e.g. head) closed the pipe early; point stdout at
+        # devnull so the interpreter's final flush does not raise again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return
+    except ColumnError as e:
+        parser.error(str(e))
+
+    print(f"Annotated {count:,} records", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
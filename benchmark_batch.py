@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark vectorized batch classification against the per-item lookup paths.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from enhance_frequency_data import get_enhanced_frequency_data
+from frequency_batch import BatchClassifier
+from frequency_index import FrequencyIndex
+
+
+def linear_scan(data, frequency):
+    """Classify one frequency by scanning every allocation."""
+    return [i for i, row in enumerate(data)
+            if row['Frequency_Start_MHz'] <= frequency <= row['Frequency_End_MHz']]
+
+
+def make_sweep(count, seed):
+    """Random log-uniform sweep from 100 kHz to 40 GHz, with some exact allocation hits."""
+    rng = np.random.default_rng(seed)
+    freqs = 10 ** rng.uniform(-1, np.log10(40000.0), count)
+    data = get_enhanced_frequency_data()
+    points = np.array([row['Frequency_Start_MHz'] for row in data])
+    hits = rng.random(count) < 0.05
+    freqs[hits] = rng.choice(points, hits.sum())
+    return freqs
+
+
+def main():
+    """Time batch classification and the per-item paths on the same sweep."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000, help="frequencies in the sweep")
+    parser.add_argument("--per-item", type=int, default=100_000, help="frequencies timed on the per-item paths")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    data = get_enhanced_frequency_data()
+    freqs = make_sweep(args.count, args.seed)
+    sample = freqs[:min(args.per_item, args.count)]
+
+    start = time.perf_counter()
+    classifier = BatchClassifier(data)
+    setup_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = classifier.classify(freqs)
+    batch_time = time.perf_counter() - start
+
+    index = classifier.index
+    position = {id(row): i for i, row in enumerate(data)}
+    start = time.perf_counter()
+    indexed = [[position[id(row)] for row in index.lookup(f)] for f in sample.tolist()]
+    index_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [linear_scan(data, f) for f in sample.tolist()]
+    scan_time = time.perf_counter() - start
+
+    for i in range(len(sample)):
+        expected = sorted(scanned[i])
+        if sorted(result.matches(i).tolist()) != expected or sorted(indexed[i]) != expected:
+            raise SystemExit(f"Mismatch at {sample[i]!r} MHz")
+
+    print(f"Batch classification of {args.count:,} frequencies against {len(data)} allocations")
+    print(f"  setup:            {setup_time * 1000:10.2f} ms")
+    print(f"  batch (NumPy):    {batch_time:10.3f} s  {args.count / batch_time:14,.0f} freq/s")
+    print(f"  FrequencyIndex:   {index_time:10.3f} s  {len(sample) / index_time:14,.0f} freq/s  ({len(sample):,} items)")
+    print(f"  linear scan:      {scan_time:10.3f} s  {len(sample) / scan_time:14,.0f} freq/s  ({len(sample):,} items)")
+    print(f"  matches: {len(result.indices):,} total, "
+          f"{int((result.primary_index >= 0).sum()):,} frequencies classified")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark the SQLite bulk loader against the original row-at-a-time insert path.
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from enhance_frequency_data import get_enhanced_frequency_data
+from generate_databases import bulk_load_frequencies, create_frequency_tables, create_frequency_indexes
+
+
+def generate_rows(count):
+    """Yield count rows by tiling the real allocations across shifted frequency windows."""
+    data = get_enhanced_frequency_data()
+    for i in range(count):
+        row = dict(data[i % len(data)])
+        shift = (i // len(data)) * 50000.0
+        row['Frequency_Start_MHz'] += shift
+        row['Frequency_End_MHz'] += shift
+        yield row
+
+
+def row_at_a_time_load(rows, filename):
+    """The pre-bulk path: indexes first, then one execute() per row."""
+    conn = sqlite3.connect(filename)
+    cursor = conn.cursor()
+    create_frequency_tables(cursor)
+    cursor.execute("CREATE INDEX idx_frequency_range ON Frequencies (Frequency_Start_MHz, Frequency_End_MHz)")
+    cursor.execute("CREATE INDEX idx_service_type ON Frequencies (Service_Type)")
+    cursor.execute("CREATE INDEX idx_band ON Frequencies (Band)")
+    count = 0
+    for row in rows:
+        cursor.execute("""
+            INSERT INTO Frequencies (Band, Frequency_Start_MHz, Frequency_End_MHz, Wavelength, Primary_Use, Service_Type)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (row['Band'], row['Frequency_Start_MHz'], row['Frequency_End_MHz'],
+              row['Wavelength'], row['Primary_Use'], row['Service_Type']))
+        count += 1
+    cursor.execute("""
+        INSERT INTO Frequencies_RTree (ID, Frequency_Start_MHz, Frequency_End_MHz)
+        SELECT ID, Frequency_Start_MHz, Frequency_End_MHz FROM Frequencies
+    """)
+    conn.commit()
+    conn.close()
+    return count
+
+
+def time_load(loader, rows, directory, name):
+    """Run one loader into a fresh file and return (seconds, row count)."""
+    filename = os.path.join(directory, name)
+    start = time.perf_counter()
+    count = loader(rows, filename)
+    return time.perf_counter() - start, count
+
+
+def main():
+    """Load the same generated rows through both paths and report throughput."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows to load (default: 10^6)")
+    parser.add_argument("--batch-size", type=int, default=50000)
+    parser.add_argument("--skip-legacy", action="store_true", help="only time the bulk loader")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Loading {args.rows:,} rows")
+        bulk_time, count = time_load(
+            lambda rows, filename: bulk_load_frequencies(rows, filename, args.batch_size,
+                                                         progress_every=max(args.rows // 5, 1)),
+            generate_rows(args.rows), directory, "bulk.db")
+        print(f"  bulk loader:      {bulk_time:8.2f} s  {count / bulk_time:12,.0f} rows/s")
+
+        if not args.skip_legacy:
+            legacy_time, count = time_load(row_at_a_time_load, generate_rows(args.rows), directory, "legacy.db")
+            print(f"  row-at-a-time:    {legacy_time:8.2f} s  {count / legacy_time:12,.0f} rows/s")
+            print(f"  speedup:          {legacy_time / bulk_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
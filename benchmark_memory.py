@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Compare the memory footprint of the list-of-dicts dataset with FrequencyTable.
+
+Both representations are loaded from the same CSV, as a consumer reading a
+large export would, so every row owns freshly parsed strings and floats.
+"""
+
+import argparse
+import csv
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from enhance_frequency_data import get_enhanced_frequency_data
+from frequency_store import FrequencyTable, FREQUENCY_COLUMNS
+
+
+def write_tiled_csv(filename, count):
+    """Write count rows by tiling the real allocations across shifted frequency windows."""
+    data = get_enhanced_frequency_data()
+    with open(filename, 'w', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FREQUENCY_COLUMNS)
+        writer.writeheader()
+        for i in range(count):
+            row = dict(data[i % len(data)])
+            shift = (i // len(data)) * 50000.0
+            row['Frequency_Start_MHz'] += shift
+            row['Frequency_End_MHz'] += shift
+            writer.writerow(row)
+
+
+def load_dicts(filename):
+    """Load the CSV as the current list-of-dicts representation."""
+    rows = []
+    with open(filename, newline='') as csvfile:
+        for row in csv.DictReader(csvfile):
+            row['Frequency_Start_MHz'] = float(row['Frequency_Start_MHz'])
+            row['Frequency_End_MHz'] = float(row['Frequency_End_MHz'])
+            rows.append(row)
+    return rows
+
+
+def measure(loader, filename):
+    """Return (bytes retained, seconds) for loading filename with loader."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = loader(filename)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, elapsed
+
+
+def main():
+    """Report retained memory per representation at each size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'list of dicts':>16} {'FrequencyTable':>16} {'ratio':>7} {'load (dicts/table)':>20}")
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "rows.csv")
+        for count in args.sizes:
+            write_tiled_csv(filename, count)
+            dict_bytes, dict_time = measure(load_dicts, filename)
+            table_bytes, table_time = measure(FrequencyTable.from_csv, filename)
+            print(f"{count:>10,} {dict_bytes / 2**20:>13.1f} MB {table_bytes / 2**20:>13.1f} MB "
+                  f"{dict_bytes / table_bytes:>6.1f}x {dict_time:>9.2f}s / {table_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
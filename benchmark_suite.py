@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the lookup, build and query paths at increasing dataset sizes.
+
+Examples:
+    python benchmark_suite.py run --sizes 100 1000 10000 100000 -o results.json
+    python benchmark_suite.py run --sizes 10000000 --paths lookup_index_point sqlite_queries
+    python benchmark_suite.py compare baseline.json results.json --threshold 0.15
+
+Each dataset is held in a column-oriented FrequencyTable (a few dozen bytes
+per row) rather than a list of dicts, so 10^7-row runs fit in memory; the
+emitters read its rows through dict-like views.
+
+Results are JSON with environment metadata. `compare` flags every
+(path, size) whose time per operation grew by more than the threshold and exits
+non-zero if any did, so it can gate CI.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+
+from frequency_index import FrequencyIndex
+from frequency_store import FrequencyTable
+import generate_databases
+import generate_readme
+from generate_synthetic_data import synthetic_rows
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+EXCEL_MAX_ROWS = 1048575  # one row per sheet is the header
+
+# The queries from ACCESS_DATABASE_INSTRUCTIONS.md, plus the R*Tree form of the point lookup
+SQL_QUERIES = {
+    "point_between": "SELECT * FROM Frequencies WHERE ? BETWEEN Frequency_Start_MHz AND Frequency_End_MHz",
+    "service_type": "SELECT * FROM Frequencies WHERE Service_Type = 'Amateur Radio' ORDER BY Frequency_Start_MHz",
+    "range_within": "SELECT * FROM Frequencies WHERE Frequency_Start_MHz >= ? AND Frequency_End_MHz <= ?",
+    "point_rtree": """
+        SELECT f.* FROM Frequencies_RTree r JOIN Frequencies f ON f.ID = r.ID
+        WHERE r.Frequency_Start_MHz <= ?1 AND r.Frequency_End_MHz >= ?1
+          AND f.Frequency_Start_MHz <= ?1 AND f.Frequency_End_MHz >= ?1
+    """,
+    "text_like": "SELECT * FROM Frequencies WHERE Primary_Use LIKE '%distress%'",
+    "text_fts": """
+        SELECT f.* FROM Frequencies_FTS JOIN Frequencies f ON f.ID = Frequencies_FTS.rowid
+        WHERE Frequencies_FTS MATCH 'Primary_Use:distress' ORDER BY bm25(Frequencies_FTS)
+    """,
+}
+
+
+def environment():
+    """Describe the machine and software the results were measured on."""
+    env = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "sqlite": sqlite3.sqlite_version,
+    }
+    for module in ("numpy", "openpyxl", "pandas"):
+        try:
+            env[module] = __import__(module).__version__
+        except ImportError:
+            env[module] = None
+    try:
+        env["git_commit"] = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                                           text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        env["git_commit"] = None
+    return env
+
+
+def best_of(repeat, function):
+    """Run function repeat times and return the fastest wall time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def query_frequencies(data, count, seed):
+    """Random query frequencies inside and between the dataset's allocations."""
+    rng = random.Random(seed)
+    top = max(data.column('Frequency_End_MHz'))
+    return [rng.uniform(0, top) if rng.random() < 0.5 else rng.choice(data)['Frequency_Start_MHz']
+            for _ in range(count)]
+
+
+def bench_lookup_linear(data, ctx):
+    freqs = ctx['freqs'][:max(1, min(len(ctx['freqs']), 10_000_000 // len(data)))]
+    starts, ends = data.column('Frequency_Start_MHz'), data.column('Frequency_End_MHz')
+    seconds = best_of(ctx['repeat'], lambda: [
+        [data[i] for i, (start, end) in enumerate(zip(starts, ends)) if start <= f <= end] for f in freqs])
+    return seconds, len(freqs)
+
+
+def bench_index_build(data, ctx):
+    return best_of(ctx['repeat'], lambda: FrequencyIndex(data)), 1
+
+
+def bench_lookup_index_point(data, ctx):
+    index = ctx.setdefault('index', FrequencyIndex(data))
+    return best_of(ctx['repeat'], lambda: [index.lookup(f) for f in ctx['freqs']]), len(ctx['freqs'])
+
+
+def bench_lookup_index_range(data, ctx):
+    index = ctx.setdefault('index', FrequencyIndex(data))
+    return best_of(ctx['repeat'], lambda: [index.overlapping(f, f + 1.0) for f in ctx['freqs']]), len(ctx['freqs'])
+
+
+def bench_sqlite_build(data, ctx):
+    filename = os.path.join(ctx['directory'], "bench.db")
+    seconds = best_of(ctx['repeat'], lambda: generate_databases.create_sqlite_database(data, filename))
+    ctx['database'] = filename
+    return seconds, 1
+
+
+def bench_sqlite_queries(data, ctx):
+    if 'database' not in ctx:
+        bench_sqlite_build(data, ctx)
+    conn = sqlite3.connect(ctx['database'])
+    freqs = ctx['freqs'][:1000]
+    results = {}
+    try:
+        for name, sql in SQL_QUERIES.items():
+            if name in ("service_type", "text_like", "text_fts"):
+                run = lambda: conn.execute(sql).fetchall()
+                ops = 1
+            elif name == "range_within":
+                run = lambda: [conn.execute(sql, (f, f + 1.0)).fetchall() for f in freqs]
+                ops = len(freqs)
+            else:
+                run = lambda: [conn.execute(sql, (f,)).fetchall() for f in freqs]
+                ops = len(freqs)
+            results[f"sqlite_query_{name}"] = (best_of(ctx['repeat'], run), ops)
+    finally:
+        conn.close()
+    return results
+
+
+def bench_excel_build(data, ctx):
+    if len(data) > EXCEL_MAX_ROWS:
+        return None
+    filename = os.path.join(ctx['directory'], "bench.xlsx")
+    return best_of(ctx['repeat'], lambda: generate_databases.create_excel_workbook(data, filename, write_only=True)), 1
+
+
+def bench_readme(data, ctx):
+    return best_of(ctx['repeat'], lambda: generate_readme.generate_comprehensive_readme(data)), 1
+
+
+# name: benchmark(data, ctx) -> (seconds, operations), None to skip, or {result name: (seconds, operations)}
+BENCHMARKS = {
+    "lookup_linear": bench_lookup_linear,
+    "index_build": bench_index_build,
+    "lookup_index_point": bench_lookup_index_point,
+    "lookup_index_range": bench_lookup_index_range,
+    "sqlite_build": bench_sqlite_build,
+    "sqlite_queries": bench_sqlite_queries,
+    "excel_build": bench_excel_build,
+    "readme": bench_readme,
+}
+
+
+def run_suite(sizes, paths, repeat=3, queries=1000, seed=0, quiet=True):
+    """Run the selected benchmarks at each size and return the result document."""
+    results = []
+    for size in sizes:
+        data = FrequencyTable.from_rows(synthetic_rows(size, seed=seed))
+        with tempfile.TemporaryDirectory() as directory:
+            ctx = {'repeat': repeat, 'directory': directory, 'freqs': query_frequencies(data, queries, seed)}
+            for path in paths:
+                if quiet:
+                    # The emitters print a line per build; keep the report readable
+                    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                        outcome = BENCHMARKS[path](data, ctx)
+                else:
+                    outcome = BENCHMARKS[path](data, ctx)
+                if outcome is None:
+                    print(f"{path:<32} {size:>10,}   skipped")
+                    continue
+                named = outcome if isinstance(outcome, dict) else {path: outcome}
+                for name, (seconds, ops) in named.items():
+                    result = {"path": name, "size": size, "seconds": seconds, "operations": ops,
+                              "seconds_per_op": seconds / ops}
+                    results.append(result)
+                    print(f"{name:<32} {size:>10,} {seconds:>10.4f}s {seconds / ops * 1e6:>14.2f} us/op")
+    return {"environment": environment(), "repeat": repeat, "queries": queries, "results": results}
+
+
+def compare(baseline, current, threshold):
+    """Print per-path changes between two result documents; return the list of regressions."""
+    base = {(r["path"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"{'path':<32} {'size':>10} {'baseline':>12} {'current':>12} {'change':>8}")
+    for result in current["results"]:
+        key = (result["path"], result["size"])
+        if key not in base:
+            continue
+        before, after = base[key]["seconds_per_op"], result["seconds_per_op"]
+        change = after / before - 1 if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        print(f"{key[0]:<32} {key[1]:>10,} {before * 1e6:>10.2f}us {after * 1e6:>10.2f}us {change:>+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    """Run the suite or compare two result files."""
+    parser = argparse.ArgumentParser(description="Benchmark lookup, build and query paths at scale.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and write JSON results")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                            help="dataset sizes in allocations (up to 10^7)")
+    run_parser.add_argument("--paths", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    run_parser.add_argument("--repeat", type=int, default=3, help="runs per measurement; the fastest counts")
+    run_parser.add_argument("--queries", type=int, default=1000, help="lookup queries per measurement")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("-o", "--output", default="benchmark_results.json")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions between two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="allowed slowdown per operation (default: 0.10 = 10%%)")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        document = run_suite(args.sizes, args.paths, args.repeat, args.queries, args.seed)
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+        print(f"Results written to {args.output}")
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+        print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Build every generated artifact in parallel from a single load of the dataset.
+
+The CSV, SQLite (one file per region), snapshot, overlap report, Parquet, Excel,
+Access instructions and README emitters are independent, so they run
+concurrently in a process pool. Each emitter writes to a temporary file next to
+its output, which is renamed into place only once it is complete; its messages
+name the output, not the temporary file. Artifacts that the build manifest shows
+to be up to date are skipped, and each artifact is recorded in the manifest as
+soon as it is built, so a failing emitter does not cost the others' work.
+"""
+
+import argparse
+import inspect
+import io
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from functools import partial
+
+from enhance_frequency_data import get_enhanced_frequency_data, write_csv_file
+from build_manifest import BuildManifest, dataset_hash, inputs_hash
+import frequency_coverage
+import frequency_overlaps
+import frequency_parquet
+import frequency_regions
+import frequency_snapshot
+import generate_databases
+import generate_readme
+
+
+def _build_csv(data, filename):
+    write_csv_file(data, filename)
+
+
+def _build_sqlite(data, filename):
+    generate_databases.create_sqlite_database(data, filename)
+
+
+def _build_region_sqlite(region, data, filename):
+    generate_databases.create_sqlite_database(frequency_regions.REGIONS[region].loader(), filename)
+
+
+def _build_snapshot(data, filename):
+    frequency_snapshot.write_snapshot(data, filename)
+
+
+def _build_overlaps(data, filename):
+    frequency_overlaps.write_overlap_report(frequency_overlaps.find_overlaps(data), filename)
+
+
+def _build_parquet(data, filename):
+    frequency_parquet.write_parquet(data, filename)
+
+
+def _build_excel(data, filename):
+    generate_databases.create_excel_workbook(data, filename, write_only=True)
+
+
+def _build_access(data, filename):
+    generate_databases.create_access_instructions(filename)
+
+
+def _build_readme(data, filename):
+    generate_readme.write_readme(filename, data)
+
+
+# The same code generate_databases hashes for each output, so either builder sees the other's outputs as fresh
+EMITTER_CODE = generate_databases.emitter_code()
+
+# name: (output file, build function, emitter code hashed into the manifest, depends on data)
+# Listed slowest first so the long-running emitters start immediately
+EMITTERS = {
+    "excel": ("Frequencies.xlsx", _build_excel, EMITTER_CODE["excel"], True),
+    "sqlite": ("Frequencies.db", _build_sqlite, EMITTER_CODE["sqlite"], True),
+    "readme": ("README.md", _build_readme,
+               (generate_readme, frequency_coverage), True),
+    "snapshot": ("Frequencies.snap", _build_snapshot, EMITTER_CODE["snapshot"], True),
+    "overlaps": ("OVERLAP_REPORT.md", _build_overlaps, EMITTER_CODE["overlaps"], True),
+    "parquet": ("Frequencies.parquet", _build_parquet, EMITTER_CODE["parquet"], True),
+    "csv": ("frequency_data.csv", _build_csv, EMITTER_CODE["csv"], True),
+    "access": ("ACCESS_DATABASE_INSTRUCTIONS.md", _build_access, EMITTER_CODE["access"], False),
+}
+
+# One SQLite file per additional region; the main dataset is the US region's Frequencies.db.
+# These read their own region's data, so the loader's module is hashed instead of the dataset
+for _region in frequency_regions.REGIONS.values():
+    if _region.database != EMITTERS["sqlite"][0]:
+        EMITTERS[f"sqlite-{_region.code.lower()}"] = (
+            _region.database, partial(_build_region_sqlite, _region.code), (inspect.getmodule(_region.loader), *EMITTER_CODE["sqlite"]), False)
+
+
+def run_emitter(name, data, output):
+    """Build one artifact into a temp file and atomically rename it over output.
+
+    The emitter's messages are printed once it finishes, with the temp file's
+    name replaced by output.
+    """
+    _, build, _, _ = EMITTERS[name]
+    directory, basename = os.path.split(os.path.abspath(output))
+    stem, extension = os.path.splitext(basename)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{stem}.", suffix=extension, dir=directory)
+    os.close(fd)
+    # mkstemp creates the file private; give it the permissions a plain open() would
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(temp_name, 0o666 & ~umask)
+
+    start = time.perf_counter()
+    messages = io.StringIO()
+    try:
+        with redirect_stdout(messages):
+            build(data, temp_name)
+        os.replace(temp_name, output)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+    finally:
+        print(messages.getvalue().replace(temp_name, output), end="", flush=True)
+    return time.perf_counter() - start
+
+
+def build_all(names=None, force=False, jobs=None, manifest_file=None):
+    """
+    Build the named artifacts (default: all) and return {name: seconds or None if skipped}.
+
+    jobs=1 runs the emitters one after another in this process. Every artifact
+    is recorded in the manifest as it completes; if any emitter fails, the
+    first failure is raised once the others have finished.
+    """
+    names = list(EMITTERS) if names is None else [n for n in EMITTERS if n in names]
+    data = get_enhanced_frequency_data()
+    data_hash = dataset_hash(data)
+    manifest = BuildManifest(manifest_file) if manifest_file else BuildManifest()
+
+    stale = {}
+    timings = {}
+    for name in names:
+        output, _, code, uses_data = EMITTERS[name]
+        inputs = inputs_hash(data_hash if uses_data else "", *code)
+        if not force and manifest.is_fresh(name, output, inputs):
+            timings[name] = None
+        else:
+            stale[name] = inputs
+
+    failures = []
+
+    def finished(name, seconds):
+        timings[name] = seconds
+        manifest.record(name, EMITTERS[name][0], stale[name])
+        manifest.save()
+
+    if jobs == 1 or len(stale) <= 1:
+        for name in stale:
+            try:
+                finished(name, run_emitter(name, data, EMITTERS[name][0]))
+            except Exception as e:
+                failures.append(e)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs or len(stale)) as executor:
+            futures = {executor.submit(run_emitter, name, data, EMITTERS[name][0]): name for name in stale}
+            for future in as_completed(futures):
+                try:
+                    finished(futures[future], future.result())
+                except Exception as e:
+                    failures.append(e)
+
+    if failures:
+        raise failures[0]
+    return {name: timings[name] for name in names}
+
+
+def main(argv=None):
+    """Build all artifacts and report per-emitter wall time."""
+    parser = argparse.ArgumentParser(description="Build all generated frequency artifacts in parallel.")
+    parser.add_argument("emitters", nargs="*", metavar="EMITTER",
+                        help=f"emitters to run: {', '.join(EMITTERS)} (default: all)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="worker processes (default: one per stale emitter; 1 runs sequentially)")
+    args = parser.parse_args(argv)
+    unknown = set(args.emitters) - set(EMITTERS)
+    if unknown:
+        parser.error(f"unknown emitter(s): {', '.join(sorted(unknown))}")
+
+    start = time.perf_counter()
+    timings = build_all(args.emitters or None, args.force, args.jobs)
+    total = time.perf_counter() - start
+
+    print("\n=== Build Complete ===")
+    for name, seconds in timings.items():
+        output = EMITTERS[name][0]
+        if seconds is None:
+            print(f"- {output:<34} up to date")
+        else:
+            print(f"- {output:<34} {seconds:8.3f}s")
+    print(f"Total wall time: {total:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
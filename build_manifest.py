@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Build manifest for incremental regeneration of the generated artifacts.
+
+Each artifact is recorded with a hash of its inputs (the source dataset plus
+the code of the emitter that writes it) and a hash of the output it produced.
+A rebuild skips any artifact whose inputs are unchanged and whose output is
+still on disk as it was written.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from typing import List, Dict, Any
+
+from build_profiler import span
+from enhance_frequency_data import FREQUENCY_COLUMNS
+
+MANIFEST_FILE = ".build_manifest.json"
+
+
+def dataset_hash(data: List[Dict[str, Any]]) -> str:
+    """Hash the frequency dataset row by row, in order."""
+    digest = hashlib.sha256()
+    for row in data:
+        digest.update(json.dumps([row[column] for column in FREQUENCY_COLUMNS]).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def code_hash(*functions) -> str:
+    """Hash the source code of the functions (or whole modules) that make up an emitter."""
+    digest = hashlib.sha256()
+    for function in functions:
+        digest.update(inspect.getsource(function).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def file_hash(filename: str) -> str:
+    """Hash a file's contents in fixed-size blocks."""
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """Records what each artifact was built from, persisted as JSON."""
+
+    def __init__(self, filename: str = MANIFEST_FILE):
+        self.filename = filename
+        try:
+            with open(filename) as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def is_fresh(self, name: str, output: str, inputs: str) -> bool:
+        """Return True if output exists unchanged and was built from the same inputs."""
+        entry = self.entries.get(name)
+        if entry is None or entry.get("inputs") != inputs or entry.get("output") != output:
+            return False
+        try:
+            stat = os.stat(output)
+        except FileNotFoundError:
+            return False
+        # Size and mtime unchanged means the file is as written; only hash when they differ
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        if stat.st_size != entry["size"] or file_hash(output) != entry["sha256"]:
+            return False
+        entry["mtime_ns"] = stat.st_mtime_ns
+        return True
+
+    def record(self, name: str, output: str, inputs: str):
+        """Record that output was just built from the given inputs."""
+        stat = os.stat(output)
+        self.entries[name] = {
+            "output": output,
+            "inputs": inputs,
+            "sha256": file_hash(output),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def save(self):
+        """Write the manifest atomically."""
+        temp_name = self.filename + ".tmp"
+        with open(temp_name, "w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(temp_name, self.filename)
+
+
+def inputs_hash(data_hash: str, *functions) -> str:
+    """Combine a dataset hash with emitter code into one inputs hash."""
+    return hashlib.sha256(f"{data_hash}:{code_hash(*functions)}".encode("utf-8")).hexdigest()
+
+
+def build_artifact(manifest: BuildManifest, name: str, output: str, inputs: str, build, force: bool = False) -> bool:
+    """
+    Run build() unless the manifest shows output is up to date.
+
+    Returns True if the artifact was rebuilt, False if it was skipped.
+    """
+    if not force and manifest.is_fresh(name, output, inputs):
+        print(f"{output} is up to date, skipped")
+        return False
+    with span(name, output=output):
+        build()
+    manifest.record(name, output, inputs)
+    return True
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Timing and memory spans for the build scripts.
+
+Build stages are wrapped in span("name"), which costs nothing unless a
+BuildProfiler is active. While one is, every span records its wall time and
+its tracemalloc peak (the most memory Python held at any point inside it),
+nested spans included. The trace is written in Chrome trace-event JSON, which
+chrome://tracing, Perfetto and speedscope show as a flame chart; a cProfile
+dump (for snakeviz, flameprof or pstats) can be written alongside it.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, List
+
+_active = None
+
+
+def span(name: str, **attrs):
+    """Context manager timing a build stage under the active profiler, if any."""
+    if _active is None:
+        return nullcontext()
+    return _active.span(name, **attrs)
+
+
+class BuildProfiler:
+    """
+    Collects spans while active; use as a context manager around a build.
+
+    trace_memory turns on tracemalloc for per-span peaks (it slows Python
+    allocation noticeably). cprofile also runs cProfile over the whole build.
+    """
+
+    def __init__(self, trace_memory: bool = True, cprofile: bool = False):
+        self.trace_memory = trace_memory
+        self.cprofile = cprofile
+        self.spans: List[Dict[str, Any]] = []
+        self._stack = []
+        self._profile = None
+        self._started = None
+        self._started_tracemalloc = False
+        self._tracemalloc = None
+
+    def __enter__(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("a BuildProfiler is already active")
+        if self.trace_memory:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+        if self.cprofile:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._started = time.perf_counter()
+        _active = self
+        return self
+
+    def __exit__(self, *exc_info):
+        global _active
+        _active = None
+        if self._profile is not None:
+            self._profile.disable()
+        if self._started_tracemalloc:
+            self._tracemalloc.stop()
+            self._started_tracemalloc = False
+        return False
+
+    def _take_peak(self):
+        """Return the traced peak since the last call, and start a new one."""
+        peak = self._tracemalloc.get_traced_memory()[1]
+        self._tracemalloc.reset_peak()
+        return peak
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        # Each open span keeps the highest peak seen so far; tracemalloc's own
+        # peak is reset on entry so a child's peak does not leak into siblings
+        if self.trace_memory:
+            peak = self._take_peak()
+            if self._stack:
+                self._stack[-1]["peak_bytes"] = max(self._stack[-1]["peak_bytes"], peak)
+        record = {
+            "name": name,
+            "depth": len(self._stack),
+            "start_s": time.perf_counter() - self._started,
+            "duration_s": None,
+            "peak_bytes": 0,
+            "attrs": attrs,
+        }
+        self.spans.append(record)
+        self._stack.append(record)
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["duration_s"] = time.perf_counter() - started
+            self._stack.pop()
+            if self.trace_memory:
+                record["peak_bytes"] = max(record["peak_bytes"], self._take_peak())
+                if self._stack:
+                    self._stack[-1]["peak_bytes"] = max(self._stack[-1]["peak_bytes"], record["peak_bytes"])
+            else:
+                record["peak_bytes"] = None
+
+    def write_trace(self, filename: str):
+        """Write the spans as Chrome trace-event JSON."""
+        pid = os.getpid()
+        events = []
+        for record in self.spans:
+            args = dict(record["attrs"])
+            if record["peak_bytes"] is not None:
+                args["peak_kib"] = round(record["peak_bytes"] / 1024, 1)
+            events.append({
+                "name": record["name"],
+                "ph": "X",
+                "ts": round(record["start_s"] * 1e6, 1),
+                "dur": round((record["duration_s"] or 0.0) * 1e6, 1),
+                "pid": pid,
+                "tid": 0,
+                "args": args,
+            })
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, indent=1)
+
+    def write_cprofile(self, filename: str):
+        """Write the cProfile statistics in pstats format."""
+        if self._profile is None:
+            raise RuntimeError("cProfile was not enabled for this profiler")
+        self._profile.dump_stats(filename)
+
+    def report(self, min_seconds: float = 0.0) -> str:
+        """Indented text table of the spans, skipping those shorter than min_seconds."""
+        lines = [f"{'stage':<48} {'seconds':>9} {'peak MiB':>9}"]
+        for record in self.spans:
+            duration = record["duration_s"] or 0.0
+            if duration < min_seconds:
+                continue
+            label = "  " * record["depth"] + record["name"]
+            if record["attrs"]:
+                label += " [" + ", ".join(f"{k}={v}" for k, v in record["attrs"].items()) + "]"
+            peak = "-" if record["peak_bytes"] is None else f"{record['peak_bytes'] / (1 << 20):.1f}"
+            lines.append(f"{label[:48]:<48} {duration:>9.3f} {peak:>9}")
+        return "\n".join(lines)
+
+
+def add_profile_arguments(parser):
+    """Add the --profile options to a build script's argument parser."""
+    parser.add_argument("--profile", metavar="TRACE_JSON",
+                        help="time each build stage and write a Chrome trace-event JSON file "
+                             "(combine with --force to profile stages that are up to date)")
+    parser.add_argument("--profile-cprofile", metavar="PROF_FILE",
+                        help="with --profile, also write cProfile statistics to this file")
+    parser.add_argument("--profile-no-memory", action="store_true",
+                        help="with --profile, skip tracemalloc peaks (lower overhead)")
+
+
+@contextmanager
+def profiling(args):
+    """Profile the enclosed build if --profile was given, then write the trace and print a summary."""
+    if not args.profile:
+        yield None
+        return
+    profiler = BuildProfiler(trace_memory=not args.profile_no_memory, cprofile=bool(args.profile_cprofile))
+    with profiler:
+        yield profiler
+    profiler.write_trace(args.profile)
+    if args.profile_cprofile:
+        profiler.write_cprofile(args.profile_cprofile)
+    print("\n=== Build Profile ===")
+    print(profiler.report())
+    print(f"Trace written to {args.profile}" +
+          (f", cProfile statistics to {args.profile_cprofile}" if args.profile_cprofile else ""))
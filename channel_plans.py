@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Channel plans for the channelized allocations.
+
+The dataset stores Marine VHF, Aviation VHF, CB and FRS/GMRS as one span each.
+A ChannelPlan describes how such a span is divided into numbered channels as a
+handful of arithmetic segments (first channel, last channel, base frequency,
+spacing), so converting a channel number to a frequency or back is a few
+multiplications per segment, and channels are generated on demand rather than
+stored.
+"""
+
+import argparse
+import math
+from typing import Iterator, List, NamedTuple, Optional
+
+# Frequencies are reported to the nearest hertz
+FREQUENCY_DECIMALS = 6
+# Default match tolerance for frequency -> channel, in MHz
+CHANNEL_TOLERANCE_MHZ = 1e-6
+
+
+class ChannelSegment(NamedTuple):
+    """Channels first..last at base_mhz + (n - first) * spacing_mhz."""
+    first: int
+    last: int
+    base_mhz: float
+    spacing_mhz: float
+
+    def frequency(self, channel: int) -> float:
+        return round(self.base_mhz + (channel - self.first) * self.spacing_mhz, FREQUENCY_DECIMALS)
+
+
+class Channel(NamedTuple):
+    plan: str
+    number: int
+    frequency_mhz: float
+
+
+class ChannelPlan:
+    """Numbered channels of one allocation, described by arithmetic segments."""
+
+    def __init__(self, name: str, band: str, segments: List[ChannelSegment], description: str = ""):
+        self.name = name
+        self.band = band
+        self.segments = list(segments)
+        self.description = description
+
+    def __len__(self):
+        return sum(segment.last - segment.first + 1 for segment in self.segments)
+
+    def __repr__(self):
+        return f"ChannelPlan({self.name!r}, {len(self)} channels)"
+
+    def frequency(self, channel: int) -> float:
+        """Return the frequency of a channel number; raises KeyError for unknown channels."""
+        for segment in self.segments:
+            if segment.first <= channel <= segment.last:
+                return segment.frequency(channel)
+        raise KeyError(f"{self.name} has no channel {channel}")
+
+    def channel(self, frequency_mhz: float, tolerance_mhz: float = CHANNEL_TOLERANCE_MHZ) -> Optional[int]:
+        """
+        Return the channel number at a frequency, or None if no channel is within tolerance.
+
+        Pass tolerance_mhz=None to snap to the nearest channel of any segment
+        whose range the frequency falls within (up to half a spacing outside it).
+        """
+        best = None
+        for segment in self.segments:
+            offset = round((frequency_mhz - segment.base_mhz) / segment.spacing_mhz)
+            number = segment.first + offset
+            if not segment.first <= number <= segment.last:
+                continue
+            error = abs(frequency_mhz - segment.frequency(number))
+            limit = segment.spacing_mhz / 2 if tolerance_mhz is None else tolerance_mhz
+            if error <= limit and (best is None or error < best[0]):
+                best = (error, number)
+        return None if best is None else best[1]
+
+    def channels(self, start_mhz: Optional[float] = None, end_mhz: Optional[float] = None) -> Iterator[Channel]:
+        """
+        Lazily yield the plan's channels in channel-number order.
+
+        With start_mhz and/or end_mhz, only channels inside that closed range are
+        yielded; the first and last channel of each segment are computed
+        directly rather than found by scanning.
+        """
+        for segment in self.segments:
+            first, last = segment.first, segment.last
+            if start_mhz is not None:
+                first = max(first, segment.first + math.ceil(
+                    (start_mhz - segment.base_mhz) / segment.spacing_mhz - CHANNEL_TOLERANCE_MHZ))
+            if end_mhz is not None:
+                last = min(last, segment.first + math.floor(
+                    (end_mhz - segment.base_mhz) / segment.spacing_mhz + CHANNEL_TOLERANCE_MHZ))
+            for number in range(first, last + 1):
+                yield Channel(self.name, number, segment.frequency(number))
+
+
+CHANNEL_PLANS = {
+    "Marine VHF": ChannelPlan("Marine VHF", "Marine VHF", [
+        ChannelSegment(1, 28, 156.050, 0.050),
+        ChannelSegment(60, 88, 156.025, 0.050),
+    ], "International maritime VHF channels (ship transmit), 25 kHz interleaved"),
+    "Aviation VHF 25 kHz": ChannelPlan("Aviation VHF 25 kHz", "Aviation VHF", [
+        ChannelSegment(1, 760, 118.000, 0.025),
+    ], "Airband voice channels at 25 kHz spacing, numbered from 118.000 MHz"),
+    "Aviation VHF 8.33 kHz": ChannelPlan("Aviation VHF 8.33 kHz", "Aviation VHF", [
+        ChannelSegment(1, 2280, 118.000, 0.025 / 3),
+    ], "Airband voice channels at 8.33 kHz spacing, numbered from 118.000 MHz"),
+    "CB": ChannelPlan("CB", "CB Radio", [
+        ChannelSegment(1, 3, 26.965, 0.010),
+        ChannelSegment(4, 7, 27.005, 0.010),
+        ChannelSegment(8, 11, 27.055, 0.010),
+        ChannelSegment(12, 15, 27.105, 0.010),
+        ChannelSegment(16, 19, 27.155, 0.010),
+        ChannelSegment(20, 22, 27.205, 0.010),
+        ChannelSegment(23, 23, 27.255, 0.010),
+        ChannelSegment(24, 25, 27.235, 0.010),
+        ChannelSegment(26, 40, 27.265, 0.010),
+    ], "40 Citizens Band channels; RC frequencies between them are skipped"),
+    "FRS/GMRS": ChannelPlan("FRS/GMRS", "FRS/GMRS", [
+        ChannelSegment(1, 7, 462.5625, 0.025),
+        ChannelSegment(8, 14, 467.5625, 0.025),
+        ChannelSegment(15, 22, 462.550, 0.025),
+    ], "22 FRS/GMRS channels"),
+}
+
+
+def plans_for_band(band: str) -> List[ChannelPlan]:
+    """Return the channel plans that divide the allocation with this Band name."""
+    return [plan for plan in CHANNEL_PLANS.values() if plan.band == band]
+
+
+def resolve_channel(frequency_mhz: float, tolerance_mhz: float = CHANNEL_TOLERANCE_MHZ) -> List[Channel]:
+    """Return every known channel at a frequency, across all plans."""
+    matches = []
+    for plan in CHANNEL_PLANS.values():
+        number = plan.channel(frequency_mhz, tolerance_mhz)
+        if number is not None:
+            matches.append(Channel(plan.name, number, plan.frequency(number)))
+    return matches
+
+
+def create_channel_table(cursor, plans=None):
+    """Drop, recreate and fill the Channels table from the channel plans."""
+    if plans is None:
+        plans = CHANNEL_PLANS.values()
+
+    cursor.execute("DROP TABLE IF EXISTS Channels")
+    cursor.execute("""
+        CREATE TABLE Channels (
+            ID INTEGER PRIMARY KEY AUTOINCREMENT,
+            Plan TEXT NOT NULL,
+            Band TEXT NOT NULL,
+            Channel INTEGER NOT NULL,
+            Frequency_MHz REAL NOT NULL
+        )
+    """)
+    count = 0
+    for plan in plans:
+        cursor.executemany(
+            "INSERT INTO Channels (Plan, Band, Channel, Frequency_MHz) VALUES (?, ?, ?, ?)",
+            ((plan.name, plan.band, channel.number, channel.frequency_mhz) for channel in plan.channels()))
+        count += len(plan)
+    cursor.execute("CREATE INDEX idx_channel_frequency ON Channels (Frequency_MHz)")
+    cursor.execute("CREATE INDEX idx_channel_plan ON Channels (Plan, Channel)")
+    return count
+
+
+def main():
+    """List a plan's channels, or resolve frequencies to channels."""
+    parser = argparse.ArgumentParser(description="Expand channel plans and map frequencies to channels.")
+    parser.add_argument("frequencies", nargs="*", type=float, help="frequencies in MHz to resolve")
+    parser.add_argument("--plan", choices=list(CHANNEL_PLANS), help="list this plan's channels")
+    parser.add_argument("--nearest", action="store_true", help="snap to the nearest channel")
+    args = parser.parse_args()
+
+    if args.plan:
+        plan = CHANNEL_PLANS[args.plan]
+        print(f"{plan.name} ({plan.description}): {len(plan)} channels")
+        for channel in plan.channels():
+            print(f"  {channel.number:>5}  {channel.frequency_mhz:.4f} MHz")
+    for frequency in args.frequencies:
+        matches = resolve_channel(frequency, None if args.nearest else CHANNEL_TOLERANCE_MHZ)
+        print(f"{frequency} MHz: " + (", ".join(f"{m.plan} ch {m.number} ({m.frequency_mhz} MHz)"
+                                                for m in matches) or "no channel"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Check that the data and lookup modules import quickly and without heavy libraries.
+
+Each module is imported in a fresh interpreter under `python -X importtime`.
+The check fails if a module pulls in pandas, openpyxl, sqlite3 or numpy at
+import time, or if its cumulative import time (best of several runs) exceeds
+its budget. Exits non-zero on failure so it can gate CI.
+"""
+
+import argparse
+import subprocess
+import sys
+
+# module: import-time budget in milliseconds
+IMPORT_BUDGETS_MS = {
+    "enhance_frequency_data": 40,
+    "frequency_index": 60,
+    "generate_databases": 100,
+}
+FORBIDDEN_MODULES = {"pandas", "openpyxl", "sqlite3", "_sqlite3", "numpy"}
+
+
+def measure_import(module):
+    """Import module in a fresh interpreter; return (cumulative ms, set of imported names)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    cumulative_us = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        imported.add(name.strip().split(".")[0])
+        if name.strip() == module and not name.startswith(" " * 2):
+            cumulative_us = int(cumulative)
+    if cumulative_us is None:
+        raise RuntimeError(f"no importtime entry for {module}")
+    return cumulative_us / 1000.0, imported
+
+
+def main():
+    """Measure every module and report pass/fail against its budget."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="imports per module; the fastest counts")
+    args = parser.parse_args()
+
+    failed = False
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        timings = []
+        heavy = set()
+        for _ in range(args.runs):
+            elapsed, imported = measure_import(module)
+            timings.append(elapsed)
+            heavy |= imported & FORBIDDEN_MODULES
+        best = min(timings)
+        ok = best <= budget and not heavy
+        failed |= not ok
+        note = f"  imports {', '.join(sorted(heavy))}" if heavy else ""
+        print(f"{'ok  ' if ok else 'FAIL'} {module:<24} {best:7.1f} ms (budget {budget} ms){note}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Check the chunked importers against the sample exports in fixtures/.
+
+Each fixture is imported in-process and across worker processes with tiny
+chunks, and loaded into a throwaway SQLite database. The imported and
+rejected line counts must match the expected values below, and all three
+runs must produce the same rows. Exits non-zero on failure so it can gate CI.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+from frequency_importers import ItuImporter, UlsImporter, import_to_sqlite, iter_import
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# fixture: (importer factory, imported rows, rejected lines)
+EXPECTED = {
+    # one HD record skipped, one FR record with a non-numeric frequency rejected
+    "uls_fr_sample.dat": (UlsImporter, 8, 1),
+    # rejected: an inverted range and a THz row; the lower-case "mhz" row is accepted
+    "itu_allocations_sample.csv": (ItuImporter, 15, 2),
+}
+
+
+def check(condition, message, failures):
+    print(f"{'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def main():
+    """Import every fixture and report pass/fail against the expected counts."""
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        for fixture, (make_importer, rows, rejected) in EXPECTED.items():
+            filename = os.path.join(FIXTURES, fixture)
+
+            stats = {}
+            sequential = list(iter_import(filename, make_importer(), stats=stats))
+            check(stats["rows"] == len(sequential) == rows and stats["rejected"] == rejected,
+                  f"{fixture}: {stats['rows']} imported, {stats['rejected']} rejected "
+                  f"(expected {rows}, {rejected})", failures)
+
+            parallel = list(iter_import(filename, make_importer(), workers=2, chunk_bytes=64))
+            check(parallel == sequential, f"{fixture}: parallel import matches sequential", failures)
+
+            database = os.path.join(directory, fixture + ".db")
+            stats = import_to_sqlite(filename, make_importer(), database, chunk_bytes=64)
+            conn = sqlite3.connect(database)
+            loaded = conn.execute("SELECT COUNT(*) FROM Frequencies").fetchone()[0]
+            conn.close()
+            check(loaded == rows and stats["chunks"] > 1,
+                  f"{fixture}: {loaded} rows bulk loaded in {stats['chunks']} chunks", failures)
+
+        empty = os.path.join(directory, "empty.csv")
+        open(empty, "w").close()
+        stats = {}
+        check(list(iter_import(empty, ItuImporter(), stats=stats)) == [] and stats["rejected"] == 0,
+              "empty allocation table imports no rows", failures)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Check that the query cache never serves results across dataset versions.
+
+Runs QueryCache against a throwaway shared SQLite backend: a result cached
+under one version must be a hit in a second process-like cache of the same
+version, and a miss (recomputed) once the version changes, both in the
+in-process LRU and through the shared backend. Exits non-zero on failure so
+it can gate CI.
+"""
+
+import os
+import sys
+import tempfile
+
+from frequency_cache import QueryCache, SQLiteCacheBackend
+
+
+def check(condition, message, failures):
+    print(f"{'ok  ' if condition else 'FAIL'} {message}")
+    if not condition:
+        failures.append(message)
+
+
+def main():
+    """Run the version-keying checks and report pass/fail."""
+    failures = []
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "cache.db")
+
+        writer = QueryCache(version="v1", backend=SQLiteCacheBackend(filename, "v1"))
+        writer.get(("point", 146.52), lambda: ["old"])
+        reader = QueryCache(version="v1", backend=SQLiteCacheBackend(filename, "v1"))
+        check(reader.get(("point", 146.52), lambda: ["recomputed"]) == ["old"],
+              "same version is shared through the backend", failures)
+
+        reader.set_version("v2")
+        check(reader.get(("point", 146.52), lambda: ["new"]) == ["new"],
+              "version bump does not return the old entry", failures)
+        check(reader.backend.version == "v2" and len(reader.backend) == 1,
+              "version bump drops old-version rows from the backend", failures)
+
+        fresh = QueryCache(version="v2", backend=SQLiteCacheBackend(filename, "v2"))
+        check(fresh.get(("point", 146.52), lambda: ["recomputed"]) == ["new"],
+              "new version is shared through the backend", failures)
+
+        for cache in (writer, reader, fresh):
+            cache.backend.close()
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
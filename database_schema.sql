@@ -1,9 +1,11 @@
 -- Frequency Database Schema for Microsoft Access
--- This script creates the table structure for the frequency database
+-- This script creates the table structure for the frequency database.
+-- The portable tables below match those in Frequencies.db; the R*Tree and
+-- FTS5 index tables at the end exist only in SQLite.
 
 CREATE TABLE Frequencies (
     ID AUTOINCREMENT PRIMARY KEY,
-    Band TEXT(20) NOT NULL,
+    Band TEXT(50) NOT NULL,
     Frequency_Start_MHz DOUBLE NOT NULL,
     Frequency_End_MHz DOUBLE NOT NULL,
     Wavelength TEXT(20),
@@ -18,6 +20,63 @@ CREATE INDEX idx_frequency_range ON Frequencies (Frequency_Start_MHz, Frequency_
 CREATE INDEX idx_service_type ON Frequencies (Service_Type);
 CREATE INDEX idx_band ON Frequencies (Band);
 
+-- One row per channel of the channelized allocations (Marine VHF, Aviation VHF, CB, FRS/GMRS)
+CREATE TABLE Channels (
+    ID AUTOINCREMENT PRIMARY KEY,
+    [Plan] TEXT(50) NOT NULL,
+    Band TEXT(50) NOT NULL,
+    Channel LONG NOT NULL,
+    Frequency_MHz DOUBLE NOT NULL
+);
+
+CREATE INDEX idx_channel_frequency ON Channels (Frequency_MHz);
+CREATE INDEX idx_channel_plan ON Channels ([Plan], Channel);
+
+-- Groups of overlapping allocations, and the allocations in each group
+CREATE TABLE Overlaps (
+    Group_ID LONG PRIMARY KEY,
+    Span_Start_MHz DOUBLE NOT NULL,
+    Span_End_MHz DOUBLE NOT NULL,
+    Overlap_Start_MHz DOUBLE NOT NULL,
+    Overlap_End_MHz DOUBLE NOT NULL,
+    Overlap_MHz DOUBLE NOT NULL,
+    Max_Depth LONG NOT NULL,
+    Members LONG NOT NULL
+);
+
+CREATE TABLE Overlap_Members (
+    Group_ID LONG NOT NULL REFERENCES Overlaps (Group_ID),
+    Frequency_ID LONG NOT NULL REFERENCES Frequencies (ID)
+);
+
+CREATE INDEX idx_overlap_member ON Overlap_Members (Frequency_ID);
+
+-- Merged spectrum covered by each Service_Type (NULL Service_Type for all services together), and the gaps
+CREATE TABLE Coverage (
+    Service_Type TEXT(30),
+    Start_MHz DOUBLE NOT NULL,
+    End_MHz DOUBLE NOT NULL
+);
+
+CREATE TABLE Coverage_Gaps (
+    Start_MHz DOUBLE NOT NULL,
+    End_MHz DOUBLE NOT NULL,
+    Width_MHz DOUBLE NOT NULL
+);
+
+CREATE INDEX idx_coverage_service ON Coverage (Service_Type, Start_MHz);
+
+-- SQLite-only tables (Access has no equivalent; do not run these there).
+-- Frequencies.db also carries an R*Tree index over each frequency range and an
+-- FTS5 full-text index over the text columns, kept in sync by triggers:
+--
+-- CREATE VIRTUAL TABLE Frequencies_RTree USING rtree(ID, Frequency_Start_MHz, Frequency_End_MHz);
+-- CREATE VIRTUAL TABLE Frequencies_FTS USING fts5(
+--     Band, Primary_Use, Service_Type, Notes,
+--     content='Frequencies', content_rowid='ID',
+--     prefix='2 3', tokenize='unicode61 remove_diacritics 2'
+-- );
+
 -- Sample queries for the database:
 
 -- Find all frequencies in a specific range
@@ -29,8 +88,11 @@ CREATE INDEX idx_band ON Frequencies (Band);
 -- Find all public safety frequencies
 -- SELECT * FROM Frequencies WHERE Service_Type = "Public Safety" ORDER BY Frequency_Start_MHz;
 
+-- Which channel is 156.8 MHz?
+-- SELECT [Plan], Channel FROM Channels WHERE Frequency_MHz = 156.8;
+
 -- Instructions for use:
 -- 1. Create a new Access database
 -- 2. Import the frequency_data.csv file
 -- 3. Run this SQL to create proper indexes and relationships
--- 4. The database will be ready for frequency lookups and analysis
\ No newline at end of file
+-- 4. The database will be ready for frequency lookups and analysis
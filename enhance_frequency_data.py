@@ -5,9 +5,11 @@ This script creates comprehensive, verified frequency data and generates multipl
 """
 
 import csv
-import json
 from typing import List, Dict, Any
 
+# Column order of every tabular output (CSV, SQLite, Excel, Parquet)
+FREQUENCY_COLUMNS = ["Band", "Frequency_Start_MHz", "Frequency_End_MHz", "Wavelength", "Primary_Use", "Service_Type"]
+
 def get_enhanced_frequency_data() -> List[Dict[str, Any]]:
     """
     Returns comprehensive, verified frequency data from authoritative sources.
@@ -143,12 +145,74 @@ def get_enhanced_frequency_data() -> List[Dict[str, Any]]:
     
     return enhanced_data
 
+def get_cept_frequency_data() -> List[Dict[str, Any]]:
+    """
+    Returns frequency data for CEPT countries (Europe, ITU Region 1).
+
+    A hand-compiled summary of commonly cited European allocations, not
+    checked entry by entry against a published table; national assignments
+    within these ranges differ from country to country.
+    """
+
+    cept_data = [
+        # Amateur Radio
+        {"Band": "2200m", "Frequency_Start_MHz": 0.1357, "Frequency_End_MHz": 0.1378, "Wavelength": "2200 meters", "Primary_Use": "LF experimental", "Service_Type": "Amateur Radio"},
+        {"Band": "160m", "Frequency_Start_MHz": 1.81, "Frequency_End_MHz": 2.0, "Wavelength": "160 meters", "Primary_Use": "Long distance communication", "Service_Type": "Amateur Radio"},
+        {"Band": "80m", "Frequency_Start_MHz": 3.5, "Frequency_End_MHz": 3.8, "Wavelength": "80 meters", "Primary_Use": "Regional/DX communication", "Service_Type": "Amateur Radio"},
+        {"Band": "40m", "Frequency_Start_MHz": 7.0, "Frequency_End_MHz": 7.2, "Wavelength": "40 meters", "Primary_Use": "Reliable regional/DX", "Service_Type": "Amateur Radio"},
+        {"Band": "20m", "Frequency_Start_MHz": 14.0, "Frequency_End_MHz": 14.35, "Wavelength": "20 meters", "Primary_Use": "Premier DX band", "Service_Type": "Amateur Radio"},
+        {"Band": "2m", "Frequency_Start_MHz": 144.0, "Frequency_End_MHz": 146.0, "Wavelength": "2 meters", "Primary_Use": "Local/repeater communication", "Service_Type": "Amateur Radio"},
+        {"Band": "70cm", "Frequency_Start_MHz": 430.0, "Frequency_End_MHz": 440.0, "Wavelength": "70 centimeters", "Primary_Use": "Local/repeater/satellites", "Service_Type": "Amateur Radio"},
+        {"Band": "23cm", "Frequency_Start_MHz": 1240.0, "Frequency_End_MHz": 1300.0, "Wavelength": "23 centimeters", "Primary_Use": "ATV digital microwave", "Service_Type": "Amateur Radio"},
+
+        # Broadcast
+        {"Band": "LW Radio", "Frequency_Start_MHz": 0.1485, "Frequency_End_MHz": 0.2835, "Wavelength": "N/A", "Primary_Use": "Long wave AM broadcasting", "Service_Type": "Broadcast"},
+        {"Band": "MW Radio", "Frequency_Start_MHz": 0.5265, "Frequency_End_MHz": 1.6065, "Wavelength": "N/A", "Primary_Use": "Medium wave AM broadcasting", "Service_Type": "Broadcast"},
+        {"Band": "FM Radio", "Frequency_Start_MHz": 87.5, "Frequency_End_MHz": 108.0, "Wavelength": "N/A", "Primary_Use": "Commercial FM broadcasting", "Service_Type": "Broadcast"},
+        {"Band": "DAB Band III", "Frequency_Start_MHz": 174.0, "Frequency_End_MHz": 240.0, "Wavelength": "VHF High", "Primary_Use": "Digital audio broadcasting", "Service_Type": "Broadcast"},
+
+        # Public Safety
+        {"Band": "TETRA", "Frequency_Start_MHz": 380.0, "Frequency_End_MHz": 400.0, "Wavelength": "N/A", "Primary_Use": "Emergency services TETRA", "Service_Type": "Public Safety"},
+
+        # Aviation and Marine
+        {"Band": "Aviation VHF", "Frequency_Start_MHz": 118.0, "Frequency_End_MHz": 137.0, "Wavelength": "N/A", "Primary_Use": "Air traffic control", "Service_Type": "Aviation"},
+        {"Band": "Aircraft Emergency", "Frequency_Start_MHz": 121.5, "Frequency_End_MHz": 121.5, "Wavelength": "N/A", "Primary_Use": "Emergency locator beacons", "Service_Type": "Aviation"},
+        {"Band": "Marine VHF", "Frequency_Start_MHz": 156.0, "Frequency_End_MHz": 162.0, "Wavelength": "N/A", "Primary_Use": "Maritime mobile", "Service_Type": "Marine"},
+        {"Band": "Marine Emergency", "Frequency_Start_MHz": 156.8, "Frequency_End_MHz": 156.8, "Wavelength": "N/A", "Primary_Use": "International distress/calling", "Service_Type": "Marine"},
+
+        # Licence-exempt radio
+        {"Band": "CB Radio", "Frequency_Start_MHz": 26.965, "Frequency_End_MHz": 27.405, "Wavelength": "11 meters", "Primary_Use": "Citizens Band radio", "Service_Type": "Citizens Band"},
+        {"Band": "PMR446", "Frequency_Start_MHz": 446.0, "Frequency_End_MHz": 446.2, "Wavelength": "N/A", "Primary_Use": "Licence-free walkie-talkies", "Service_Type": "Personal Radio"},
+        {"Band": "LPD433", "Frequency_Start_MHz": 433.05, "Frequency_End_MHz": 434.79, "Wavelength": "N/A", "Primary_Use": "Low power devices", "Service_Type": "ISM"},
+        {"Band": "SRD 868MHz", "Frequency_Start_MHz": 863.0, "Frequency_End_MHz": 870.0, "Wavelength": "N/A", "Primary_Use": "Short range devices/LoRa", "Service_Type": "ISM"},
+        {"Band": "ISM 2.4GHz", "Frequency_Start_MHz": 2400.0, "Frequency_End_MHz": 2483.5, "Wavelength": "N/A", "Primary_Use": "Industrial/Scientific/Medical", "Service_Type": "ISM"},
+        {"Band": "WiFi 2.4GHz", "Frequency_Start_MHz": 2400.0, "Frequency_End_MHz": 2483.5, "Wavelength": "N/A", "Primary_Use": "802.11b/g/n/ax", "Service_Type": "WiFi"},
+        {"Band": "WiFi 5GHz Band A", "Frequency_Start_MHz": 5150.0, "Frequency_End_MHz": 5350.0, "Wavelength": "N/A", "Primary_Use": "802.11a/n/ac/ax indoor", "Service_Type": "WiFi"},
+        {"Band": "WiFi 5GHz Band B", "Frequency_Start_MHz": 5470.0, "Frequency_End_MHz": 5725.0, "Wavelength": "N/A", "Primary_Use": "802.11a/n/ac/ax with DFS", "Service_Type": "WiFi"},
+
+        # Cellular
+        {"Band": "GSM 900", "Frequency_Start_MHz": 880.0, "Frequency_End_MHz": 960.0, "Wavelength": "N/A", "Primary_Use": "E-GSM 900 / LTE Band 8", "Service_Type": "Cellular"},
+        {"Band": "GSM 1800", "Frequency_Start_MHz": 1710.0, "Frequency_End_MHz": 1880.0, "Wavelength": "N/A", "Primary_Use": "DCS 1800 / LTE Band 3", "Service_Type": "Cellular"},
+        {"Band": "5G n78", "Frequency_Start_MHz": 3400.0, "Frequency_End_MHz": 3800.0, "Wavelength": "N/A", "Primary_Use": "5G mid-band", "Service_Type": "Cellular"},
+
+        # GNSS
+        {"Band": "Galileo E1", "Frequency_Start_MHz": 1575.42, "Frequency_End_MHz": 1575.42, "Wavelength": "N/A", "Primary_Use": "Galileo Open Service", "Service_Type": "GPS"},
+        {"Band": "GPS L1", "Frequency_Start_MHz": 1575.42, "Frequency_End_MHz": 1575.42, "Wavelength": "N/A", "Primary_Use": "GPS C/A code", "Service_Type": "GPS"},
+
+        # Time Standards
+        {"Band": "MSF 60kHz", "Frequency_Start_MHz": 0.06, "Frequency_End_MHz": 0.06, "Wavelength": "N/A", "Primary_Use": "Time signals UK", "Service_Type": "Time Standard"},
+        {"Band": "DCF77 77.5kHz", "Frequency_Start_MHz": 0.0775, "Frequency_End_MHz": 0.0775, "Wavelength": "N/A", "Primary_Use": "Time signals Germany", "Service_Type": "Time Standard"},
+
+        # Emergency
+        {"Band": "EPIRB 406MHz", "Frequency_Start_MHz": 406.0, "Frequency_End_MHz": 406.1, "Wavelength": "N/A", "Primary_Use": "Emergency position beacon", "Service_Type": "Emergency"},
+    ]
+
+    return cept_data
+
 def write_csv_file(data: List[Dict[str, Any]], filename: str):
     """Write frequency data to CSV file."""
-    fieldnames = ["Band", "Frequency_Start_MHz", "Frequency_End_MHz", "Wavelength", "Primary_Use", "Service_Type"]
-    
     with open(filename, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=FREQUENCY_COLUMNS)
         writer.writeheader()
         for row in data:
             writer.writerow(row)
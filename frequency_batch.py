@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Vectorized batch classification of frequency arrays with NumPy.
+Classifies whole SDR sweeps in one pass instead of one lookup per frequency,
+and finds the nearest allocations for frequencies that fall in no band.
+"""
+
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from frequency_index import FrequencyIndex
+
+
+class BatchClassification:
+    """
+    Array-backed result of classifying a batch of frequencies.
+
+    Matches use a CSR layout: the allocations matching frequencies[i] are
+    indices[offsets[i]:offsets[i + 1]], given as positions in the source data
+    and ordered by start frequency. service_codes holds the Service_Type code of
+    each match, and service_types maps codes back to names. primary_index and
+    primary_service_code give the first match per frequency, or -1 when no
+    allocation contains it.
+    """
+
+    def __init__(self, frequencies, offsets, indices, service_codes,
+                 primary_index, primary_service_code, service_types):
+        self.frequencies = frequencies
+        self.offsets = offsets
+        self.indices = indices
+        self.service_codes = service_codes
+        self.primary_index = primary_index
+        self.primary_service_code = primary_service_code
+        self.service_types = service_types
+
+    def __len__(self):
+        return len(self.frequencies)
+
+    @property
+    def counts(self):
+        """Number of matching allocations per frequency."""
+        return np.diff(self.offsets)
+
+    def matches(self, i: int):
+        """Return the source data positions matching the i-th frequency."""
+        return self.indices[self.offsets[i]:self.offsets[i + 1]]
+
+
+class BatchClassifier:
+    """Precomputed sorted segment arrays for vectorized frequency classification."""
+
+    def __init__(self, data: Optional[List[Dict[str, Any]]] = None,
+                 index: Optional[FrequencyIndex] = None):
+        if index is None:
+            index = FrequencyIndex(data)
+        self.index = index
+
+        boundaries, slot_offsets, slot_positions = index.segments()
+        source_positions = np.asarray(index.source_positions, dtype=np.int64)
+
+        self.service_types = sorted({r['Service_Type'] for r in index.records})
+        code_of = {name: code for code, name in enumerate(self.service_types)}
+        # Service_Type code per source data position
+        self.record_service_codes = np.empty(len(index), dtype=np.int16)
+        self.record_service_codes[source_positions] = [code_of[r['Service_Type']] for r in index.records]
+
+        self.boundaries = np.asarray(boundaries, dtype=np.float64)
+        self.slot_offsets = np.asarray(slot_offsets, dtype=np.int64)
+        self.slot_counts = np.diff(self.slot_offsets)
+        self.slot_indices = source_positions[np.asarray(slot_positions, dtype=np.int64)]
+
+        # Sorted endpoint arrays for nearest-neighbour queries
+        self.starts = np.asarray(index.starts, dtype=np.float64)
+        self.start_indices = source_positions
+        end_order = np.argsort(np.asarray(index.ends, dtype=np.float64), kind='stable')
+        self.ends_sorted = np.asarray(index.ends, dtype=np.float64)[end_order]
+        self.end_indices = source_positions[end_order]
+        self._service_classifiers = {}
+
+    def _slots(self, freqs):
+        """Elementary-segment slot of each frequency."""
+        m = len(self.boundaries)
+        if m == 0:
+            return np.zeros(len(freqs), dtype=np.int64)
+        # Slot 2i+1 is an exact hit on boundary i, slot 2i the gap below it
+        pos = np.searchsorted(self.boundaries, freqs, side='left')
+        exact = (pos < m) & (self.boundaries[np.minimum(pos, m - 1)] == freqs)
+        return 2 * pos + exact
+
+    def classify(self, frequencies) -> BatchClassification:
+        """Classify an array of frequencies in MHz against every allocation."""
+        freqs = np.asarray(frequencies, dtype=np.float64).ravel()
+        n = len(freqs)
+        slots = self._slots(freqs)
+
+        counts = self.slot_counts[slots]
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        total = int(offsets[-1])
+
+        # Expand each frequency's slot range into one flat gather index
+        slot_starts = self.slot_offsets[slots]
+        gather = np.repeat(slot_starts - offsets[:-1], counts) + np.arange(total, dtype=np.int64)
+        indices = self.slot_indices[gather]
+        service_codes = self.record_service_codes[indices]
+
+        has_match = counts > 0
+        primary_index = np.full(n, -1, dtype=np.int64)
+        primary_index[has_match] = self.slot_indices[slot_starts[has_match]]
+        primary_service_code = np.full(n, -1, dtype=np.int16)
+        primary_service_code[has_match] = self.record_service_codes[primary_index[has_match]]
+
+        return BatchClassification(freqs, offsets, indices, service_codes,
+                                   primary_index, primary_service_code, self.service_types)
+
+    def _service_classifier(self, service_type):
+        """A classifier over one service's allocations, with its map back to source positions."""
+        if service_type not in self._service_classifiers:
+            records = self.index.records
+            positions = [p for p, r in enumerate(records) if r['Service_Type'] == service_type]
+            classifier = BatchClassifier([records[p] for p in positions])
+            source = np.asarray(self.index.source_positions, dtype=np.int64)[np.asarray(positions, dtype=np.int64)]
+            self._service_classifiers[service_type] = (classifier, source)
+        return self._service_classifiers[service_type]
+
+    def nearest(self, frequencies, k: int = 1, service_type: Optional[str] = None):
+        """
+        Find the k allocations closest to each frequency, by distance to their nearest edge.
+
+        Returns (distances, indices), both shaped (len(frequencies), k): distances
+        in MHz ascending along each row and source data positions, ordered as
+        FrequencyIndex.nearest orders them. Rows with fewer than k candidates are
+        padded with inf and -1. With service_type, only that service is searched.
+        """
+        if service_type is not None:
+            classifier, source = self._service_classifier(service_type)
+            distances, indices = classifier.nearest(frequencies, k)
+            found = indices >= 0
+            indices[found] = source[indices[found]]
+            return distances, indices
+
+        freqs = np.asarray(frequencies, dtype=np.float64).ravel()
+        n = len(freqs)
+        if k < 1 or len(self.starts) == 0:
+            return np.full((n, max(k, 0)), np.inf), np.full((n, max(k, 0)), -1, dtype=np.int64)
+        steps = np.arange(k)
+        column = freqs[:, None]
+
+        # The k nearest are among the first k containing allocations, the k
+        # ends just below the frequency and the k starts just above it
+        slots = self._slots(freqs)
+        inside = steps < self.slot_counts[slots][:, None]
+        inside_indices = self.slot_indices[np.minimum(self.slot_offsets[slots][:, None] + steps,
+                                                      len(self.slot_indices) - 1)]
+
+        below = np.searchsorted(self.ends_sorted, freqs, side='left')[:, None] - 1 - steps
+        below_valid = below >= 0
+        below = np.maximum(below, 0)
+        above = np.searchsorted(self.starts, freqs, side='right')[:, None] + steps
+        above_valid = above < len(self.starts)
+        above = np.minimum(above, len(self.starts) - 1)
+
+        candidate_distances = np.concatenate([
+            np.where(inside, 0.0, np.inf),
+            np.where(below_valid, column - self.ends_sorted[below], np.inf),
+            np.where(above_valid, self.starts[above] - column, np.inf),
+        ], axis=1)
+        candidate_indices = np.concatenate([
+            inside_indices, self.end_indices[below], self.start_indices[above]], axis=1)
+
+        # Stable sort keeps containing, then below, then above on equal distance
+        order = np.argsort(candidate_distances, axis=1, kind='stable')[:, :k]
+        distances = np.take_along_axis(candidate_distances, order, axis=1)
+        indices = np.take_along_axis(candidate_indices, order, axis=1)
+        indices[np.isinf(distances)] = -1
+        return distances, indices
+
+
+def classify_frequencies(frequencies, data: Optional[List[Dict[str, Any]]] = None) -> BatchClassification:
+    """Classify an array of frequencies in MHz with a one-off BatchClassifier."""
+    return BatchClassifier(data).classify(frequencies)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Query result cache for frequency lookups.
+
+QueryCache is a bounded LRU with an optional time-to-live. Every key is
+prefixed with a version hash of the dataset it was computed from, so results
+computed from older data are never returned once the data is regenerated;
+they just age out. A SQLiteCacheBackend can sit behind the in-process LRU so
+that several processes (service workers, CLI runs) share computed results
+through one local database file.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from build_manifest import dataset_hash
+
+
+def dataset_version(data) -> str:
+    """Short version hash of a dataset, for prefixing cache keys."""
+    return dataset_hash(data)[:16]
+
+
+class SQLiteCacheBackend:
+    """
+    Shared cache store in a local SQLite file.
+
+    Values are stored as JSON, so only JSON-serializable results can be
+    shared. Rows are keyed by (version, query), and get() and set() use the
+    backend's current version unless given another. Entries of other dataset
+    versions are deleted when the backend opens or switches version, and the
+    table is trimmed back to maxsize rows, least recently used first, every
+    trim_every stores.
+    """
+
+    def __init__(self, filename: str, version: str, maxsize: int = 1_000_000,
+                 ttl: Optional[float] = None, trim_every: int = 1000):
+        import sqlite3
+
+        self.filename = filename
+        self.version = version
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.trim_every = trim_every
+        self._stores = 0
+        self.conn = sqlite3.connect(filename, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS Query_Cache (
+                Version TEXT NOT NULL,
+                Query TEXT NOT NULL,
+                Result TEXT NOT NULL,
+                Stored_At REAL NOT NULL,
+                Used_At REAL NOT NULL,
+                PRIMARY KEY (Version, Query)
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_query_cache_used ON Query_Cache(Used_At)")
+        self.set_version(version)
+
+    def set_version(self, version: str):
+        """Read and write rows of a new dataset version, dropping those of every other."""
+        self.version = version
+        self.conn.execute("DELETE FROM Query_Cache WHERE Version != ?", (version,))
+
+    @staticmethod
+    def _query(key):
+        return json.dumps(key, separators=(",", ":"))
+
+    def get(self, key, version: Optional[str] = None):
+        """Return (found, value) for key under version (default: the current version)."""
+        if version is None:
+            version = self.version
+        now = time.time()
+        query = self._query(key)
+        row = self.conn.execute("SELECT Result, Stored_At FROM Query_Cache WHERE Version = ? AND Query = ?",
+                                (version, query)).fetchone()
+        if row is None:
+            return False, None
+        if self.ttl is not None and now - row[1] > self.ttl:
+            self.conn.execute("DELETE FROM Query_Cache WHERE Version = ? AND Query = ?", (version, query))
+            return False, None
+        self.conn.execute("UPDATE Query_Cache SET Used_At = ? WHERE Version = ? AND Query = ?",
+                          (now, version, query))
+        return True, json.loads(row[0])
+
+    def set(self, key, value, version: Optional[str] = None):
+        if version is None:
+            version = self.version
+        now = time.time()
+        self.conn.execute("INSERT OR REPLACE INTO Query_Cache VALUES (?, ?, ?, ?, ?)",
+                          (version, self._query(key), json.dumps(value), now, now))
+        self._stores += 1
+        if self._stores % self.trim_every == 0:
+            self.trim()
+
+    def trim(self):
+        """Delete the least recently used rows beyond maxsize."""
+        self.conn.execute("""
+            DELETE FROM Query_Cache WHERE (Version, Query) IN (
+                SELECT Version, Query FROM Query_Cache ORDER BY Used_At DESC LIMIT -1 OFFSET ?
+            )
+        """, (self.maxsize,))
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM Query_Cache").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class QueryCache:
+    """
+    Bounded LRU/TTL cache keyed by dataset version plus query.
+
+    get(key, compute) returns the cached result for key under the current
+    version, computing and storing it on a miss. With a shared backend, local
+    misses are looked up there before computing. set_version() switches to a
+    new dataset; entries of the old version stop matching and are evicted as
+    the LRU fills. The cache does not watch the data itself: its owner must
+    call set_version() when the data changes, as LookupService.reload() does.
+    """
+
+    def __init__(self, maxsize: int = 65536, ttl: Optional[float] = None, version: str = "",
+                 backend: Optional[SQLiteCacheBackend] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version = version
+        self.backend = backend
+        self.clock = clock
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.shared_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def set_version(self, version: str):
+        """Key future lookups, here and in the shared backend, by a new dataset version."""
+        self.version = version
+        if self.backend is not None:
+            self.backend.set_version(version)
+
+    def _store(self, full_key, value):
+        self._entries[full_key] = (value, self.clock())
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        full_key = (self.version, key)
+        entry = self._entries.get(full_key)
+        if entry is not None:
+            value, stored = entry
+            if self.ttl is None or self.clock() - stored <= self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(full_key)
+                return value
+            del self._entries[full_key]
+            self.expirations += 1
+
+        if self.backend is not None:
+            found, value = self.backend.get(key, self.version)
+            if found:
+                self.shared_hits += 1
+                self._store(full_key, value)
+                return value
+
+        self.misses += 1
+        value = compute()
+        self._store(full_key, value)
+        if self.backend is not None:
+            self.backend.set(key, value, self.version)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.misses
+        stats = {
+            "version": self.version,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_s": self.ttl,
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": (self.hits + self.shared_hits) / lookups if lookups else 0.0,
+        }
+        if self.backend is not None:
+            stats["shared"] = {"filename": self.backend.filename, "size": len(self.backend)}
+        return stats
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Spectrum coverage and gap map built from merged allocation intervals.
+
+IntervalSet holds a normalized set of closed frequency ranges: sorted,
+disjoint and merged wherever they touch, plus a running total of their widths.
+Membership, "how much of [X, Y] is covered" and "first gap after X" are binary
+searches; listing the gaps in [X, Y] costs one search plus one step per gap.
+Union, intersection and difference are linear merges of two normalized sets.
+
+SpectrumCoverage merges the allocations once per Service_Type on first use and
+keeps the resulting sets, so repeated planning queries reuse them.
+"""
+
+import argparse
+from bisect import bisect_right
+from heapq import merge
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
+
+from enhance_frequency_data import get_enhanced_frequency_data
+
+
+class IntervalSet:
+    """An immutable, normalized set of closed frequency ranges in MHz."""
+
+    __slots__ = ("starts", "ends", "_prefix")
+
+    def __init__(self, ranges: Iterable[Tuple[float, float]] = ()):
+        starts, ends = [], []
+        for start, end in sorted(ranges):
+            if end < start:
+                raise ValueError(f"Range end {end} is below range start {start}")
+            if starts and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._set(starts, ends)
+
+    def _set(self, starts, ends):
+        self.starts = starts
+        self.ends = ends
+        # _prefix[i] is the total width of the first i ranges
+        self._prefix = [0.0, *accumulate(e - s for s, e in zip(starts, ends))]
+
+    @classmethod
+    def _normalized(cls, starts, ends):
+        instance = cls.__new__(cls)
+        instance._set(starts, ends)
+        return instance
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        return zip(self.starts, self.ends)
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)!r})"
+
+    def __contains__(self, frequency_mhz: float) -> bool:
+        i = bisect_right(self.starts, frequency_mhz) - 1
+        return i >= 0 and frequency_mhz <= self.ends[i]
+
+    @property
+    def total_mhz(self) -> float:
+        return self._prefix[-1]
+
+    def _covered_below(self, frequency_mhz):
+        """Width of the set at or below a frequency."""
+        i = bisect_right(self.starts, frequency_mhz)
+        if i == 0:
+            return 0.0
+        return self._prefix[i - 1] + min(frequency_mhz, self.ends[i - 1]) - self.starts[i - 1]
+
+    def covered(self, start_mhz: float, end_mhz: float) -> float:
+        """Width in MHz of the part of [start_mhz, end_mhz] inside the set."""
+        if end_mhz < start_mhz:
+            raise ValueError("Range end must not be below range start")
+        return self._covered_below(end_mhz) - self._covered_below(start_mhz)
+
+    def fraction_covered(self, start_mhz: float, end_mhz: float) -> float:
+        """Share of [start_mhz, end_mhz] inside the set; a point range counts as 0 or 1."""
+        if end_mhz == start_mhz:
+            return float(start_mhz in self)
+        return self.covered(start_mhz, end_mhz) / (end_mhz - start_mhz)
+
+    def gaps(self, start_mhz: float, end_mhz: float) -> List[Tuple[float, float]]:
+        """Return the uncovered ranges of positive width within [start_mhz, end_mhz]."""
+        if end_mhz < start_mhz:
+            raise ValueError("Range end must not be below range start")
+        gaps = []
+        cursor = start_mhz
+        i = bisect_right(self.ends, start_mhz)
+        while i < len(self.starts) and self.starts[i] < end_mhz:
+            if self.starts[i] > cursor:
+                gaps.append((cursor, self.starts[i]))
+            cursor = max(cursor, self.ends[i])
+            i += 1
+        if cursor < end_mhz:
+            gaps.append((cursor, end_mhz))
+        return gaps
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        starts, ends = [], []
+        for start, end in merge(self, other):
+            if starts and start <= ends[-1]:
+                if end > ends[-1]:
+                    ends[-1] = end
+            else:
+                starts.append(start)
+                ends.append(end)
+        return IntervalSet._normalized(starts, ends)
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        starts, ends = [], []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._normalized(starts, ends)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        """
+        Ranges of self not covered by other.
+
+        Results stay closed, so a remaining piece keeps the boundary frequency
+        it shares with other; widths are exact. Points of self inside other
+        are removed, while points of other never split a range of self.
+        """
+        starts, ends = [], []
+        j = 0
+        for start, end in self:
+            while j < len(other.starts) and other.ends[j] < start:
+                j += 1
+            k = j
+            cursor = start
+            removed = False
+            while k < len(other.starts) and other.starts[k] <= end:
+                if other.ends[k] > other.starts[k] or start == end:
+                    if other.starts[k] > cursor:
+                        starts.append(cursor)
+                        ends.append(other.starts[k])
+                    cursor = max(cursor, other.ends[k])
+                    removed = True
+                k += 1
+            if not removed:
+                starts.append(start)
+                ends.append(end)
+            elif cursor < end:
+                starts.append(cursor)
+                ends.append(end)
+        return IntervalSet._normalized(starts, ends)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+class SpectrumCoverage:
+    """Per-service coverage of the allocations, merged lazily and cached."""
+
+    def __init__(self, data: Optional[List[Dict[str, Any]]] = None):
+        if data is None:
+            data = get_enhanced_frequency_data()
+        self._ranges = {}
+        for entry in data:
+            self._ranges.setdefault(entry['Service_Type'], []).append(
+                (entry['Frequency_Start_MHz'], entry['Frequency_End_MHz']))
+        self._cache = {}
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[Tuple[str, float, float]]) -> "SpectrumCoverage":
+        """Build from (Service_Type, start_mhz, end_mhz) tuples, e.g. a database cursor."""
+        instance = cls([])
+        for service_type, start, end in ranges:
+            instance._ranges.setdefault(service_type, []).append((start, end))
+        return instance
+
+    def services(self) -> List[str]:
+        return sorted(self._ranges)
+
+    def allocation_count(self, service_type: str) -> int:
+        return len(self._ranges[service_type])
+
+    def service(self, service_type: str) -> IntervalSet:
+        """The merged ranges of one Service_Type; raises KeyError for unknown services."""
+        if service_type not in self._cache:
+            self._cache[service_type] = IntervalSet(self._ranges[service_type])
+        return self._cache[service_type]
+
+    def all(self) -> IntervalSet:
+        """The merged ranges of every allocation, of any service."""
+        if None not in self._cache:
+            combined = IntervalSet()
+            for service_type in self._ranges:
+                combined = combined | self.service(service_type)
+            self._cache[None] = combined
+        return self._cache[None]
+
+    def coverage(self, service_type: Optional[str] = None) -> IntervalSet:
+        return self.all() if service_type is None else self.service(service_type)
+
+    @property
+    def extent(self) -> Tuple[float, float]:
+        """The span from the lowest allocated frequency to the highest."""
+        combined = self.all()
+        return combined.starts[0], combined.ends[-1]
+
+    def gaps(self, start_mhz: Optional[float] = None, end_mhz: Optional[float] = None,
+             service_type: Optional[str] = None) -> List[Tuple[float, float]]:
+        """Free ranges in [start_mhz, end_mhz] (default: the full extent) for a service or for all."""
+        low, high = self.extent
+        return self.coverage(service_type).gaps(low if start_mhz is None else start_mhz,
+                                                high if end_mhz is None else end_mhz)
+
+    def fraction_covered(self, start_mhz: Optional[float] = None, end_mhz: Optional[float] = None,
+                         service_type: Optional[str] = None) -> float:
+        low, high = self.extent
+        return self.coverage(service_type).fraction_covered(low if start_mhz is None else start_mhz,
+                                                            high if end_mhz is None else end_mhz)
+
+
+def format_mhz(value):
+    return f"{value:g}"
+
+
+def render_coverage_section(out, coverage: SpectrumCoverage, service_order: List[str]):
+    """Append the README's coverage and gap tables."""
+    low, high = coverage.extent
+    ordered = [s for s in service_order if s in coverage.services()]
+    ordered += [s for s in coverage.services() if s not in service_order]
+
+    out.append("\n## Spectrum Coverage\n\n")
+    out.append(f"Merged coverage of the allocations between {format_mhz(low)} MHz and "
+               f"{format_mhz(high)} MHz. Overlapping and adjacent allocations are merged "
+               f"before measuring, so each service's covered width counts every frequency once.\n\n")
+    out.append("| Service Type | Allocations | Merged Ranges | Covered (MHz) | Share of Spectrum |\n")
+    out.append("|--------------|-------------|---------------|---------------|-------------------|\n")
+    for service_type in ordered:
+        merged = coverage.service(service_type)
+        out.append(f"| {service_type} | {coverage.allocation_count(service_type)} | {len(merged)} | "
+                   f"{merged.total_mhz:,.4f} | {merged.fraction_covered(low, high):.3%} |\n")
+    combined = coverage.all()
+    out.append(f"| **All services** | {sum(map(coverage.allocation_count, ordered))} | {len(combined)} | "
+               f"{combined.total_mhz:,.4f} | {combined.fraction_covered(low, high):.3%} |\n")
+
+    gaps = coverage.gaps()
+    out.append("\n### Unallocated Gaps\n\n")
+    out.append(f"{len(gaps)} ranges between {format_mhz(low)} MHz and {format_mhz(high)} MHz "
+               f"have no allocation in this database:\n\n")
+    out.append("| From (MHz) | To (MHz) | Width (MHz) |\n")
+    out.append("|------------|----------|-------------|\n")
+    for start, end in gaps:
+        out.append(f"| {format_mhz(start)} | {format_mhz(end)} | {format_mhz(round(end - start, 6))} |\n")
+
+
+def create_coverage_tables(cursor):
+    """
+    Drop, recreate and fill the Coverage and Coverage_Gaps tables.
+
+    Coverage holds each service's merged ranges, plus the merged ranges of all
+    services with a NULL Service_Type; Coverage_Gaps holds the unallocated
+    ranges across the full extent. Both are computed from the loaded
+    Frequencies rows.
+    """
+    cursor.execute("DROP TABLE IF EXISTS Coverage")
+    cursor.execute("DROP TABLE IF EXISTS Coverage_Gaps")
+    cursor.execute("""
+        CREATE TABLE Coverage (
+            Service_Type TEXT,
+            Start_MHz REAL NOT NULL,
+            End_MHz REAL NOT NULL
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE Coverage_Gaps (
+            Start_MHz REAL NOT NULL,
+            End_MHz REAL NOT NULL,
+            Width_MHz REAL NOT NULL
+        )
+    """)
+
+    coverage = SpectrumCoverage.from_ranges(
+        cursor.execute("SELECT Service_Type, Frequency_Start_MHz, Frequency_End_MHz FROM Frequencies"))
+    if not coverage.services():
+        return 0
+    for service_type in [*coverage.services(), None]:
+        cursor.executemany("INSERT INTO Coverage (Service_Type, Start_MHz, End_MHz) VALUES (?, ?, ?)",
+                           ((service_type, start, end) for start, end in coverage.coverage(service_type)))
+    cursor.executemany("INSERT INTO Coverage_Gaps (Start_MHz, End_MHz, Width_MHz) VALUES (?, ?, ?)",
+                       ((start, end, end - start) for start, end in coverage.gaps()))
+    cursor.execute("CREATE INDEX idx_coverage_service ON Coverage (Service_Type, Start_MHz)")
+    return len(coverage.all())
+
+
+def main():
+    """Report gaps and coverage for a frequency range."""
+    parser = argparse.ArgumentParser(description="Query spectrum coverage and unallocated gaps.")
+    parser.add_argument("start", type=float, nargs="?", help="range start in MHz (default: lowest allocation)")
+    parser.add_argument("end", type=float, nargs="?", help="range end in MHz (default: highest allocation)")
+    parser.add_argument("--service", help="restrict to one Service_Type")
+    args = parser.parse_args()
+
+    coverage = SpectrumCoverage()
+    low, high = coverage.extent
+    start = low if args.start is None else args.start
+    end = high if args.end is None else args.end
+    scope = args.service or "all services"
+    print(f"{format_mhz(start)}-{format_mhz(end)} MHz, {scope}: "
+          f"{coverage.fraction_covered(start, end, args.service):.3%} covered")
+    for gap_start, gap_end in coverage.gaps(start, end, args.service):
+        print(f"  free {format_mhz(gap_start)}-{format_mhz(gap_end)} MHz")
+
+
+if __name__ == "__main__":
+    main()
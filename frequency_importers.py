@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Chunked streaming importers for external allocation tables.
+
+An importer turns raw lines of a regulator export into rows of the existing
+schema (FREQUENCY_COLUMNS), with frequencies normalized to MHz. The file is
+read in chunks of roughly CHUNK_BYTES, always cut at line boundaries, and the
+chunks are parsed in this process or across worker processes while rows flow
+on to the SQLite bulk loader or a CSV file. At no point is the whole file, or
+the whole set of parsed rows, held in memory.
+
+Formats:
+    uls   FCC ULS pipe-delimited FR (frequency) records, e.g. FR.dat
+    itu   ITU-style allocation table CSV: Lower, Upper, Unit, Service[, Region]
+
+Examples:
+    python frequency_importers.py uls fixtures/uls_fr_sample.dat --sqlite uls.db
+    python frequency_importers.py itu fixtures/itu_allocations_sample.csv --csv itu.csv
+    python frequency_importers.py uls FR.dat --sqlite uls.db --workers 4
+"""
+
+import argparse
+import csv
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from enhance_frequency_data import FREQUENCY_COLUMNS
+from frequency_streams import BUFFER_SIZE, UNIT_EXPONENTS, ordered_parallel_map, parse_frequency
+from generate_databases import bulk_load_frequencies
+
+CHUNK_BYTES = 4 << 20
+# Unit names as written in exports, matched case-insensitively
+UNITS = {unit.lower(): unit for unit in UNIT_EXPONENTS}
+
+
+class Importer:
+    """
+    Base class for an export format.
+
+    Subclasses implement parse_line(), returning a row tuple in
+    FREQUENCY_COLUMNS order or None for records they skip. Importers are
+    pickled to worker processes with each chunk, so they only hold settings.
+    """
+
+    encoding = "utf-8"
+
+    def read_header(self, stream):
+        """Consume any header lines before the records start."""
+
+    def parse_line(self, line: str) -> Optional[Tuple]:
+        raise NotImplementedError
+
+    def parse_lines(self, lines: List[str]) -> Tuple[List[Tuple], int]:
+        """Parse a chunk of lines; returns (rows, number of rejected lines)."""
+        rows = []
+        rejected = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                row = self.parse_line(line)
+            except (IndexError, ValueError):
+                row = None
+                rejected += 1
+            if row is not None:
+                rows.append(row)
+        return rows, rejected
+
+
+class UlsImporter(Importer):
+    """
+    FCC ULS FR records: one assigned frequency per line, '|' delimited.
+
+    Field 4 is the call sign, 8 the station class, 10 the assigned frequency
+    and 11 the upper band edge (empty for a single frequency), both in MHz.
+    Records of other types in the same dump are skipped.
+    """
+
+    encoding = "latin-1"
+    STATION_CLASSES = {
+        "FB": "Base station",
+        "FB2": "Mobile relay station",
+        "FB4": "Community repeater",
+        "FB6": "Private carrier base",
+        "FB8": "Centralized trunked base",
+        "FX1": "Control station",
+        "FXO": "Operational fixed station",
+        "MO": "Mobile station",
+        "MO3": "Mobile control station",
+    }
+
+    def __init__(self, service_type: str = "Licensed Station"):
+        self.service_type = service_type
+
+    def parse_line(self, line):
+        fields = line.rstrip("\r\n").split("|")
+        if fields[0] != "FR":
+            return None
+        start = parse_frequency(fields[10])
+        if start is None:
+            raise ValueError(f"bad assigned frequency {fields[10]!r}")
+        end = parse_frequency(fields[11]) if fields[11].strip() else start
+        if end is None or end < start:
+            raise ValueError(f"bad upper band edge {fields[11]!r}")
+        station_class = fields[8].strip()
+        primary_use = self.STATION_CLASSES.get(station_class, f"Station class {station_class or 'unknown'}")
+        return (fields[4].strip(), start, end, "N/A", primary_use, self.service_type)
+
+
+class ItuImporter(Importer):
+    """
+    Allocation table CSV with Lower, Upper, Unit and Service columns (and optionally Region).
+
+    Column names and units are matched case-insensitively; rows with an
+    unknown unit are rejected. When the file has no Unit column, default_unit
+    applies. An empty file imports no rows. As in the Radio Regulations,
+    services written in upper case are primary and others secondary.
+    Quoted fields must not span lines, since chunks are cut at line ends.
+    """
+
+    SERVICE_TYPES = {
+        "AMATEUR": "Amateur Radio",
+        "AMATEUR-SATELLITE": "Amateur Radio",
+        "BROADCASTING": "Broadcast",
+        "BROADCASTING-SATELLITE": "Satellite",
+        "AERONAUTICAL MOBILE": "Aviation",
+        "AERONAUTICAL MOBILE (R)": "Aviation",
+        "AERONAUTICAL RADIONAVIGATION": "Aviation",
+        "MARITIME MOBILE": "Marine",
+        "MOBILE": "Cellular",
+        "RADIONAVIGATION-SATELLITE": "GPS",
+        "FIXED-SATELLITE": "Satellite",
+        "MOBILE-SATELLITE": "Satellite",
+        "EARTH EXPLORATION-SATELLITE": "Satellite",
+        "METEOROLOGICAL-SATELLITE": "Satellite",
+        "STANDARD FREQUENCY AND TIME SIGNAL": "Time Standard",
+    }
+
+    def __init__(self, default_unit: str = "MHz"):
+        self.default_unit = default_unit
+        self.columns = None
+
+    def read_header(self, stream):
+        line = stream.readline()
+        if not line:
+            return  # empty file: there are no records to parse
+        header = [name.strip().lower() for name in next(csv.reader([line]))]
+        try:
+            self.columns = {name: header.index(name.lower()) for name in ("Lower", "Upper", "Service")}
+        except ValueError:
+            raise ValueError(f"allocation table header needs Lower, Upper and Service columns, got {header}")
+        for optional in ("Unit", "Region"):
+            if optional.lower() in header:
+                self.columns[optional] = header.index(optional.lower())
+
+    def parse_line(self, line):
+        fields = next(csv.reader([line]))
+        unit = fields[self.columns["Unit"]].strip() if "Unit" in self.columns else self.default_unit
+        if unit.lower() not in UNITS:
+            raise ValueError(f"unknown unit {unit!r}")
+        unit = UNITS[unit.lower()]
+        exponent = UNIT_EXPONENTS[unit]
+        start = parse_frequency(fields[self.columns["Lower"]], exponent)
+        end = parse_frequency(fields[self.columns["Upper"]], exponent)
+        if start is None or end is None or end < start:
+            raise ValueError(f"bad frequency range in {line!r}")
+
+        service = fields[self.columns["Service"]].strip()
+        status = "primary" if service.isupper() else "secondary"
+        service_type = self.SERVICE_TYPES.get(service.upper(), service.title())
+        band = f"{fields[self.columns['Lower']].strip()}-{fields[self.columns['Upper']].strip()} {unit}"
+        if "Region" in self.columns:
+            band += f" R{fields[self.columns['Region']].strip()}"
+        return (band, start, end, "N/A", f"{service.upper()} ({status})", service_type)
+
+
+IMPORTERS = {
+    "uls": UlsImporter,
+    "itu": ItuImporter,
+}
+
+
+def parse_chunk(task):
+    """Parse one chunk of lines in a worker process."""
+    importer, lines = task
+    return importer.parse_lines(lines)
+
+
+def read_chunks(stream, chunk_bytes=CHUNK_BYTES) -> Iterator[List[str]]:
+    """Yield lists of whole lines totalling about chunk_bytes each."""
+    while True:
+        lines = stream.readlines(chunk_bytes)
+        if not lines:
+            return
+        yield lines
+
+
+def iter_import(filename: str, importer: Importer, workers: int = 0, chunk_bytes: int = CHUNK_BYTES,
+                stats: Optional[Dict[str, Any]] = None) -> Iterator[Tuple]:
+    """
+    Yield the schema rows parsed from filename, in file order.
+
+    With workers > 0, chunks are parsed in that many processes with a bounded
+    number in flight. If a stats dict is given, it is updated with the number
+    of chunks, rows and rejected lines as the import proceeds.
+    """
+    if stats is None:
+        stats = {}
+    stats.update(chunks=0, rows=0, rejected=0)
+    with open(filename, "r", encoding=importer.encoding, newline="", buffering=BUFFER_SIZE) as stream:
+        importer.read_header(stream)
+        tasks = ((importer, lines) for lines in read_chunks(stream, chunk_bytes))
+        results = ordered_parallel_map(parse_chunk, tasks, workers) if workers > 0 else map(parse_chunk, tasks)
+        for rows, rejected in results:
+            stats["chunks"] += 1
+            stats["rows"] += len(rows)
+            stats["rejected"] += rejected
+            yield from rows
+
+
+def import_to_sqlite(filename: str, importer: Importer, database: str, workers: int = 0,
+                     chunk_bytes: int = CHUNK_BYTES) -> Dict[str, Any]:
+    """Stream an export into a fresh SQLite database through the bulk loader; returns the stats."""
+    stats = {}
+    bulk_load_frequencies(iter_import(filename, importer, workers, chunk_bytes, stats), database)
+    return stats
+
+
+def import_to_csv(filename: str, importer: Importer, output: str, workers: int = 0,
+                  chunk_bytes: int = CHUNK_BYTES) -> Dict[str, Any]:
+    """Stream an export into a CSV file laid out like frequency_data.csv; returns the stats."""
+    stats = {}
+    with open(output, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FREQUENCY_COLUMNS)
+        writer.writerows(iter_import(filename, importer, workers, chunk_bytes, stats))
+    return stats
+
+
+def main():
+    """Import a regulator export into SQLite and/or CSV."""
+    parser = argparse.ArgumentParser(description="Import large external allocation tables.")
+    parser.add_argument("format", choices=list(IMPORTERS))
+    parser.add_argument("input", help="export file to import")
+    parser.add_argument("--sqlite", help="bulk load the rows into this SQLite database")
+    parser.add_argument("--csv", help="write the rows to this CSV file")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="parse chunks in this many worker processes (default: in-process)")
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES, help="approximate bytes per chunk")
+    parser.add_argument("--unit", choices=sorted(UNIT_EXPONENTS), default="MHz",
+                        help="unit for ITU tables without a Unit column (default: MHz)")
+    parser.add_argument("--service-type", default="Licensed Station",
+                        help="Service_Type given to ULS records (default: Licensed Station)")
+    args = parser.parse_args()
+
+    if not args.sqlite and not args.csv:
+        parser.error("give --sqlite and/or --csv")
+    if args.format == "uls":
+        importer = UlsImporter(args.service_type)
+    else:
+        importer = ItuImporter(args.unit)
+
+    try:
+        if args.sqlite:
+            stats = import_to_sqlite(args.input, importer, args.sqlite, args.workers, args.chunk_bytes)
+            print(f"SQLite database '{args.sqlite}' created with {stats['rows']:,} imported entries "
+                  f"({stats['rejected']:,} rejected lines, {stats['chunks']} chunks)")
+        if args.csv:
+            stats = import_to_csv(args.input, importer, args.csv, args.workers, args.chunk_bytes)
+            print(f"CSV file '{args.csv}' created with {stats['rows']:,} imported entries "
+                  f"({stats['rejected']:,} rejected lines, {stats['chunks']} chunks)")
+    except ValueError as e:
+        parser.error(f"cannot import {args.input}: {e}")
+
+
+if __name__ == "__main__":
+    main()
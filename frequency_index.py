@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+In-memory interval index over the frequency allocation data.
+Answers point, overlap and containment queries without scanning every allocation.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Any, Optional, Tuple
+
+from enhance_frequency_data import get_enhanced_frequency_data
+
+
+def _finite(value):
+    """Return value as a float, rejecting NaN and infinities, which no comparison orders."""
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"Frequency must be finite, got {value}")
+    return value
+
+
+class _Node:
+    """Node of a centered interval tree."""
+
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center, by_start, by_end, left, right):
+        self.center = center
+        self.by_start = by_start  # (start, position) ascending
+        self.by_end = by_end  # (end, position) descending
+        self.left = left
+        self.right = right
+
+
+class FrequencyIndex:
+    """
+    Interval index over frequency allocations.
+
+    Allocations are treated as closed ranges [Frequency_Start_MHz, Frequency_End_MHz],
+    matching the ``BETWEEN`` semantics of the SQL examples, so point allocations
+    (start == end) are found by an exact point lookup. Every query returns all
+    matching allocations, ordered by start frequency. Queries with NaN or
+    infinite frequencies raise ValueError.
+    """
+
+    def __init__(self, data: Optional[List[Dict[str, Any]]] = None):
+        if data is None:
+            data = get_enhanced_frequency_data()
+
+        # Keep the allocations sorted by start so results come back in frequency order
+        order = sorted(range(len(data)),
+                       key=lambda i: (data[i]['Frequency_Start_MHz'], data[i]['Frequency_End_MHz']))
+        self.records = [data[i] for i in order]
+        self.source_positions = order
+        self.starts = [float(r['Frequency_Start_MHz']) for r in self.records]
+        self.ends = [float(r['Frequency_End_MHz']) for r in self.records]
+
+        for start, end, record in zip(self.starts, self.ends, self.records):
+            if end < start:
+                raise ValueError(f"Allocation '{record['Band']}' ends before it starts")
+
+        self._root = self._build(list(range(len(self.records))))
+        self._segments = None
+        self._endpoint_tables = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def segments(self):
+        """
+        Return the elementary-segment table for the allocations.
+
+        The sorted distinct endpoints b[0..m-1] split the axis into 2m+1 slots:
+        slot 2i+1 is the point b[i] and slot 2i is the open gap just below b[i].
+        Returns (boundaries, slot_offsets, slot_positions) where the positions of
+        the allocations covering slot s are slot_positions[slot_offsets[s]:slot_offsets[s+1]].
+        The table size grows with the total coverage depth across slots, so it suits
+        allocation plans rather than heavily nested data.
+        """
+        if self._segments is not None:
+            return self._segments
+
+        boundaries = sorted(set(self.starts) | set(self.ends))
+        boundary_index = {b: i for i, b in enumerate(boundaries)}
+        starts_at = [[] for _ in boundaries]
+        ends_at = [[] for _ in boundaries]
+        for p, (start, end) in enumerate(zip(self.starts, self.ends)):
+            starts_at[boundary_index[start]].append(p)
+            ends_at[boundary_index[end]].append(p)
+
+        slot_offsets = [0, 0]  # slot 0 (below every allocation) is always empty
+        slot_positions = []
+        active = set()
+        for i in range(len(boundaries)):
+            active.update(starts_at[i])
+            slot_positions.extend(sorted(active))
+            slot_offsets.append(len(slot_positions))
+            active.difference_update(ends_at[i])
+            slot_positions.extend(sorted(active))
+            slot_offsets.append(len(slot_positions))
+
+        self._segments = (boundaries, slot_offsets, slot_positions)
+        return self._segments
+
+    def _endpoint_table(self, service_type=None):
+        """
+        Return (starts, start_positions, ends, end_positions) for nearest-neighbour queries.
+
+        starts ascend with the record positions they came from; ends ascend
+        likewise. With a service_type only that service's allocations are
+        included. Tables are built on first use and cached.
+        """
+        table = self._endpoint_tables.get(service_type)
+        if table is None:
+            if service_type is None:
+                positions = list(range(len(self.records)))
+            else:
+                positions = [p for p, r in enumerate(self.records) if r['Service_Type'] == service_type]
+            by_end = sorted(positions, key=lambda p: self.ends[p])
+            table = ([self.starts[p] for p in positions], positions, [self.ends[p] for p in by_end], by_end)
+            self._endpoint_tables[service_type] = table
+        return table
+
+    def _build(self, positions):
+        """Build a centered interval tree over the given record positions."""
+        if not positions:
+            return None
+
+        endpoints = sorted([self.starts[p] for p in positions] + [self.ends[p] for p in positions])
+        center = endpoints[len(endpoints) // 2]
+
+        left, right, here = [], [], []
+        for p in positions:
+            if self.ends[p] < center:
+                left.append(p)
+            elif self.starts[p] > center:
+                right.append(p)
+            else:
+                here.append(p)
+
+        by_start = sorted((self.starts[p], p) for p in here)
+        by_end = sorted(((self.ends[p], p) for p in here), key=lambda item: -item[0])
+        return _Node(center, by_start, by_end, self._build(left), self._build(right))
+
+    def _stab(self, frequency):
+        """Return positions of all allocations containing the frequency."""
+        found = []
+        node = self._root
+        while node is not None:
+            if frequency < node.center:
+                for start, p in node.by_start:
+                    if start > frequency:
+                        break
+                    found.append(p)
+                node = node.left
+            elif frequency > node.center:
+                for end, p in node.by_end:
+                    if end < frequency:
+                        break
+                    found.append(p)
+                node = node.right
+            else:
+                found.extend(p for _, p in node.by_start)
+                break
+        found.sort()
+        return found
+
+    def _overlap_positions(self, start_mhz, end_mhz):
+        """Return positions of all allocations intersecting [start_mhz, end_mhz]."""
+        if end_mhz < start_mhz:
+            raise ValueError("Range end must not be below range start")
+        # Allocations that contain the lower edge, plus those that begin inside the range
+        positions = self._stab(start_mhz)
+        first = bisect_right(self.starts, start_mhz)
+        last = bisect_right(self.starts, end_mhz)
+        positions.extend(range(first, last))
+        return positions
+
+    def lookup(self, frequency_mhz: float) -> List[Dict[str, Any]]:
+        """Find every allocation that contains the given frequency."""
+        return [self.records[p] for p in self._stab(_finite(frequency_mhz))]
+
+    def overlapping(self, start_mhz: float, end_mhz: float) -> List[Dict[str, Any]]:
+        """Find every allocation that intersects the range [start_mhz, end_mhz]."""
+        return [self.records[p] for p in self._overlap_positions(_finite(start_mhz), _finite(end_mhz))]
+
+    def containing(self, start_mhz: float, end_mhz: float) -> List[Dict[str, Any]]:
+        """Find every allocation that fully contains the range [start_mhz, end_mhz]."""
+        start_mhz, end_mhz = _finite(start_mhz), _finite(end_mhz)
+        if end_mhz < start_mhz:
+            raise ValueError("Range end must not be below range start")
+        return [self.records[p] for p in self._stab(start_mhz) if self.ends[p] >= end_mhz]
+
+    def within(self, start_mhz: float, end_mhz: float) -> List[Dict[str, Any]]:
+        """Find every allocation that lies entirely inside the range [start_mhz, end_mhz]."""
+        start_mhz, end_mhz = _finite(start_mhz), _finite(end_mhz)
+        if end_mhz < start_mhz:
+            raise ValueError("Range end must not be below range start")
+        first = bisect_left(self.starts, start_mhz)
+        last = bisect_right(self.starts, end_mhz)
+        return [self.records[p] for p in range(first, last) if self.ends[p] <= end_mhz]
+
+    def nearest(self, frequency_mhz: float, k: int = 1,
+                service_type: Optional[str] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Find the k allocations closest to a frequency, by distance to their nearest edge.
+
+        Allocations containing the frequency are at distance 0. Returns
+        (distance_mhz, allocation) pairs ordered by distance; on equal distance,
+        containing allocations come first, then those below the frequency.
+        With service_type, only allocations of that Service_Type are considered.
+        """
+        frequency_mhz = _finite(frequency_mhz)
+        if k < 1:
+            return []
+        starts, start_positions, ends, end_positions = self._endpoint_table(service_type)
+
+        found = [(0.0, p) for p in self._stab(frequency_mhz)
+                 if service_type is None or self.records[p]['Service_Type'] == service_type][:k]
+        # Walk outwards: starts above the frequency ascend, ends below it descend
+        above = bisect_right(starts, frequency_mhz)
+        below = bisect_left(ends, frequency_mhz) - 1
+        while len(found) < k and (above < len(starts) or below >= 0):
+            above_distance = starts[above] - frequency_mhz if above < len(starts) else float("inf")
+            below_distance = frequency_mhz - ends[below] if below >= 0 else float("inf")
+            if below_distance <= above_distance:
+                found.append((below_distance, end_positions[below]))
+                below -= 1
+            else:
+                found.append((above_distance, start_positions[above]))
+                above += 1
+        return [(distance, self.records[p]) for distance, p in found]
+
+
+def main():
+    """Look up the allocations for frequencies given on the command line."""
+    import sys
+
+    index = FrequencyIndex()
+    for arg in sys.argv[1:]:
+        matches = index.lookup(float(arg))
+        print(f"{arg} MHz: {len(matches)} allocation(s)")
+        for entry in matches:
+            print(f"  {entry['Band']} ({entry['Service_Type']}) - {entry['Primary_Use']}")
+
+
+if __name__ == "__main__":
+    main()
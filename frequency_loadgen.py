@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Load generator for frequency_service.py.
+
+Opens concurrent keep-alive connections to a running service and measures
+client-side latency percentiles and throughput. Frequencies are drawn with a
+skew towards a small hot set, like real lookup traffic.
+
+Example:
+    python frequency_service.py &
+    python frequency_loadgen.py --connections 32 --requests 200000
+    python frequency_loadgen.py --endpoint batch --batch-size 1000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from enhance_frequency_data import get_enhanced_frequency_data
+
+HOT_FREQUENCIES = [146.52, 156.8, 121.5, 462.5625, 1575.42, 10.0, 27.185, 446.0]
+
+
+def frequency_stream(seed, hot_fraction):
+    """Yield frequencies: mostly hot ones, the rest spread over the allocations."""
+    rng = random.Random(seed)
+    data = get_enhanced_frequency_data()
+    while True:
+        if rng.random() < hot_fraction:
+            yield rng.choice(HOT_FREQUENCIES)
+        else:
+            entry = rng.choice(data)
+            yield round(rng.uniform(entry['Frequency_Start_MHz'], entry['Frequency_End_MHz']), 4)
+
+
+def build_request(endpoint, frequencies, batch_size):
+    """Return the raw HTTP request bytes for one call."""
+    if endpoint == "lookup":
+        return f"GET /lookup?freq={next(frequencies)} HTTP/1.1\r\nHost: local\r\n\r\n".encode()
+    if endpoint == "range":
+        start = next(frequencies)
+        return f"GET /range?start={start}&end={start + 1.0} HTTP/1.1\r\nHost: local\r\n\r\n".encode()
+    body = json.dumps([next(frequencies) for _ in range(batch_size)]).encode()
+    return (f"POST /batch HTTP/1.1\r\nHost: local\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+
+
+async def read_response(reader):
+    """Read one HTTP response and return its status code."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("service closed the connection")
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def run_connection(args, requests, latencies, seed):
+    """Send requests sequentially on one connection, recording each latency."""
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    frequencies = frequency_stream(seed, args.hot_fraction)
+    errors = 0
+    try:
+        for _ in range(requests):
+            request = build_request(args.endpoint, frequencies, args.batch_size)
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status = await read_response(reader)
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += status != 200
+    finally:
+        writer.close()
+    return errors
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def run(args):
+    latencies = []
+    per_connection = args.requests // args.connections
+    started = time.perf_counter()
+    errors = await asyncio.gather(*(run_connection(args, per_connection, latencies, args.seed + i)
+                                    for i in range(args.connections)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    lookups = len(latencies) * (args.batch_size if args.endpoint == "batch" else 1)
+    print(f"{len(latencies):,} {args.endpoint} requests over {args.connections} connections in {elapsed:.2f}s")
+    print(f"  throughput: {len(latencies) / elapsed:,.0f} req/s ({lookups / elapsed:,.0f} lookups/s)")
+    print(f"  latency:    p50 {percentile(latencies, 0.50):.3f} ms  p90 {percentile(latencies, 0.90):.3f} ms  "
+          f"p99 {percentile(latencies, 0.99):.3f} ms  max {latencies[-1] if latencies else 0:.3f} ms")
+    print(f"  errors:     {sum(errors)}")
+
+
+def main():
+    """Drive load against a running lookup service."""
+    parser = argparse.ArgumentParser(description="Measure frequency_service.py latency and throughput.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="connect to this Unix socket path instead of TCP")
+    parser.add_argument("--endpoint", choices=["lookup", "range", "batch"], default="lookup")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=50000, help="total requests across connections")
+    parser.add_argument("--batch-size", type=int, default=100, help="frequencies per batch request")
+    parser.add_argument("--hot-fraction", type=float, default=0.8, help="share of lookups hitting the hot set")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
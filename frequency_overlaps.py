@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Sweep-line overlap analysis for the frequency allocations.
+
+Allocations are closed ranges, so two entries conflict when they share even a
+single frequency (GPS L1 and Galileo E1 at 1575.42 MHz, Wi-Fi 2.4 GHz and
+Bluetooth). Rather than comparing every pair, the starts (sorted) and ends
+(sorted separately) are merged in one pass, tracking how many allocations are
+active. An overlap group is a maximal run of allocations whose ranges chain
+together; for each one the sweep also measures where two or more of them
+actually coincide. Sorting dominates, so the analysis is O(n log n).
+"""
+
+import argparse
+from operator import itemgetter
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Iterator
+
+from enhance_frequency_data import get_enhanced_frequency_data
+
+OVERLAP_REPORT_FILE = "OVERLAP_REPORT.md"
+
+
+class OverlapSpan(NamedTuple):
+    """One overlap group as positions [first, stop) into the start-sorted input."""
+    first: int
+    stop: int
+    span_start_mhz: float
+    span_end_mhz: float
+    overlap_start_mhz: float
+    overlap_end_mhz: float
+    overlap_mhz: float
+    max_depth: int
+
+
+class OverlapGroup(NamedTuple):
+    """An overlap group with its member allocations, ordered by start frequency."""
+    members: List[Dict[str, Any]]
+    span_start_mhz: float
+    span_end_mhz: float
+    overlap_start_mhz: float
+    overlap_end_mhz: float
+    overlap_mhz: float
+    max_depth: int
+
+
+def sweep_overlaps(starts: Sequence[float], ends: Sequence[float]) -> Iterator[OverlapSpan]:
+    """
+    Yield every overlap group of the closed ranges [starts[i], ends[i]].
+
+    starts must be sorted ascending, with ends in the same order. Ranges that
+    only touch at one frequency overlap there with an extent of 0 MHz.
+    overlap_mhz is the total width covered by two or more ranges;
+    overlap_start_mhz/overlap_end_mhz bound that region.
+    """
+    sorted_ends = sorted(ends)
+    n = len(starts)
+    i = j = depth = 0
+    first = max_depth = 0
+    span_start = overlap_start = overlap_end = previous = 0.0
+    overlap = 0.0
+    while j < n:
+        # At equal frequencies starts come first, so touching ranges overlap
+        if i < n and starts[i] <= sorted_ends[j]:
+            x = starts[i]
+            if depth >= 2:
+                overlap += x - previous
+            if depth == 0:
+                first, span_start = i, x
+                overlap, max_depth = 0.0, 0
+            depth += 1
+            i += 1
+            if depth == 2 and max_depth < 2:
+                overlap_start = x
+            if depth > max_depth:
+                max_depth = depth
+        else:
+            x = sorted_ends[j]
+            if depth >= 2:
+                overlap += x - previous
+            if depth == 2:
+                overlap_end = x
+            depth -= 1
+            j += 1
+            if depth == 0 and i - first >= 2:
+                yield OverlapSpan(first, i, span_start, x, overlap_start, overlap_end, overlap, max_depth)
+        previous = x
+
+
+def find_overlaps(data: Optional[List[Dict[str, Any]]] = None) -> List[OverlapGroup]:
+    """Return every group of overlapping allocations, ordered by frequency."""
+    if data is None:
+        data = get_enhanced_frequency_data()
+    records = sorted(data, key=itemgetter('Frequency_Start_MHz'))
+    starts = [r['Frequency_Start_MHz'] for r in records]
+    ends = [r['Frequency_End_MHz'] for r in records]
+    return [OverlapGroup(records[span.first:span.stop], *span[2:])
+            for span in sweep_overlaps(starts, ends)]
+
+
+def format_mhz(value):
+    return f"{value:g}"
+
+
+def write_overlap_report(groups: List[OverlapGroup], filename: str = OVERLAP_REPORT_FILE):
+    """Write the overlap groups as a Markdown report."""
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write("# Frequency Allocation Overlaps\n\n")
+        f.write(f"{len(groups)} groups of allocations share at least one frequency, "
+                f"covering {sum(len(g.members) for g in groups)} entries.\n")
+        for number, group in enumerate(groups, 1):
+            f.write(f"\n## Group {number}: {format_mhz(group.span_start_mhz)}"
+                    f"-{format_mhz(group.span_end_mhz)} MHz\n\n")
+            if group.overlap_mhz:
+                f.write(f"Overlap: {format_mhz(group.overlap_start_mhz)}-{format_mhz(group.overlap_end_mhz)} MHz "
+                        f"({format_mhz(round(group.overlap_mhz, 6))} MHz shared, "
+                        f"up to {group.max_depth} allocations deep)\n\n")
+            else:
+                f.write(f"Overlap: at {format_mhz(group.overlap_start_mhz)} MHz only "
+                        f"(up to {group.max_depth} allocations)\n\n")
+            f.write("| Band | Frequency (MHz) | Service Type | Primary Use |\n")
+            f.write("|------|-----------------|--------------|-------------|\n")
+            for r in group.members:
+                start, end = r['Frequency_Start_MHz'], r['Frequency_End_MHz']
+                frequency = format_mhz(start) if start == end else f"{format_mhz(start)}-{format_mhz(end)}"
+                f.write(f"| {r['Band']} | {frequency} | {r['Service_Type']} | {r['Primary_Use']} |\n")
+
+    print(f"Overlap report '{filename}' written with {len(groups)} groups")
+
+
+def create_overlap_tables(cursor):
+    """
+    Drop, recreate and fill the Overlaps and Overlap_Members tables.
+
+    The sweep runs over the Frequencies table already loaded in the database,
+    read in start order through idx_frequency_range, so only the frequency
+    columns and IDs are held in memory.
+    """
+    from array import array
+
+    cursor.execute("DROP TABLE IF EXISTS Overlap_Members")
+    cursor.execute("DROP TABLE IF EXISTS Overlaps")
+    cursor.execute("""
+        CREATE TABLE Overlaps (
+            Group_ID INTEGER PRIMARY KEY,
+            Span_Start_MHz REAL NOT NULL,
+            Span_End_MHz REAL NOT NULL,
+            Overlap_Start_MHz REAL NOT NULL,
+            Overlap_End_MHz REAL NOT NULL,
+            Overlap_MHz REAL NOT NULL,
+            Max_Depth INTEGER NOT NULL,
+            Members INTEGER NOT NULL
+        )
+    """)
+    cursor.execute("""
+        CREATE TABLE Overlap_Members (
+            Group_ID INTEGER NOT NULL REFERENCES Overlaps (Group_ID),
+            Frequency_ID INTEGER NOT NULL REFERENCES Frequencies (ID)
+        )
+    """)
+
+    ids, starts, ends = array('q'), array('d'), array('d')
+    for row_id, start, end in cursor.execute(
+            "SELECT ID, Frequency_Start_MHz, Frequency_End_MHz FROM Frequencies ORDER BY Frequency_Start_MHz"):
+        ids.append(row_id)
+        starts.append(start)
+        ends.append(end)
+
+    spans = list(sweep_overlaps(starts, ends))
+    cursor.executemany(
+        "INSERT INTO Overlaps VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        ((number, *span[2:], span.stop - span.first) for number, span in enumerate(spans, 1)))
+    cursor.executemany(
+        "INSERT INTO Overlap_Members (Group_ID, Frequency_ID) VALUES (?, ?)",
+        ((number, ids[p]) for number, span in enumerate(spans, 1) for p in range(span.first, span.stop)))
+    cursor.execute("CREATE INDEX idx_overlap_member ON Overlap_Members (Frequency_ID)")
+    return len(spans)
+
+
+def main():
+    """Print the overlap groups, or write the Markdown report."""
+    parser = argparse.ArgumentParser(description="Report overlapping frequency allocations.")
+    parser.add_argument("--report", nargs="?", const=OVERLAP_REPORT_FILE,
+                        help=f"write the Markdown report (default file: {OVERLAP_REPORT_FILE})")
+    args = parser.parse_args()
+
+    groups = find_overlaps()
+    if args.report:
+        write_overlap_report(groups, args.report)
+        return
+    for group in groups:
+        print(f"{format_mhz(group.span_start_mhz)}-{format_mhz(group.span_end_mhz)} MHz: "
+              f"{len(group.members)} allocations, {format_mhz(round(group.overlap_mhz, 6))} MHz shared")
+        for r in group.members:
+            print(f"  {r['Band']} ({r['Service_Type']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Columnar Parquet export of the frequency allocations, with pruned reads.
+
+The file holds the allocations sorted by start (then end) frequency, split
+into row groups of ROW_GROUP_SIZE rows. Band and Service_Type are dictionary
+encoded, and every column chunk carries min/max statistics. Because the rows
+are sorted, the frequency statistics of each row group bound a narrow slice
+of the spectrum, so read_parquet() can pick out the row groups that may hold
+a frequency range from the footer alone and read only those.
+
+Only frequency pruning is effective. Every service is spread across the
+spectrum, so each row group's Service_Type min/max spans nearly all services
+and rarely excludes it; a Service_Type query reads about every row group and
+is filtered after reading. Partitioning by service would restore that pruning
+but give up the narrow frequency slices, which serve the common lookups.
+
+pyarrow is imported inside the functions that use it.
+"""
+
+import argparse
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
+
+from enhance_frequency_data import FREQUENCY_COLUMNS
+
+PARQUET_FILE = "Frequencies.parquet"
+ROW_GROUP_SIZE = 65536
+DICTIONARY_COLUMNS = ["Band", "Service_Type"]
+
+
+def parquet_schema():
+    """The Arrow schema of the export: dictionary-encoded Band and Service_Type."""
+    import pyarrow as pa
+
+    return pa.schema([
+        pa.field("Band", pa.dictionary(pa.int32(), pa.string()), nullable=False),
+        pa.field("Frequency_Start_MHz", pa.float64(), nullable=False),
+        pa.field("Frequency_End_MHz", pa.float64(), nullable=False),
+        pa.field("Wavelength", pa.string()),
+        pa.field("Primary_Use", pa.string()),
+        pa.field("Service_Type", pa.dictionary(pa.int32(), pa.string())),
+    ])
+
+
+def write_parquet(data: List[Dict[str, Any]], filename: str = PARQUET_FILE, row_group_size: int = ROW_GROUP_SIZE):
+    """Write the allocations to a Parquet file in frequency-sorted row groups."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = sorted(data, key=itemgetter('Frequency_Start_MHz', 'Frequency_End_MHz'))
+    schema = parquet_schema()
+    table = pa.Table.from_pydict({column: [row[column] for row in rows] for column in FREQUENCY_COLUMNS}, schema=schema)
+    with pq.ParquetWriter(filename, schema, compression="zstd", use_dictionary=DICTIONARY_COLUMNS,
+                          write_statistics=True,
+                          sorting_columns=[pq.SortingColumn(1), pq.SortingColumn(2)]) as writer:
+        writer.write_table(table, row_group_size=row_group_size)
+
+    print(f"Parquet file '{filename}' created with {len(rows)} entries "
+          f"in {-(-len(rows) // row_group_size)} row group(s)")
+
+
+def _statistics(row_group, column):
+    """(min, max) of a column chunk, or None when the writer recorded no statistics."""
+    stats = row_group.column(column).statistics
+    if stats is None or not stats.has_min_max:
+        return None
+    return stats.min, stats.max
+
+
+def matching_row_groups(metadata, start_mhz: Optional[float] = None, end_mhz: Optional[float] = None,
+                        service_type: Optional[str] = None) -> List[int]:
+    """
+    Row groups that may hold allocations intersecting [start_mhz, end_mhz] of service_type.
+
+    Decided from the footer statistics only: a row group is skipped when its
+    smallest start is above end_mhz, its largest end is below start_mhz, or
+    service_type sorts outside its Service_Type range. Open bounds match all.
+    Since the rows are sorted by frequency, the Service_Type test seldom skips
+    anything; it only guards against names outside the file's range.
+    """
+    names = metadata.schema.names
+    start_column = names.index("Frequency_Start_MHz")
+    end_column = names.index("Frequency_End_MHz")
+    service_column = names.index("Service_Type")
+
+    groups = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        starts = _statistics(row_group, start_column)
+        ends = _statistics(row_group, end_column)
+        services = _statistics(row_group, service_column)
+        if end_mhz is not None and starts is not None and starts[0] > end_mhz:
+            continue
+        if start_mhz is not None and ends is not None and ends[1] < start_mhz:
+            continue
+        if service_type is not None and services is not None and not services[0] <= service_type <= services[1]:
+            continue
+        groups.append(i)
+    return groups
+
+
+def read_parquet(filename: str = PARQUET_FILE, start_mhz: Optional[float] = None, end_mhz: Optional[float] = None,
+                 service_type: Optional[str] = None, columns: Optional[List[str]] = None):
+    """
+    Read the allocations intersecting [start_mhz, end_mhz], optionally of one Service_Type.
+
+    Give a single start_mhz with end_mhz left as None for a point lookup; pass
+    neither for every allocation. Only the row groups chosen by
+    matching_row_groups() are read, then rows are filtered exactly with the
+    closed-interval semantics of the SQL examples. Returns a pyarrow Table in
+    frequency order with the requested columns (default: all).
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    if start_mhz is not None and end_mhz is None:
+        end_mhz = start_mhz
+    if start_mhz is not None and end_mhz < start_mhz:
+        raise ValueError("Range end must not be below range start")
+
+    parquet_file = pq.ParquetFile(filename)
+    groups = matching_row_groups(parquet_file.metadata, start_mhz, end_mhz, service_type)
+    read_columns = None
+    if columns is not None:
+        read_columns = list(dict.fromkeys(list(columns) + ["Frequency_Start_MHz", "Frequency_End_MHz", "Service_Type"]))
+    table = parquet_file.read_row_groups(groups, columns=read_columns)
+
+    condition = None
+    if end_mhz is not None:
+        condition = pc.field("Frequency_Start_MHz") <= end_mhz
+    if start_mhz is not None:
+        condition = condition & (pc.field("Frequency_End_MHz") >= start_mhz)
+    if service_type is not None:
+        is_service = pc.field("Service_Type").cast("string") == service_type
+        condition = is_service if condition is None else condition & is_service
+    if condition is not None:
+        table = table.filter(condition)
+    return table if columns is None else table.select(columns)
+
+
+def main():
+    """Write the Parquet export, or query it by frequency range and service."""
+    parser = argparse.ArgumentParser(description="Write or query the Parquet export of the frequency data.")
+    parser.add_argument("start", nargs="?", type=float, help="frequency, or range start, in MHz")
+    parser.add_argument("end", nargs="?", type=float, help="range end in MHz")
+    parser.add_argument("--service", help="only allocations of this Service_Type")
+    parser.add_argument("--file", default=PARQUET_FILE)
+    parser.add_argument("--write", action="store_true", help="(re)write the file from the dataset first")
+    args = parser.parse_args()
+
+    if args.write:
+        from enhance_frequency_data import get_enhanced_frequency_data
+        write_parquet(get_enhanced_frequency_data(), args.file)
+    if args.start is None and args.service is None:
+        return
+
+    import pyarrow.parquet as pq
+    metadata = pq.ParquetFile(args.file).metadata
+    end = args.start if args.end is None else args.end
+    groups = matching_row_groups(metadata, args.start, end, args.service)
+    table = read_parquet(args.file, args.start, args.end, args.service)
+    print(f"{table.num_rows} allocation(s), read {len(groups)} of {metadata.num_row_groups} row group(s)")
+    for entry in table.to_pylist():
+        print(f"  {entry['Band']}: {entry['Frequency_Start_MHz']}-{entry['Frequency_End_MHz']} MHz "
+              f"({entry['Service_Type']}) - {entry['Primary_Use']}")
+
+
+if __name__ == "__main__":
+    main()
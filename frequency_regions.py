@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Region-sharded frequency datasets.
+
+Allocations differ between jurisdictions, so the data is keyed by region in
+the REGIONS registry. ShardedFrequencyIndex builds one FrequencyIndex per
+region the first time that region is queried and keeps at most max_loaded of
+them, dropping the least recently used. Queries name the regions they want;
+queries without regions fan out over the shards already loaded, so a
+process only pays for the regions it actually uses.
+"""
+
+import argparse
+import heapq
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from enhance_frequency_data import get_enhanced_frequency_data, get_cept_frequency_data
+from frequency_index import FrequencyIndex
+
+
+class Region(NamedTuple):
+    code: str
+    name: str
+    itu_region: int
+    loader: Callable[[], List[Dict[str, Any]]]
+    database: str
+
+
+REGIONS = {
+    "US": Region("US", "United States (FCC)", 2, get_enhanced_frequency_data, "Frequencies.db"),
+    "CEPT": Region("CEPT", "Europe (CEPT)", 1, get_cept_frequency_data, "Frequencies_CEPT.db"),
+}
+
+
+def register_region(region: Region):
+    """Add or replace a region in the registry."""
+    REGIONS[region.code] = region
+
+
+class ShardedFrequencyIndex:
+    """
+    FrequencyIndex shards per region, loaded on first use and kept in a bounded LRU.
+
+    Queries take the region codes to search. Without them they search every
+    loaded region, or every registered region while none is loaded yet, so a
+    fresh index answers instead of returning nothing.
+    """
+
+    def __init__(self, regions: Optional[Dict[str, Region]] = None, max_loaded: int = 4):
+        if max_loaded < 1:
+            raise ValueError("max_loaded must be at least 1")
+        self.regions = dict(REGIONS if regions is None else regions)
+        self.max_loaded = max_loaded
+        self._shards = OrderedDict()
+        self.loads = 0
+        self.evictions = 0
+
+    def loaded(self) -> List[str]:
+        """Codes of the regions currently loaded, least recently used first."""
+        return list(self._shards)
+
+    def shard(self, region: str) -> FrequencyIndex:
+        """Return a region's index, loading it (and evicting the oldest shard) if needed."""
+        index = self._shards.get(region)
+        if index is not None:
+            self._shards.move_to_end(region)
+            return index
+        if region not in self.regions:
+            raise KeyError(f"Unknown region '{region}'")
+        index = self._shards[region] = FrequencyIndex(self.regions[region].loader())
+        self.loads += 1
+        if len(self._shards) > self.max_loaded:
+            self._shards.popitem(last=False)
+            self.evictions += 1
+        return index
+
+    def _targets(self, regions):
+        if regions is None:
+            regions = self._shards or self.regions
+        codes = list(regions)
+        return [(code, self.shard(code)) for code in codes]
+
+    def lookup(self, frequency_mhz: float, regions: Optional[Iterable[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Allocations containing a frequency, per region (default: loaded regions, else all)."""
+        return {code: index.lookup(frequency_mhz) for code, index in self._targets(regions)}
+
+    def overlapping(self, start_mhz: float, end_mhz: float,
+                    regions: Optional[Iterable[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Allocations intersecting [start_mhz, end_mhz], per region (default: loaded regions, else all)."""
+        return {code: index.overlapping(start_mhz, end_mhz) for code, index in self._targets(regions)}
+
+    def nearest(self, frequency_mhz: float, k: int = 1, regions: Optional[Iterable[str]] = None,
+                service_type: Optional[str] = None) -> List[Tuple[float, str, Dict[str, Any]]]:
+        """The k nearest allocations across regions, as (distance_mhz, region, allocation)."""
+        candidates = [(distance, code, record)
+                      for code, index in self._targets(regions)
+                      for distance, record in index.nearest(frequency_mhz, k, service_type)]
+        return heapq.nsmallest(k, candidates, key=lambda candidate: candidate[0])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded(),
+            "max_loaded": self.max_loaded,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+
+def main():
+    """Look up frequencies in one or more regions."""
+    parser = argparse.ArgumentParser(description="Look up frequencies in region-specific allocations.")
+    parser.add_argument("frequencies", nargs="+", type=float, help="frequencies in MHz")
+    parser.add_argument("--region", action="append", choices=list(REGIONS),
+                        help="region to search; repeat for several (default: all)")
+    args = parser.parse_args()
+
+    index = ShardedFrequencyIndex()
+    regions = args.region or list(REGIONS)
+    for frequency in args.frequencies:
+        for code, matches in index.lookup(frequency, regions).items():
+            print(f"{frequency} MHz [{code}]: {len(matches)} allocation(s)")
+            for entry in matches:
+                print(f"  {entry['Band']} ({entry['Service_Type']}) - {entry['Primary_Use']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Local asyncio HTTP lookup service for the frequency dataset.
+
+Endpoints (all responses are JSON):
+    GET  /lookup?freq=146.52            allocations containing one frequency
+    GET  /range?start=144&end=148       allocations overlapping a range
+    GET  /service?type=Marine           allocations of one Service_Type
+    POST /batch   [146.52, 156.8, ...]  one result list per frequency
+    GET  /stats                         cache hit rate and latency histograms
+
+/lookup and /range also take &service=TYPE to keep one Service_Type.
+Lookups go through an LRU/TTL result cache keyed by the dataset version, which
+--shared-cache FILE backs with a SQLite file shared between processes. Serve
+on TCP (default 127.0.0.1:8765) or on a Unix socket with --unix PATH.
+Everything runs locally.
+
+The dataset is loaded once at startup and the cache version is taken from it,
+so a running service keeps answering from that data: restart it (or call
+LookupService.reload() when embedding it) after the data is regenerated.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from bisect import bisect_right
+from urllib.parse import urlsplit, parse_qs
+
+from frequency_cache import QueryCache, SQLiteCacheBackend, dataset_version
+from frequency_index import FrequencyIndex
+
+MAX_BODY_BYTES = 16 << 20
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000]
+# Paths with their own latency histogram; every other path is counted under "other"
+ENDPOINTS = ("/lookup", "/range", "/service", "/batch", "/stats")
+
+
+class LatencyHistogram:
+    """Fixed-bucket request latency histogram."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def observe(self, elapsed_ms):
+        self.counts[bisect_right(self.buckets, elapsed_ms)] += 1
+        self.total += 1
+        self.sum_ms += elapsed_ms
+
+    def quantile(self, q):
+        """Estimate a quantile as the upper bound of the bucket containing it."""
+        if not self.total:
+            return 0.0
+        rank = q * self.total
+        seen = 0
+        for bound, count in zip(self.buckets + [float("inf")], self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def stats(self):
+        return {
+            "count": self.total,
+            "mean_ms": self.sum_ms / self.total if self.total else 0.0,
+            "p50_ms": self.quantile(0.50),
+            "p99_ms": self.quantile(0.99),
+            "buckets": {f"<={bound}": count for bound, count in zip(self.buckets, self.counts)}
+                       | {"inf": self.counts[-1]},
+        }
+
+
+def _frequency(value):
+    """Parse a frequency parameter, rejecting NaN and infinities (which JSON cannot carry either)."""
+    frequency = float(value)
+    if not math.isfinite(frequency):
+        raise ValueError(f"frequency must be finite, got {value!r}")
+    return frequency
+
+
+def _of_service(records, service_type):
+    if service_type is None:
+        return records
+    return [r for r in records if r['Service_Type'] == service_type]
+
+
+class LookupService:
+    """
+    Request handling for the lookup endpoints, independent of the transport.
+
+    Answers come from the index given (or loaded) at construction until
+    reload() swaps in another, which also moves the cache to its version.
+    """
+
+    def __init__(self, index=None, cache_size=65536, cache_ttl=None, shared_cache=None):
+        self.index = index if index is not None else FrequencyIndex()
+        version = dataset_version(self.index.records)
+        backend = SQLiteCacheBackend(shared_cache, version, ttl=cache_ttl) if shared_cache else None
+        self.cache = QueryCache(cache_size, cache_ttl, version, backend)
+        self.latency = {}
+        self.started = time.time()
+
+    def reload(self, index):
+        """Serve from a new index, switching the cache (and shared backend) to its data version."""
+        self.index = index
+        self.cache.set_version(dataset_version(self.index.records))
+
+    def lookup(self, frequency, service_type=None):
+        return self.cache.get(("point", frequency, service_type),
+                              lambda: _of_service(self.index.lookup(frequency), service_type))
+
+    def overlapping(self, start, end, service_type=None):
+        return self.cache.get(("range", start, end, service_type),
+                              lambda: _of_service(self.index.overlapping(start, end), service_type))
+
+    def by_service(self, service_type):
+        return self.cache.get(("service", service_type),
+                              lambda: _of_service(self.index.records, service_type))
+
+    def handle(self, method, target, body):
+        """Dispatch one request; returns (status, payload)."""
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            if url.path == "/lookup" and method == "GET":
+                frequency = _frequency(query["freq"])
+                return 200, {"frequency": frequency, "matches": self.lookup(frequency, query.get("service"))}
+            if url.path == "/range" and method == "GET":
+                start, end = _frequency(query["start"]), _frequency(query["end"])
+                return 200, {"start": start, "end": end,
+                             "matches": self.overlapping(start, end, query.get("service"))}
+            if url.path == "/service" and method == "GET":
+                return 200, {"service_type": query["type"], "matches": self.by_service(query["type"])}
+            if url.path == "/batch" and method == "POST":
+                frequencies = [_frequency(f) for f in json.loads(body or b"[]")]
+                return 200, {"results": [self.lookup(f) for f in frequencies]}
+            if url.path == "/stats" and method == "GET":
+                return 200, self.stats()
+        except (KeyError, ValueError, TypeError) as e:
+            return 400, {"error": f"bad request: {e}"}
+        return 404, {"error": f"no endpoint {method} {url.path}"}
+
+    def record_latency(self, endpoint, elapsed_ms):
+        """Add a request's latency to its endpoint's histogram, so unknown paths cannot grow the table."""
+        if endpoint not in ENDPOINTS:
+            endpoint = "other"
+        histogram = self.latency.get(endpoint)
+        if histogram is None:
+            histogram = self.latency[endpoint] = LatencyHistogram()
+        histogram.observe(elapsed_ms)
+
+    def stats(self):
+        return {
+            "uptime_s": time.time() - self.started,
+            "allocations": len(self.index),
+            "cache": self.cache.stats(),
+            "latency": {endpoint: h.stats() for endpoint, h in sorted(self.latency.items())},
+        }
+
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large"}
+
+
+async def handle_connection(service, reader, writer):
+    """Serve HTTP/1.1 requests on one keep-alive connection."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            started = time.perf_counter()
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY_BYTES:
+                status, payload = 413, {"error": "request body too large"}
+                keep_alive = False
+            else:
+                body = await reader.readexactly(length) if length else b""
+                status, payload = service.handle(method, target, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+            data = json.dumps(payload).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data)
+            await writer.drain()
+            service.record_latency(urlsplit(target).path, (time.perf_counter() - started) * 1000)
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(service, host="127.0.0.1", port=8765, unix_path=None):
+    """Run the lookup service until cancelled."""
+    def on_connect(reader, writer):
+        return handle_connection(service, reader, writer)
+
+    if unix_path:
+        server = await asyncio.start_unix_server(on_connect, path=unix_path)
+        where = unix_path
+    else:
+        server = await asyncio.start_server(on_connect, host, port)
+        where = f"http://{host}:{port}"
+    print(f"Frequency lookup service listening on {where} ({len(service.index)} allocations)")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Start the lookup service."""
+    parser = argparse.ArgumentParser(description="Serve frequency lookups over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--cache-size", type=int, default=65536, help="LRU cache entries")
+    parser.add_argument("--cache-ttl", type=float, help="seconds a cached result stays valid (default: no expiry)")
+    parser.add_argument("--shared-cache", help="SQLite file to share cached results between processes")
+    args = parser.parse_args()
+
+    service = LookupService(cache_size=args.cache_size, cache_ttl=args.cache_ttl, shared_cache=args.shared_cache)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
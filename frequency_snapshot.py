@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Versioned binary snapshot of the frequency index, loaded with mmap.
+
+The snapshot holds the allocations sorted by start frequency, the
+elementary-segment table from FrequencyIndex.segments() and a string table.
+A fixed header carries the section sizes and a CRC32 of the payload.
+SnapshotIndex maps the file read-only and answers lookups straight from
+memoryviews over the mapping, so loading involves no parsing or copying, and
+every process mapping the same file shares its physical pages.
+
+Layout (little-endian, sections 8-byte aligned, in order after the header):
+    starts          float64[records]
+    ends            float64[records]
+    boundaries      float64[boundaries]
+    slot_offsets    uint64[2 * boundaries + 2]
+    slot_positions  uint32[slot_entries]
+    record_strings  uint32[records * 4]    Band, Wavelength, Primary_Use, Service_Type
+    string_offsets  uint64[strings + 1]
+    string_blob     UTF-8 bytes
+"""
+
+import mmap
+import struct
+import sys
+import zlib
+from bisect import bisect_right, bisect_left
+from typing import List, Dict, Any, Optional
+
+from frequency_index import FrequencyIndex, _finite
+
+SNAPSHOT_MAGIC = b"FREQSNAP"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILE = "Frequencies.snap"
+STRING_FIELDS = ["Band", "Wavelength", "Primary_Use", "Service_Type"]
+
+# magic, version, flags, records, boundaries, slot entries, strings, blob size, payload crc32
+_HEADER = struct.Struct("<8sIIQQQQQI")
+_HEADER_SIZE = 64
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is malformed, corrupt or of an unsupported version."""
+
+
+def _align(size):
+    return (size + 7) & ~7
+
+
+def _section_sizes(records, boundaries, slot_entries, strings, blob_size):
+    """Byte sizes of the payload sections, in file order."""
+    return [
+        8 * records,
+        8 * records,
+        8 * boundaries,
+        8 * (2 * boundaries + 2),
+        4 * slot_entries,
+        4 * records * len(STRING_FIELDS),
+        8 * (strings + 1),
+        blob_size,
+    ]
+
+
+def write_snapshot(data: Optional[List[Dict[str, Any]]] = None, filename: str = SNAPSHOT_FILE,
+                   index: Optional[FrequencyIndex] = None):
+    """Write a snapshot of the frequency data to filename."""
+    if index is None:
+        index = FrequencyIndex(data)
+    boundaries, slot_offsets, slot_positions = index.segments()
+
+    strings = []
+    string_ids = {}
+    record_strings = []
+    for record in index.records:
+        for field in STRING_FIELDS:
+            value = str(record[field])
+            if value not in string_ids:
+                string_ids[value] = len(strings)
+                strings.append(value)
+            record_strings.append(string_ids[value])
+
+    encoded = [s.encode("utf-8") for s in strings]
+    string_offsets = [0]
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+    blob = b"".join(encoded)
+
+    n = len(index.records)
+    sections = [
+        struct.pack(f"<{n}d", *index.starts),
+        struct.pack(f"<{n}d", *index.ends),
+        struct.pack(f"<{len(boundaries)}d", *boundaries),
+        struct.pack(f"<{len(slot_offsets)}Q", *slot_offsets),
+        struct.pack(f"<{len(slot_positions)}I", *slot_positions),
+        struct.pack(f"<{len(record_strings)}I", *record_strings),
+        struct.pack(f"<{len(string_offsets)}Q", *string_offsets),
+        blob,
+    ]
+    payload = b"".join(section + b"\0" * (_align(len(section)) - len(section)) for section in sections)
+
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, n, len(boundaries),
+                          len(slot_positions), len(strings), len(blob), zlib.crc32(payload))
+    with open(filename, "wb") as f:
+        f.write(header.ljust(_HEADER_SIZE, b"\0"))
+        f.write(payload)
+
+    print(f"Snapshot '{filename}' written with {n} entries ({_HEADER_SIZE + len(payload):,} bytes)")
+
+
+class SnapshotIndex:
+    """
+    Read-only frequency index served from a memory-mapped snapshot.
+
+    Queries match FrequencyIndex: closed ranges, all matches, ordered by start,
+    and a ValueError for NaN or infinite bounds.
+    Pass verify=False to skip the payload checksum when many workers open the
+    same, already verified file.
+    """
+
+    def __init__(self, filename: str = SNAPSHOT_FILE, verify: bool = True):
+        if sys.byteorder != "little":
+            raise SnapshotError("snapshots can only be mapped on little-endian hosts")
+
+        with open(filename, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views = []
+        try:
+            self._load(verify)
+        except BaseException:
+            self.close()
+            raise
+
+    def _load(self, verify):
+        if len(self._mmap) < _HEADER_SIZE:
+            raise SnapshotError("file is too short to be a snapshot")
+        magic, version, _, records, boundaries, slot_entries, strings, blob_size, crc = \
+            _HEADER.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise SnapshotError("not a frequency snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(f"unsupported snapshot version {version}")
+
+        sizes = _section_sizes(records, boundaries, slot_entries, strings, blob_size)
+        if _HEADER_SIZE + sum(_align(size) for size in sizes) != len(self._mmap):
+            raise SnapshotError("snapshot size does not match its header")
+
+        buffer = memoryview(self._mmap)
+        self._views.append(buffer)
+        if verify and zlib.crc32(buffer[_HEADER_SIZE:]) != crc:
+            raise SnapshotError("snapshot checksum mismatch")
+
+        offset = _HEADER_SIZE
+        views = []
+        for size, fmt in zip(sizes, "ddd" + "QIIQB"):
+            view = buffer[offset:offset + size].cast(fmt)
+            self._views.append(view)
+            views.append(view)
+            offset += _align(size)
+        (self.starts, self.ends, self.boundaries, self.slot_offsets, self.slot_positions,
+         self._record_strings, self._string_offsets, self._string_blob) = views
+
+    def close(self):
+        """Release the buffer views and unmap the file."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.starts)
+
+    def _string(self, string_id):
+        start = self._string_offsets[string_id]
+        return str(self._string_blob[start:self._string_offsets[string_id + 1]], "utf-8")
+
+    def record(self, position: int) -> Dict[str, Any]:
+        """Decode the allocation at a sorted position into a row dict."""
+        base = position * len(STRING_FIELDS)
+        band, wavelength, primary_use, service_type = (
+            self._string(self._record_strings[base + i]) for i in range(len(STRING_FIELDS)))
+        return {
+            "Band": band,
+            "Frequency_Start_MHz": self.starts[position],
+            "Frequency_End_MHz": self.ends[position],
+            "Wavelength": wavelength,
+            "Primary_Use": primary_use,
+            "Service_Type": service_type,
+        }
+
+    def lookup_positions(self, frequency_mhz: float) -> List[int]:
+        """Return sorted positions of every allocation containing the frequency."""
+        frequency_mhz = _finite(frequency_mhz)
+        i = bisect_left(self.boundaries, frequency_mhz)
+        slot = 2 * i + (i < len(self.boundaries) and self.boundaries[i] == frequency_mhz)
+        return self.slot_positions[self.slot_offsets[slot]:self.slot_offsets[slot + 1]].tolist()
+
+    def lookup(self, frequency_mhz: float) -> List[Dict[str, Any]]:
+        """Find every allocation that contains the given frequency."""
+        return [self.record(p) for p in self.lookup_positions(frequency_mhz)]
+
+    def overlapping(self, start_mhz: float, end_mhz: float) -> List[Dict[str, Any]]:
+        """Find every allocation that intersects the range [start_mhz, end_mhz]."""
+        start_mhz, end_mhz = _finite(start_mhz), _finite(end_mhz)
+        if end_mhz < start_mhz:
+            raise ValueError("Range end must not be below range start")
+        # Allocations containing the lower edge, plus those that begin inside the range
+        positions = self.lookup_positions(start_mhz)
+        positions.extend(range(bisect_right(self.starts, start_mhz), bisect_right(self.starts, end_mhz)))
+        return [self.record(p) for p in positions]
+
+
+def main():
+    """Write the snapshot, or look up frequencies in an existing one."""
+    if len(sys.argv) > 1:
+        with SnapshotIndex() as index:
+            for arg in sys.argv[1:]:
+                matches = index.lookup(float(arg))
+                print(f"{arg} MHz: {len(matches)} allocation(s)")
+                for entry in matches:
+                    print(f"  {entry['Band']} ({entry['Service_Type']}) - {entry['Primary_Use']}")
+    else:
+        write_snapshot()
+
+
+if __name__ == "__main__":
+    main()
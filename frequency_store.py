@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Compact columnar store for frequency allocation data.
+
+FrequencyTable keeps each field in a typed array instead of one dict per row:
+frequencies as float64 arrays and the text fields as integer codes into
+interned string tables. Indexing or iterating yields lightweight read-only
+row views that behave like the dicts from get_enhanced_frequency_data(), so
+the existing emitters accept a FrequencyTable unchanged.
+"""
+
+import csv
+from array import array
+from collections.abc import Mapping
+from typing import List, Dict, Any, Iterable
+
+from enhance_frequency_data import FREQUENCY_COLUMNS, get_enhanced_frequency_data
+
+TEXT_COLUMNS = ["Band", "Wavelength", "Primary_Use", "Service_Type"]
+
+
+class StringTable:
+    """Interned strings addressed by integer code."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def __len__(self):
+        return len(self.values)
+
+    def code(self, value: str) -> int:
+        """Return the code for value, adding it on first sight."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int:
+        """Return the code for value, or -1 if it has never been stored."""
+        return self._codes.get(value, -1)
+
+
+class FrequencyRow(Mapping):
+    """Read-only dict-compatible view of one row of a FrequencyTable."""
+
+    __slots__ = ("_table", "_position")
+
+    def __init__(self, table, position):
+        self._table = table
+        self._position = position
+
+    def __getitem__(self, key):
+        return self._table.value(self._position, key)
+
+    def __iter__(self):
+        return iter(FREQUENCY_COLUMNS)
+
+    def __len__(self):
+        return len(FREQUENCY_COLUMNS)
+
+    def __repr__(self):
+        return f"FrequencyRow({dict(self)!r})"
+
+
+class FrequencyTable:
+    """Array-backed columns of frequency allocations."""
+
+    def __init__(self):
+        self.starts = array('d')
+        self.ends = array('d')
+        self.strings = {column: StringTable() for column in TEXT_COLUMNS}
+        self.codes = {column: array('I') for column in TEXT_COLUMNS}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping]) -> "FrequencyTable":
+        """Build a table from any iterable of row dicts, including generators."""
+        table = cls()
+        for row in rows:
+            table.append(row)
+        return table
+
+    @classmethod
+    def from_csv(cls, filename: str) -> "FrequencyTable":
+        """Stream a CSV in the frequency_data.csv layout into a table."""
+        table = cls()
+        with open(filename, newline='') as csvfile:
+            for row in csv.DictReader(csvfile):
+                row['Frequency_Start_MHz'] = float(row['Frequency_Start_MHz'])
+                row['Frequency_End_MHz'] = float(row['Frequency_End_MHz'])
+                table.append(row)
+        return table
+
+    def append(self, row: Mapping):
+        """Add one row."""
+        self.starts.append(row['Frequency_Start_MHz'])
+        self.ends.append(row['Frequency_End_MHz'])
+        for column in TEXT_COLUMNS:
+            self.codes[column].append(self.strings[column].code(row[column]))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [FrequencyRow(self, i) for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("FrequencyTable index out of range")
+        return FrequencyRow(self, position)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield FrequencyRow(self, position)
+
+    def value(self, position: int, column: str):
+        """Return one field of one row."""
+        if column == 'Frequency_Start_MHz':
+            return self.starts[position]
+        if column == 'Frequency_End_MHz':
+            return self.ends[position]
+        if column in self.codes:
+            return self.strings[column].values[self.codes[column][position]]
+        raise KeyError(column)
+
+    def column(self, column: str):
+        """
+        Return a whole column: the float64 array for frequencies, or the code
+        array for text columns (decode with strings[column].values).
+
+        Arrays support the buffer protocol, e.g. numpy.frombuffer(table.column('Frequency_Start_MHz')).
+        """
+        if column == 'Frequency_Start_MHz':
+            return self.starts
+        if column == 'Frequency_End_MHz':
+            return self.ends
+        return self.codes[column]
+
+    def categories(self, column: str) -> List[str]:
+        """Return the distinct values of a text column, indexed by code."""
+        return self.strings[column].values
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize the table as the list-of-dicts representation."""
+        return [dict(row) for row in self]
+
+
+def load_frequency_table() -> FrequencyTable:
+    """Return the enhanced frequency data as a FrequencyTable."""
+    return FrequencyTable.from_rows(get_enhanced_frequency_data())
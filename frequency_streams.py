@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Helpers for streaming frequency records through files and worker processes.
+
+Shared by the scan log annotator and the allocation table importers:
+frequency parsing with a unit, chunking of record streams, and a process-pool
+map that keeps results in input order without reading the input ahead.
+"""
+
+import math
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+BUFFER_SIZE = 1 << 20
+UNIT_EXPONENTS = {"Hz": -6, "kHz": -3, "MHz": 0, "GHz": 3}
+
+
+def parse_frequency(value, exponent=0):
+    """
+    Parse a frequency field into MHz, or return None if it is not numeric.
+    
+    NaN and infinities are treated as unparseable, like any other bad text.
+    The unit is applied as a decimal exponent while parsing, so 156800000 Hz
+    becomes exactly 156.8 MHz rather than a multiplied 156.79999999999998.
+    """
+    try:
+        if exponent:
+            try:
+                frequency = float(f"{value.strip()}e{exponent}")
+            except ValueError:
+                frequency = float(value) * 10.0 ** exponent
+        else:
+            frequency = float(value)
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return frequency if math.isfinite(frequency) else None
+
+
+def chunked(iterable, size):
+    """Yield successive lists of up to size items."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ordered_parallel_map(func, iterable, workers, max_pending=None):
+    """
+    Map func over iterable in a process pool, yielding results in input order.
+
+    Unlike Executor.map, at most max_pending tasks are submitted ahead of the
+    consumer, so an unbounded input never piles up in memory.
+    """
+    if max_pending is None:
+        max_pending = workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for item in iterable:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, item))
+        while pending:
+            yield pending.popleft().result()
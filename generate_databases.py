@@ -1,24 +1,35 @@
 #!/usr/bin/env python3
 """
 Generate SQLite database and Excel workbook from frequency data.
+
+sqlite3, pandas and openpyxl are imported inside the emitters that use them,
+so importing this module for its helpers stays cheap.
 """
 
-import sqlite3
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
-import csv
-from enhance_frequency_data import get_enhanced_frequency_data
+import argparse
+import heapq
+import os
+import pickle
+import re
+import sys
+import tempfile
+import time
+from collections.abc import Mapping
+from operator import itemgetter
+from build_profiler import add_profile_arguments, profiling, span
+from enhance_frequency_data import FREQUENCY_COLUMNS, get_enhanced_frequency_data, write_csv_file
 
-def create_sqlite_database(data, filename="Frequencies.db"):
-    """Create SQLite database from frequency data."""
-    
-    # Connect to SQLite database
-    conn = sqlite3.connect(filename)
-    cursor = conn.cursor()
+# Rows buffered in memory across all Excel sheet spools before the largest is flushed to disk
+SPOOL_BUFFER_ROWS = 100_000
+# Rows read from a spooled run at a time while merging
+SPOOL_READ_ROWS = 1000
+
+def create_frequency_tables(cursor):
+    """Drop and recreate the Frequencies table, its R*Tree and its FTS5 index, without secondary indexes."""
     
-    # Drop table if exists
+    # Drop tables if they exist
+    cursor.execute("DROP TABLE IF EXISTS Frequencies_FTS")
+    cursor.execute("DROP TABLE IF EXISTS Frequencies_RTree")
     cursor.execute("DROP TABLE IF EXISTS Frequencies")
     
     # Create table
@@ -36,27 +47,271 @@ def create_sqlite_database(data, filename="Frequencies.db"):
         )
     """)
     
+    # R*Tree over the frequency ranges so point and overlap lookups can bound both edges
+    cursor.execute("""
+        CREATE VIRTUAL TABLE Frequencies_RTree USING rtree(
+            ID,
+            Frequency_Start_MHz,
+            Frequency_End_MHz
+        )
+    """)
+    
+    # External-content full-text index over the descriptive columns; the text
+    # stays in Frequencies, with 2- and 3-character prefix indexes for short queries
+    cursor.execute("""
+        CREATE VIRTUAL TABLE Frequencies_FTS USING fts5(
+            Band,
+            Primary_Use,
+            Service_Type,
+            Notes,
+            content='Frequencies',
+            content_rowid='ID',
+            prefix='2 3',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+    """)
+
+def create_frequency_indexes(cursor):
+    """Build the secondary indexes, fill the R*Tree and FTS5 index, and add the FTS5 sync triggers."""
+    
     # Create indexes for faster searching
     cursor.execute("CREATE INDEX idx_frequency_range ON Frequencies (Frequency_Start_MHz, Frequency_End_MHz)")
     cursor.execute("CREATE INDEX idx_service_type ON Frequencies (Service_Type)")
     cursor.execute("CREATE INDEX idx_band ON Frequencies (Band)")
     
-    # Insert data
-    for row in data:
-        cursor.execute("""
-            INSERT INTO Frequencies (Band, Frequency_Start_MHz, Frequency_End_MHz, Wavelength, Primary_Use, Service_Type)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (row['Band'], row['Frequency_Start_MHz'], row['Frequency_End_MHz'], 
-              row['Wavelength'], row['Primary_Use'], row['Service_Type']))
+    # Populate the R*Tree from the loaded rows, keyed to Frequencies.ID
+    cursor.execute("""
+        INSERT INTO Frequencies_RTree (ID, Frequency_Start_MHz, Frequency_End_MHz)
+        SELECT ID, Frequency_Start_MHz, Frequency_End_MHz FROM Frequencies
+    """)
+    
+    # Index the loaded rows in one pass, then keep the FTS5 index in step with later edits
+    cursor.execute("INSERT INTO Frequencies_FTS (Frequencies_FTS) VALUES ('rebuild')")
+    cursor.execute("""
+        CREATE TRIGGER Frequencies_FTS_Insert AFTER INSERT ON Frequencies BEGIN
+            INSERT INTO Frequencies_FTS (rowid, Band, Primary_Use, Service_Type, Notes)
+            VALUES (new.ID, new.Band, new.Primary_Use, new.Service_Type, new.Notes);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER Frequencies_FTS_Delete AFTER DELETE ON Frequencies BEGIN
+            INSERT INTO Frequencies_FTS (Frequencies_FTS, rowid, Band, Primary_Use, Service_Type, Notes)
+            VALUES ('delete', old.ID, old.Band, old.Primary_Use, old.Service_Type, old.Notes);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER Frequencies_FTS_Update AFTER UPDATE OF Band, Primary_Use, Service_Type, Notes
+        ON Frequencies BEGIN
+            INSERT INTO Frequencies_FTS (Frequencies_FTS, rowid, Band, Primary_Use, Service_Type, Notes)
+            VALUES ('delete', old.ID, old.Band, old.Primary_Use, old.Service_Type, old.Notes);
+            INSERT INTO Frequencies_FTS (rowid, Band, Primary_Use, Service_Type, Notes)
+            VALUES (new.ID, new.Band, new.Primary_Use, new.Service_Type, new.Notes);
+        END
+    """)
+
+def bulk_load_frequencies(rows, filename="Frequencies.db", batch_size=50000, progress_every=None):
+    """
+    Load any iterable of frequency rows into a fresh SQLite database.
+    
+    Rows may be dicts keyed by FREQUENCY_COLUMNS or tuples in that column order,
+    and may come from a generator; only one batch is held in memory at a time.
+    Rows are inserted with executemany inside a single transaction under
+    load-tuned PRAGMAs, then the indexes, R*Tree and FTS5 index are built and
+    ANALYZE runs.
+    When progress_every is set, a throughput line is printed every that many rows.
+    Returns the number of rows loaded.
+    """
+    
+    import sqlite3
+    
+    conn = sqlite3.connect(filename, isolation_level=None)
+    cursor = conn.cursor()
     
-    # Commit and close
-    conn.commit()
+    # The file is rebuilt from scratch, so durability is traded for load speed
+    cursor.execute("PRAGMA journal_mode = MEMORY")
+    cursor.execute("PRAGMA synchronous = OFF")
+    cursor.execute("PRAGMA temp_store = MEMORY")
+    cursor.execute("PRAGMA cache_size = -262144")
+    cursor.execute("PRAGMA locking_mode = EXCLUSIVE")
+    
+    insert_sql = f"""
+        INSERT INTO Frequencies ({', '.join(FREQUENCY_COLUMNS)})
+        VALUES ({', '.join('?' for _ in FREQUENCY_COLUMNS)})
+    """
+    as_tuple = itemgetter(*FREQUENCY_COLUMNS)
+    
+    started = time.perf_counter()
+    count = 0
+    next_report = progress_every
+    cursor.execute("BEGIN")
+    try:
+        with span("sqlite.ddl"):
+            create_frequency_tables(cursor)
+        
+        with span("sqlite.insert") as insert_span:
+            batch = []
+            for row in rows:
+                batch.append(as_tuple(row) if isinstance(row, Mapping) else tuple(row))
+                if len(batch) >= batch_size:
+                    cursor.executemany(insert_sql, batch)
+                    count += len(batch)
+                    batch = []
+                    if next_report and count >= next_report:
+                        elapsed = time.perf_counter() - started
+                        print(f"  loaded {count:,} rows ({count / elapsed:,.0f} rows/s)")
+                        next_report += progress_every
+            if batch:
+                cursor.executemany(insert_sql, batch)
+                count += len(batch)
+            if insert_span is not None:
+                insert_span["attrs"]["rows"] = count
+        load_time = time.perf_counter() - started
+        
+        with span("sqlite.index"):
+            create_frequency_indexes(cursor)
+        with span("sqlite.commit"):
+            cursor.execute("COMMIT")
+    except BaseException:
+        cursor.execute("ROLLBACK")
+        conn.close()
+        raise
+    
+    with span("sqlite.analyze"):
+        cursor.execute("ANALYZE")
+    cursor.execute("PRAGMA journal_mode = DELETE")
+    cursor.execute("PRAGMA locking_mode = NORMAL")
     conn.close()
     
-    print(f"SQLite database '{filename}' created with {len(data)} entries")
+    if progress_every:
+        total_time = time.perf_counter() - started
+        rate = count / load_time if load_time > 0 else 0
+        print(f"  inserted {count:,} rows in {load_time:.2f}s ({rate:,.0f} rows/s), "
+              f"indexed and analyzed in {total_time - load_time:.2f}s")
+    
+    return count
+
+def create_sqlite_database(data, filename="Frequencies.db"):
+    """Create SQLite database from frequency data, with the Channels, Overlaps and Coverage tables."""
+    import sqlite3
+    from channel_plans import CHANNEL_PLANS, create_channel_table
+    from frequency_coverage import create_coverage_tables
+    from frequency_overlaps import create_overlap_tables
+    
+    count = bulk_load_frequencies(data, filename)
+    
+    conn = sqlite3.connect(filename)
+    with conn:
+        with span("sqlite.channels"):
+            bands = {band for (band,) in conn.execute("SELECT DISTINCT Band FROM Frequencies")}
+            create_channel_table(conn.cursor(), [plan for plan in CHANNEL_PLANS.values() if plan.band in bands])
+        with span("sqlite.overlaps"):
+            create_overlap_tables(conn.cursor())
+        with span("sqlite.coverage"):
+            create_coverage_tables(conn.cursor())
+    conn.close()
+    
+    print(f"SQLite database '{filename}' created with {count} entries")
 
-def create_excel_workbook(data, filename="Frequencies.xlsx"):
-    """Create Excel workbook with separate worksheets for each service type."""
+def find_frequencies(start_mhz, end_mhz=None, filename="Frequencies.db"):
+    """
+    Find all allocations overlapping a frequency or frequency range.
+    
+    Pass a single frequency for a point lookup, or start and end for every
+    allocation that intersects [start_mhz, end_mhz]. The candidate set comes
+    from the Frequencies_RTree index and is joined back to Frequencies. The
+    R*Tree stores 32-bit coordinates rounded outward, so the exact REAL columns
+    are re-checked in the join. Returns a list of dicts ordered by start frequency.
+    """
+    import sqlite3
+    
+    if end_mhz is None:
+        end_mhz = start_mhz
+    
+    conn = sqlite3.connect(filename)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute("""
+            SELECT f.*
+            FROM Frequencies_RTree r
+            JOIN Frequencies f ON f.ID = r.ID
+            WHERE r.Frequency_Start_MHz <= :end AND r.Frequency_End_MHz >= :start
+              AND f.Frequency_Start_MHz <= :end AND f.Frequency_End_MHz >= :start
+            ORDER BY f.Frequency_Start_MHz, f.Frequency_End_MHz
+        """, {"start": start_mhz, "end": end_mhz}).fetchall()
+    finally:
+        conn.close()
+    
+    return [dict(row) for row in rows]
+
+def search_frequencies(text, start_mhz=None, end_mhz=None, service_type=None, limit=50,
+                       filename="Frequencies.db"):
+    """
+    Full-text search of Band, Primary_Use, Service_Type and Notes, ranked by relevance.
+    
+    Every word in text must match, each as a prefix, so "time sig" finds
+    "Time signals" and "ka" finds "Ka-Band". Matches can be narrowed to the
+    allocations overlapping start_mhz (or [start_mhz, end_mhz]) and to one
+    Service_Type in the same query. Results are ordered by bm25 rank, with
+    Band weighted above Primary_Use, Service_Type and Notes, and come back as
+    dicts with a Rank key (lower is better), at most limit of them.
+    """
+    import sqlite3
+    
+    words = re.findall(r"\w+", text)
+    if not words:
+        return []
+    match = " ".join(f'"{word}"*' for word in words)
+    if start_mhz is not None and end_mhz is None:
+        end_mhz = start_mhz
+    
+    conn = sqlite3.connect(filename)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute("""
+            SELECT f.*, bm25(Frequencies_FTS, 10.0, 5.0, 2.0, 1.0) AS Rank
+            FROM Frequencies_FTS
+            JOIN Frequencies f ON f.ID = Frequencies_FTS.rowid
+            WHERE Frequencies_FTS MATCH :match
+              AND (:start IS NULL OR f.Frequency_End_MHz >= :start)
+              AND (:end IS NULL OR f.Frequency_Start_MHz <= :end)
+              AND (:service IS NULL OR f.Service_Type = :service)
+            ORDER BY Rank, f.Frequency_Start_MHz
+            LIMIT :limit
+        """, {"match": match, "start": start_mhz, "end": end_mhz,
+              "service": service_type, "limit": limit}).fetchall()
+    finally:
+        conn.close()
+    
+    return [dict(row) for row in rows]
+
+def _autosize_columns(ws):
+    """Size each column of a worksheet to its longest value, capped at 50."""
+    for column in ws.columns:
+        max_length = 0
+        column_letter = column[0].column_letter
+        for cell in column:
+            try:
+                if len(str(cell.value)) > max_length:
+                    max_length = len(str(cell.value))
+            except:
+                pass
+        adjusted_width = min(max_length + 2, 50)
+        ws.column_dimensions[column_letter].width = adjusted_width
+
+def create_excel_workbook(data, filename="Frequencies.xlsx", write_only=False):
+    """
+    Create Excel workbook with separate worksheets for each service type.
+    
+    With write_only=True the workbook is streamed; see create_excel_workbook_streaming.
+    """
+    
+    if write_only:
+        return create_excel_workbook_streaming(data, filename)
+    
+    import pandas as pd
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils.dataframe import dataframe_to_rows
     
     # Create DataFrame
     df = pd.DataFrame(data)
@@ -90,18 +345,7 @@ def create_excel_workbook(data, filename="Frequencies.xlsx"):
                 cell.fill = header_fill
                 cell.alignment = header_alignment
     
-    # Auto-size columns
-    for column in summary_sheet.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        summary_sheet.column_dimensions[column_letter].width = adjusted_width
+    _autosize_columns(summary_sheet)
     
     # Create separate worksheet for each service type
     service_types = df['Service_Type'].unique()
@@ -125,18 +369,7 @@ def create_excel_workbook(data, filename="Frequencies.xlsx"):
             cell.fill = header_fill
             cell.alignment = header_alignment
         
-        # Auto-size columns
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        _autosize_columns(ws)
     
     # Create complete data sheet
     complete_sheet = wb.create_sheet("Complete Database")
@@ -151,24 +384,173 @@ def create_excel_workbook(data, filename="Frequencies.xlsx"):
         cell.fill = header_fill
         cell.alignment = header_alignment
     
-    # Auto-size columns
-    for column in complete_sheet.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        complete_sheet.column_dimensions[column_letter].width = adjusted_width
+    _autosize_columns(complete_sheet)
     
     # Save workbook
     wb.save(filename)
     print(f"Excel workbook '{filename}' created with {len(service_types)} service-specific worksheets")
 
-def create_access_instructions():
+class _SheetSpool:
+    """
+    Rows of one service type spooled to a temporary file, with running column widths.
+    
+    Rows are buffered in memory until flush() writes them to the file as a run
+    sorted by start frequency; rows() merges the runs back in order, reading
+    each run SPOOL_READ_ROWS rows at a time, so no partition is ever held in
+    memory whole.
+    """
+    
+    def __init__(self):
+        self.file = tempfile.TemporaryFile()
+        self.count = 0
+        self.widths = [len(column) for column in FREQUENCY_COLUMNS]
+        self.buffer = []
+        self.runs = []  # (file offset, row count) of each sorted run
+    
+    def add(self, values):
+        self.buffer.append(values)
+        self.count += 1
+        for i, value in enumerate(values):
+            length = len(str(value))
+            if length > self.widths[i]:
+                self.widths[i] = length
+    
+    def flush(self):
+        """Write the buffered rows to the file as one run sorted by start frequency."""
+        if not self.buffer:
+            return
+        self.buffer.sort(key=itemgetter(1))
+        self.file.seek(0, os.SEEK_END)
+        self.runs.append((self.file.tell(), len(self.buffer)))
+        for values in self.buffer:
+            pickle.dump(values, self.file, pickle.HIGHEST_PROTOCOL)
+        self.buffer = []
+    
+    def rows(self):
+        """Yield the spooled rows ordered by start frequency (stable for equal starts)."""
+        self.buffer.sort(key=itemgetter(1))
+        runs = [self._read_run(offset, count) for offset, count in self.runs]
+        runs.append(iter(self.buffer))
+        if len(runs) == 1:
+            yield from runs[0]
+        else:
+            # Runs are in input order, and merge() prefers earlier inputs on ties
+            yield from heapq.merge(*runs, key=itemgetter(1))
+    
+    def _read_run(self, offset, count):
+        # Runs share one file, so each block read starts by seeking to where this run left off
+        while count:
+            self.file.seek(offset)
+            block = [pickle.load(self.file) for _ in range(min(count, SPOOL_READ_ROWS))]
+            offset = self.file.tell()
+            count -= len(block)
+            yield from block
+    
+    def close(self):
+        self.file.close()
+
+def create_excel_workbook_streaming(data, filename="Frequencies.xlsx"):
+    """
+    Create the Excel workbook with openpyxl's write-only mode.
+    
+    Rows are partitioned by Service_Type in a single pass into temporary spool
+    files while column widths are tracked; at most SPOOL_BUFFER_ROWS rows are
+    buffered before being written out as sorted runs. Each sheet is then
+    streamed from a merge of its runs, so memory stays flat regardless of row
+    count. The sheets match
+    create_excel_workbook.
+    """
+    
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
+    
+    as_tuple = itemgetter(*FREQUENCY_COLUMNS)
+    spools = {}
+    try:
+        # Single pass: partition rows and measure columns
+        with span("excel.partition"):
+            buffered = 0
+            for row in data:
+                values = as_tuple(row)
+                spool = spools.get(values[5])
+                if spool is None:
+                    spool = spools[values[5]] = _SheetSpool()
+                spool.add(values)
+                buffered += 1
+                if buffered >= SPOOL_BUFFER_ROWS:
+                    max(spools.values(), key=lambda s: len(s.buffer)).flush()
+                    buffered = sum(len(s.buffer) for s in spools.values())
+        
+        wb = Workbook(write_only=True)
+        
+        # Define styles
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        
+        def header_row(ws, values):
+            cells = []
+            for value in values:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                cells.append(cell)
+            return cells
+        
+        def set_widths(ws, widths):
+            # Write-only sheets need their column widths before the first row
+            for i, width in enumerate(widths, 1):
+                ws.column_dimensions[get_column_letter(i)].width = min(width + 2, 50)
+        
+        service_types = sorted(spools)
+        
+        # Create summary sheet
+        with span("excel.sheet", sheet="Summary"):
+            summary_sheet = wb.create_sheet("Summary")
+            summary_header = ['Service Type', 'Number of Entries']
+            set_widths(summary_sheet, [
+                max([len(summary_header[0])] + [len(service) for service in service_types]),
+                max([len(summary_header[1])] + [len(str(spools[service].count)) for service in service_types]),
+            ])
+            summary_sheet.append(header_row(summary_sheet, summary_header))
+            for service in service_types:
+                summary_sheet.append([service, spools[service].count])
+        
+        # Create separate worksheet for each service type
+        for service_type in service_types:
+            spool = spools[service_type]
+            sheet_name = service_type.replace('/', '_')[:31]  # Excel sheet name limit
+            with span("excel.sheet", sheet=sheet_name, rows=spool.count):
+                ws = wb.create_sheet(sheet_name)
+                set_widths(ws, spool.widths)
+                ws.append(header_row(ws, FREQUENCY_COLUMNS))
+                for values in spool.rows():
+                    ws.append(values)
+        
+        # Create complete data sheet from the partitions in service order
+        with span("excel.sheet", sheet="Complete Database"):
+            complete_sheet = wb.create_sheet("Complete Database")
+            complete_widths = [max(widths) for widths in zip(*(spools[s].widths for s in service_types))] \
+                if service_types else [len(column) for column in FREQUENCY_COLUMNS]
+            set_widths(complete_sheet, complete_widths)
+            complete_sheet.append(header_row(complete_sheet, FREQUENCY_COLUMNS))
+            for service_type in service_types:
+                for values in spools[service_type].rows():
+                    complete_sheet.append(values)
+        
+        # Save workbook
+        with span("excel.save"):
+            wb.save(filename)
+    finally:
+        for spool in spools.values():
+            spool.close()
+    
+    print(f"Excel workbook '{filename}' created with {len(service_types)} service-specific worksheets")
+
+def create_access_instructions(filename="ACCESS_DATABASE_INSTRUCTIONS.md"):
     """Create updated Access database instructions."""
     
     instructions = """# Creating the Frequencies Access Database
@@ -180,7 +562,14 @@ Since Access database files (.accdb) are binary files that require Microsoft Acc
 1. **Frequencies.db** - SQLite database (cross-platform, can be opened with many tools)
 2. **Frequencies.xlsx** - Excel workbook with categorized worksheets  
 3. **frequency_data.csv** - Enhanced CSV file with all frequency data
-4. **database_schema.sql** - SQL schema for creating Access database
+4. **database_schema.sql** - SQL schema for creating Access database: the Frequencies,
+   Channels, Overlaps and Coverage tables, with the SQLite-only R*Tree and FTS5 tables
+   listed at the end for reference
+5. **Frequencies_CEPT.db** - SQLite database of European (CEPT, ITU Region 1) allocations,
+   with the same tables as Frequencies.db
+6. **Frequencies.parquet** - Columnar Parquet export, sorted by frequency, for Arrow, pandas,
+   DuckDB and Spark; `frequency_parquet.read_parquet()` reads only the row groups a
+   frequency range can match
 
 ## Option 1: Use the SQLite Database (Recommended)
 
@@ -204,8 +593,46 @@ ORDER BY Frequency_Start_MHz;
 -- Find frequencies in a range
 SELECT * FROM Frequencies 
 WHERE Frequency_Start_MHz >= 144 AND Frequency_End_MHz <= 148;
+
+-- Fast point/overlap lookup through the R*Tree index
+SELECT f.* FROM Frequencies_RTree r
+JOIN Frequencies f ON f.ID = r.ID
+WHERE r.Frequency_Start_MHz <= 148 AND r.Frequency_End_MHz >= 144
+  AND f.Frequency_Start_MHz <= 148 AND f.Frequency_End_MHz >= 144;
+```
+
+The `Frequencies_RTree` table is an SQLite R*Tree index over each entry's
+frequency range. Plain B-tree indexes can only bound one edge of a
+`BETWEEN` lookup, while the R*Tree bounds both, so lookups stay fast as the
+table grows. R*Tree coordinates are 32-bit, so always re-check the exact
+`Frequencies` columns as shown above. From Python, use
+`generate_databases.find_frequencies(146.52)` or
+`find_frequencies(144, 148)`.
+
+The `Channels` table expands the channelized allocations (Marine VHF,
+Aviation VHF at 25 and 8.33 kHz, CB, FRS/GMRS) into one row per channel:
+
+```sql
+-- Which channel is 156.8 MHz?
+SELECT Plan, Channel FROM Channels WHERE Frequency_MHz = 156.8;
 ```
 
+The `Frequencies_FTS` table is an FTS5 full-text index over Band,
+Primary_Use, Service_Type and Notes, kept in sync with `Frequencies` by
+triggers. Use it instead of `LIKE '%...%'`, which scans the whole table:
+
+```sql
+-- Ranked search by name, with prefix matching
+SELECT f.Band, f.Primary_Use FROM Frequencies_FTS
+JOIN Frequencies f ON f.ID = Frequencies_FTS.rowid
+WHERE Frequencies_FTS MATCH 'time sig*'
+ORDER BY bm25(Frequencies_FTS);
+```
+
+From Python, `generate_databases.search_frequencies("distress")` searches
+the same way, and `search_frequencies("gmrs", 462, 468)` also limits the
+results to allocations overlapping 462-468 MHz.
+
 ## Option 2: Use the Excel Workbook
 
 The `Frequencies.xlsx` file contains:
@@ -244,6 +671,10 @@ The `Frequencies.xlsx` file contains:
 2. Set the ID field as AutoNumber and Primary Key
 3. Apply the indexes as specified in database_schema.sql
 4. Add any additional fields (DateAdded, Notes) as needed
+5. To import the Channels, Overlaps and Coverage tables as well, create them from
+   database_schema.sql first. Skip the `Frequencies_RTree` and `Frequencies_FTS`
+   tables: they are SQLite-only (R*Tree and FTS5), and in Access the ordinary
+   indexes on Frequencies serve the same lookups
 
 ## Database Features
 
@@ -271,43 +702,136 @@ Frequency data compiled and verified from:
 *The frequency data in this repository has been researched and verified against authoritative sources as of 2024.*
 """
     
-    with open('ACCESS_DATABASE_INSTRUCTIONS.md', 'w') as f:
+    with open(filename, 'w') as f:
         f.write(instructions)
     
     print("Updated ACCESS_DATABASE_INSTRUCTIONS.md with comprehensive options")
 
-def main():
+def emitter_code():
+    """
+    The modules and functions hashed into each output's manifest entry, by emitter name.
+
+    Outputs are keyed on whole modules, so edits to module-level constants and
+    helpers (the column list, the snapshot layout, the interval tree) rebuild
+    them too. build_all hashes the same code, so the two agree on what is stale.
+    """
+    import channel_plans
+    import enhance_frequency_data
+    import frequency_coverage
+    import frequency_index
+    import frequency_overlaps
+    import frequency_parquet
+    import frequency_snapshot
+
+    this = sys.modules[__name__]
+    return {
+        "csv": (enhance_frequency_data,),
+        "sqlite": (this, enhance_frequency_data, channel_plans, frequency_overlaps, frequency_coverage),
+        "snapshot": (frequency_snapshot, frequency_index),
+        "overlaps": (frequency_overlaps,),
+        "parquet": (frequency_parquet, enhance_frequency_data),
+        "excel": (this, enhance_frequency_data),
+        "access": (create_access_instructions,),
+    }
+
+def main(argv=None):
     """Generate all database and spreadsheet files."""
+    parser = argparse.ArgumentParser(description="Generate the frequency database files.")
+    parser.add_argument("--force", action="store_true", help="rebuild every file even if it is up to date")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    with profiling(args):
+        _generate(args)
+
+def _generate(args):
+    """Build every out-of-date file, with a profiling span around each stage."""
+    import inspect
+    from build_manifest import BuildManifest, build_artifact, dataset_hash, inputs_hash
+    from frequency_snapshot import write_snapshot
+    import frequency_overlaps
+    import frequency_parquet
+    from frequency_regions import REGIONS
+    
     print("Generating enhanced frequency database files...")
     
     # Get enhanced data
-    data = get_enhanced_frequency_data()
+    with span("load data"):
+        data = get_enhanced_frequency_data()
+        data_hash = dataset_hash(data)
+        manifest = BuildManifest()
+        code = emitter_code()
     
     # Replace the original CSV with enhanced data
-    with open('frequency_data.csv', 'w', newline='') as csvfile:
-        fieldnames = ["Band", "Frequency_Start_MHz", "Frequency_End_MHz", "Wavelength", "Primary_Use", "Service_Type"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in data:
-            writer.writerow(row)
-    
-    print(f"Updated frequency_data.csv with {len(data)} verified entries")
+    built = {}
+    built["frequency_data.csv"] = build_artifact(
+        manifest, "csv", "frequency_data.csv",
+        inputs_hash(data_hash, *code["csv"]),
+        lambda: write_csv_file(data, "frequency_data.csv"), args.force)
+    if built["frequency_data.csv"]:
+        print(f"Updated frequency_data.csv with {len(data)} verified entries")
     
     # Create SQLite database
-    create_sqlite_database(data)
+    built["Frequencies.db"] = build_artifact(
+        manifest, "sqlite", "Frequencies.db",
+        inputs_hash(data_hash, *code["sqlite"]),
+        lambda: create_sqlite_database(data), args.force)
+    
+    # One SQLite database per additional region, built from that region's own data
+    for region in REGIONS.values():
+        if region.database != "Frequencies.db":
+            built[region.database] = build_artifact(
+                manifest, f"sqlite-{region.code.lower()}", region.database,
+                inputs_hash("", inspect.getmodule(region.loader), *code["sqlite"]),
+                lambda region=region: create_sqlite_database(region.loader(), region.database), args.force)
+    
+    # Write the memory-mappable lookup snapshot next to the database
+    built["Frequencies.snap"] = build_artifact(
+        manifest, "snapshot", "Frequencies.snap",
+        inputs_hash(data_hash, *code["snapshot"]),
+        lambda: write_snapshot(data, "Frequencies.snap"), args.force)
+    
+    # Report overlapping allocations
+    built["OVERLAP_REPORT.md"] = build_artifact(
+        manifest, "overlaps", "OVERLAP_REPORT.md",
+        inputs_hash(data_hash, *code["overlaps"]),
+        lambda: frequency_overlaps.write_overlap_report(frequency_overlaps.find_overlaps(data)), args.force)
+    
+    # Write the columnar Parquet export for analytics jobs
+    built["Frequencies.parquet"] = build_artifact(
+        manifest, "parquet", "Frequencies.parquet",
+        inputs_hash(data_hash, *code["parquet"]),
+        lambda: frequency_parquet.write_parquet(data, "Frequencies.parquet"), args.force)
     
     # Create Excel workbook
-    create_excel_workbook(data)
+    built["Frequencies.xlsx"] = build_artifact(
+        manifest, "excel", "Frequencies.xlsx",
+        inputs_hash(data_hash, *code["excel"]),
+        lambda: create_excel_workbook(data, write_only=True), args.force)
+    
+    # Update Access instructions (independent of the dataset)
+    built["ACCESS_DATABASE_INSTRUCTIONS.md"] = build_artifact(
+        manifest, "access", "ACCESS_DATABASE_INSTRUCTIONS.md",
+        inputs_hash("", *code["access"]),
+        create_access_instructions, args.force)
     
-    # Update Access instructions
-    create_access_instructions()
+    manifest.save()
     
     print("\n=== Database Generation Complete ===")
     print(f"Files created:")
-    print(f"- frequency_data.csv ({len(data)} entries)")
-    print(f"- Frequencies.db (SQLite database)")
-    print(f"- Frequencies.xlsx (Excel workbook)")
-    print(f"- ACCESS_DATABASE_INSTRUCTIONS.md (updated)")
+    descriptions = {
+        "frequency_data.csv": f"{len(data)} entries",
+        "Frequencies.db": "SQLite database",
+        **{region.database: f"SQLite database, {region.name}"
+           for region in REGIONS.values() if region.database != "Frequencies.db"},
+        "Frequencies.snap": "lookup snapshot",
+        "OVERLAP_REPORT.md": "overlap report",
+        "Frequencies.parquet": "Parquet export",
+        "Frequencies.xlsx": "Excel workbook",
+        "ACCESS_DATABASE_INSTRUCTIONS.md": "updated",
+    }
+    for filename, description in descriptions.items():
+        print(f"- {filename} ({description if built[filename] else 'up to date'})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
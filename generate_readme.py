@@ -1,29 +1,21 @@
 #!/usr/bin/env python3
 """
 Generate comprehensive README.md with complete frequency information.
+
+The README is assembled by a registry of section renderers that append to a
+single list of strings, joined once at the end. Each service's tables are
+declared as data in SERVICE_LAYOUTS rather than as formatting code.
 """
 
-import csv
+import argparse
+import sys
 from enhance_frequency_data import get_enhanced_frequency_data
+from build_manifest import BuildManifest, build_artifact, dataset_hash, inputs_hash
+from build_profiler import add_profile_arguments, profiling, span
+from frequency_cache import QueryCache, dataset_version
+import frequency_coverage
 
-def generate_comprehensive_readme():
-    """Generate a comprehensive README with all frequency data."""
-    
-    data = get_enhanced_frequency_data()
-    
-    # Group data by service type
-    service_groups = {}
-    for entry in data:
-        service = entry['Service_Type']
-        if service not in service_groups:
-            service_groups[service] = []
-        service_groups[service].append(entry)
-    
-    # Sort each group by frequency
-    for service in service_groups:
-        service_groups[service].sort(key=lambda x: x['Frequency_Start_MHz'])
-    
-    readme_content = """# Frequency Reference Database
+HEADER = """# Frequency Reference Database
 
 A comprehensive, verified reference database containing frequency allocations, band plans, and technical specifications for radio frequency applications across all services. This database contains **91 verified frequency allocations** researched from authoritative sources including the FCC, ITU, ARRL, IEEE, and other standards organizations.
 
@@ -35,6 +27,7 @@ This repository contains complete frequency reference data in multiple formats:
 - **frequency_data.csv**: Complete frequency data (91 entries) in CSV format for database import
 - **Frequencies.db**: SQLite database with indexed tables for fast frequency lookups
 - **Frequencies.xlsx**: Excel workbook with categorized worksheets for each service type
+- **Frequencies.parquet**: Columnar Parquet export sorted by frequency, for analytics tools
 - **database_schema.sql**: SQL schema for creating custom databases
 
 ### Documentation
@@ -49,78 +42,89 @@ This repository contains complete frequency reference data in multiple formats:
 
 """
 
-    # Add each service type section
-    service_type_order = [
-        'Amateur Radio',
-        'Broadcast', 
-        'Public Safety',
-        'Aviation',
-        'Marine',
-        'Citizens Band',
-        'Personal Radio',
-        'WiFi',
-        'ISM',
-        'Cellular',
-        'GPS',
-        'Satellite',
-        'Time Standard',
-        'Emergency',
-        'Personal Area Network'
-    ]
-    
-    for service_type in service_type_order:
-        if service_type not in service_groups:
-            continue
-            
-        entries = service_groups[service_type]
-        
-        readme_content += f"\n## {service_type}\n\n"
-        
-        if service_type == 'Amateur Radio':
-            readme_content += """Amateur radio frequency allocations in the United States as defined by FCC Part 97 and coordinated with the ARRL band plans. These frequencies are allocated for amateur radio operators holding valid FCC licenses.
+# Order in which service sections appear; services not listed follow alphabetically
+SERVICE_TYPE_ORDER = [
+    'Amateur Radio',
+    'Broadcast', 
+    'Public Safety',
+    'Aviation',
+    'Marine',
+    'Citizens Band',
+    'Personal Radio',
+    'WiFi',
+    'ISM',
+    'Cellular',
+    'GPS',
+    'Satellite',
+    'Time Standard',
+    'Emergency',
+    'Personal Area Network'
+]
+
+# Frequency formats as (single frequency, range)
+RANGE_FORMATS = {
+    'MHz 0.1': ("{start:.1f} MHz", "{start:.1f} - {end:.1f} MHz"),
+    'MHz 0.3': ("{start:.3f} MHz", "{start:.3f} - {end:.3f} MHz"),
+    'MHz 0.1/0': ("{start:.1f} MHz", "{start:.0f} - {end:.0f} MHz"),
+    'MHz 0.2/0.1': ("{start:.2f} MHz", "{start:.1f} - {end:.1f} MHz"),
+    'MHz range 0': ("{start:.0f} - {end:.0f} MHz", "{start:.0f} - {end:.0f} MHz"),
+    'MHz point 0.2': ("{start:.2f} MHz", "{start:.2f} MHz"),
+    'point 0.2': ("{start:.2f}", "{start:.2f}"),
+}
+
+# Row filters a table can select its entries with
+ROW_FILTERS = {
+    'all': lambda entry: True,
+    'hf': lambda entry: entry['Frequency_End_MHz'] <= 30,
+    'vhf_uhf': lambda entry: entry['Frequency_Start_MHz'] > 30 and 'simplex' not in entry['Band'].lower(),
+    'simplex': lambda entry: 'simplex' in entry['Band'].lower(),
+}
+
+# Time standard stations: (location, operator)
+TIME_STATIONS = {
+    'WWV': ("Colorado", "NIST"),
+    'WWVH': ("Hawaii", "NIST"),
+    'CHU': ("Canada", "NRC"),
+}
+
+# Fields derived from an entry, available to table cell templates
+DERIVED_FIELDS = {
+    'station': lambda entry: entry['Band'].split()[0],
+    'location': lambda entry: TIME_STATIONS.get(entry['Band'].split()[0], ("", ""))[0],
+    'operator': lambda entry: TIME_STATIONS.get(entry['Band'].split()[0], ("", ""))[1],
+}
+
+def table(columns, rule, range_format, rows='all', heading=""):
+    """Declare a table: (header, cell template) columns, separator row, frequency format and row filter."""
+    return {'columns': columns, 'rule': rule, 'range': range_format, 'rows': rows, 'heading': heading}
+
+DEFAULT_LAYOUT = [
+    table([("Service", "{Band}"), ("Frequency Range", "{range}"), ("Purpose", "{Primary_Use}")],
+          "|---------|----------------|----------|", 'MHz 0.2/0.1'),
+]
+
+# Per-service section bodies: text blocks and table declarations, rendered in order
+SERVICE_LAYOUTS = {
+    'Amateur Radio': [
+        """Amateur radio frequency allocations in the United States as defined by FCC Part 97 and coordinated with the ARRL band plans. These frequencies are allocated for amateur radio operators holding valid FCC licenses.
 
 ### HF Amateur Bands (High Frequency: 3-30 MHz)
 
 The HF bands provide long-distance communication capabilities through ionospheric propagation. Band conditions vary with solar cycle, time of day, and season.
 
-"""
-            # Create separate tables for HF and VHF/UHF
-            hf_bands = [e for e in entries if e['Frequency_End_MHz'] <= 30]
-            vhf_uhf_bands = [e for e in entries if e['Frequency_Start_MHz'] > 30 and 'simplex' not in e['Band'].lower()]
-            simplex_freqs = [e for e in entries if 'simplex' in e['Band'].lower()]
-            
-            if hf_bands:
-                readme_content += "| Band | Frequency Range | Wavelength | Primary Use |\n"
-                readme_content += "|------|----------------|-------------|-------------|\n"
-                for entry in hf_bands:
-                    if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz']:
-                        freq_range = f"{entry['Frequency_Start_MHz']:.3f} MHz"
-                    else:
-                        freq_range = f"{entry['Frequency_Start_MHz']:.3f} - {entry['Frequency_End_MHz']:.3f} MHz"
-                    readme_content += f"| {entry['Band']} | {freq_range} | {entry['Wavelength']} | {entry['Primary_Use']} |\n"
-            
-            readme_content += "\n### VHF/UHF Amateur Bands (Very High Frequency: 30 MHz and above)\n\n"
-            readme_content += "VHF and UHF bands provide reliable local and regional communication, with some bands offering weak-signal propagation modes and satellite communication.\n\n"
-            
-            if vhf_uhf_bands:
-                readme_content += "| Band | Frequency Range | Wavelength | Primary Use |\n"
-                readme_content += "|------|----------------|-------------|-------------|\n"
-                for entry in vhf_uhf_bands:
-                    if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz']:
-                        freq_range = f"{entry['Frequency_Start_MHz']:.1f} MHz"
-                    else:
-                        freq_range = f"{entry['Frequency_Start_MHz']:.1f} - {entry['Frequency_End_MHz']:.1f} MHz"
-                    readme_content += f"| {entry['Band']} | {freq_range} | {entry['Wavelength']} | {entry['Primary_Use']} |\n"
-            
-            if simplex_freqs:
-                readme_content += "\n### Important Amateur Radio Frequencies\n\n"
-                readme_content += "| Frequency | Description | Use |\n"
-                readme_content += "|-----------|-------------|-----|\n"
-                for entry in simplex_freqs:
-                    readme_content += f"| {entry['Frequency_Start_MHz']:.2f} MHz | {entry['Band']} | {entry['Primary_Use']} |\n"
-        
-        elif service_type == 'Broadcast':
-            readme_content += """Commercial broadcasting frequencies allocated by the FCC for AM radio, FM radio, and over-the-air television in the United States.
+""",
+        table([("Band", "{Band}"), ("Frequency Range", "{range}"), ("Wavelength", "{Wavelength}"), ("Primary Use", "{Primary_Use}")],
+              "|------|----------------|-------------|-------------|", 'MHz 0.3', rows='hf'),
+        "\n### VHF/UHF Amateur Bands (Very High Frequency: 30 MHz and above)\n\n"
+        "VHF and UHF bands provide reliable local and regional communication, with some bands offering weak-signal propagation modes and satellite communication.\n\n",
+        table([("Band", "{Band}"), ("Frequency Range", "{range}"), ("Wavelength", "{Wavelength}"), ("Primary Use", "{Primary_Use}")],
+              "|------|----------------|-------------|-------------|", 'MHz 0.1', rows='vhf_uhf'),
+        table([("Frequency", "{range}"), ("Description", "{Band}"), ("Use", "{Primary_Use}")],
+              "|-----------|-------------|-----|", 'MHz point 0.2', rows='simplex',
+              heading="\n### Important Amateur Radio Frequencies\n\n"),
+    ],
+    'Broadcast': [
+        """Commercial broadcasting frequencies allocated by the FCC for AM radio, FM radio, and over-the-air television in the United States.
 
 ### AM Radio Broadcasting
 AM (Amplitude Modulation) radio operates in the Medium Frequency (MF) band with 10 kHz channel spacing in North America (9 kHz internationally).
@@ -131,33 +135,21 @@ FM (Frequency Modulation) radio operates in the VHF band with 200 kHz channel sp
 ### Television Broadcasting
 Over-the-air television uses ATSC (Advanced Television Systems Committee) digital transmission standard in North America.
 
-"""
-            readme_content += "| Service | Frequency Range | Band | Modulation/Standard |\n"
-            readme_content += "|---------|----------------|------|--------------------|\n"
-            for entry in entries:
-                if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz']:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} MHz"
-                else:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} - {entry['Frequency_End_MHz']:.1f} MHz"
-                readme_content += f"| {entry['Band']} | {freq_range} | {entry['Wavelength']} | {entry['Primary_Use']} |\n"
-        
-        elif service_type == 'Public Safety':
-            readme_content += """Public safety frequencies used by police, fire, emergency medical services, and other first responders. These frequencies are coordinated through local and regional frequency coordination offices.
+""",
+        table([("Service", "{Band}"), ("Frequency Range", "{range}"), ("Band", "{Wavelength}"), ("Modulation/Standard", "{Primary_Use}")],
+              "|---------|----------------|------|--------------------|", 'MHz 0.1'),
+    ],
+    'Public Safety': [
+        """Public safety frequencies used by police, fire, emergency medical services, and other first responders. These frequencies are coordinated through local and regional frequency coordination offices.
 
 **Note**: Many public safety agencies have migrated to digital trunked radio systems and P25 digital modes. Frequencies listed represent common allocations but specific assignments vary by region.
 
-"""
-            readme_content += "| Service | Frequency Range | Primary Users | Notes |\n"
-            readme_content += "|---------|----------------|---------------|-------|\n"
-            for entry in entries:
-                if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz']:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} MHz"
-                else:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} - {entry['Frequency_End_MHz']:.1f} MHz"
-                readme_content += f"| {entry['Band']} | {freq_range} | {entry['Primary_Use']} | Regional variations apply |\n"
-        
-        elif service_type == 'Aviation':
-            readme_content += """Aviation frequencies used for air traffic control, aircraft communication, and navigation aids. These frequencies are regulated by the FAA in the United States and ICAO internationally.
+""",
+        table([("Service", "{Band}"), ("Frequency Range", "{range}"), ("Primary Users", "{Primary_Use}"), ("Notes", "Regional variations apply")],
+              "|---------|----------------|---------------|-------|", 'MHz 0.1'),
+    ],
+    'Aviation': [
+        """Aviation frequencies used for air traffic control, aircraft communication, and navigation aids. These frequencies are regulated by the FAA in the United States and ICAO internationally.
 
 ### VHF Aviation Band
 The primary aviation communication band using AM (amplitude modulation) with 25 kHz channel spacing (8.33 kHz in some regions).
@@ -165,18 +157,12 @@ The primary aviation communication band using AM (amplitude modulation) with 25
 ### Emergency Frequencies
 Critical frequencies for aviation emergencies and search and rescue operations.
 
-"""
-            readme_content += "| Service | Frequency | Band | Purpose |\n"
-            readme_content += "|---------|-----------|------|----------|\n"
-            for entry in entries:
-                if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz']:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} MHz"
-                else:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.0f} - {entry['Frequency_End_MHz']:.0f} MHz"
-                readme_content += f"| {entry['Band']} | {freq_range} | VHF/UHF | {entry['Primary_Use']} |\n"
-        
-        elif service_type == 'Marine':
-            readme_content += """Maritime mobile frequencies for ship-to-ship, ship-to-shore, and distress communication. Regulated by the FCC and coordinated internationally through the ITU.
+""",
+        table([("Service", "{Band}"), ("Frequency", "{range}"), ("Band", "VHF/UHF"), ("Purpose", "{Primary_Use}")],
+              "|---------|-----------|------|----------|", 'MHz 0.1/0'),
+    ],
+    'Marine': [
+        """Maritime mobile frequencies for ship-to-ship, ship-to-shore, and distress communication. Regulated by the FCC and coordinated internationally through the ITU.
 
 ### VHF Marine Band
 Primary marine communication using FM with 25 kHz channel spacing. Channel 16 (156.8 MHz) is the international distress and calling frequency.
@@ -184,18 +170,12 @@ Primary marine communication using FM with 25 kHz channel spacing. Channel 16 (1
 ### HF Marine Bands
 Long-range maritime communication for ocean-going vessels.
 
-"""
-            readme_content += "| Service | Frequency Range | Band | Purpose |\n"
-            readme_content += "|---------|----------------|------|----------|\n"
-            for entry in entries:
-                if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz']:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} MHz"
-                else:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} - {entry['Frequency_End_MHz']:.1f} MHz"
-                readme_content += f"| {entry['Band']} | {freq_range} | Marine | {entry['Primary_Use']} |\n"
-        
-        elif service_type == 'WiFi':
-            readme_content += """Wi-Fi frequencies based on IEEE 802.11 standards. These operate in unlicensed ISM bands with specific power and bandwidth limitations.
+""",
+        table([("Service", "{Band}"), ("Frequency Range", "{range}"), ("Band", "Marine"), ("Purpose", "{Primary_Use}")],
+              "|---------|----------------|------|----------|", 'MHz 0.1'),
+    ],
+    'WiFi': [
+        """Wi-Fi frequencies based on IEEE 802.11 standards. These operate in unlicensed ISM bands with specific power and bandwidth limitations.
 
 ### 2.4 GHz Band (802.11b/g/n/ax)
 Most widely used Wi-Fi band, shared with other ISM devices like microwave ovens and Bluetooth.
@@ -206,15 +186,12 @@ Less congested band offering higher data rates and more channels.
 ### 6 GHz Band (Wi-Fi 6E)
 Newest allocation providing additional spectrum for high-capacity applications.
 
-"""
-            readme_content += "| Band | Frequency Range | Standard | Typical Use |\n"
-            readme_content += "|------|----------------|----------|-------------|\n"
-            for entry in entries:
-                freq_range = f"{entry['Frequency_Start_MHz']:.0f} - {entry['Frequency_End_MHz']:.0f} MHz"
-                readme_content += f"| {entry['Band']} | {freq_range} | {entry['Primary_Use']} | Wireless networking |\n"
-        
-        elif service_type == 'Cellular':
-            readme_content += """Cellular telephone frequencies including 2G, 3G, 4G LTE, and 5G bands. Band designations follow 3GPP specifications and vary by carrier and region.
+""",
+        table([("Band", "{Band}"), ("Frequency Range", "{range}"), ("Standard", "{Primary_Use}"), ("Typical Use", "Wireless networking")],
+              "|------|----------------|----------|-------------|", 'MHz range 0'),
+    ],
+    'Cellular': [
+        """Cellular telephone frequencies including 2G, 3G, 4G LTE, and 5G bands. Band designations follow 3GPP specifications and vary by carrier and region.
 
 ### LTE Band Classifications
 - **Low Band** (< 1 GHz): Wide coverage, good building penetration
@@ -224,18 +201,12 @@ Newest allocation providing additional spectrum for high-capacity applications.
 ### 5G Deployment
 5G uses both existing LTE bands (NSA mode) and new millimeter wave spectrum (mmWave).
 
-"""
-            readme_content += "| Band | Frequency Range | Technology | Primary Carriers |\n"
-            readme_content += "|------|----------------|------------|------------------|\n"
-            for entry in entries:
-                if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz']:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} MHz"
-                else:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.0f} - {entry['Frequency_End_MHz']:.0f} MHz"
-                readme_content += f"| {entry['Band']} | {freq_range} | {entry['Primary_Use']} | Major carriers |\n"
-        
-        elif service_type == 'GPS':
-            readme_content += """Global Navigation Satellite System (GNSS) frequencies including GPS, GLONASS, Galileo, and other satellite navigation systems.
+""",
+        table([("Band", "{Band}"), ("Frequency Range", "{range}"), ("Technology", "{Primary_Use}"), ("Primary Carriers", "Major carriers")],
+              "|------|----------------|------------|------------------|", 'MHz 0.1/0'),
+    ],
+    'GPS': [
+        """Global Navigation Satellite System (GNSS) frequencies including GPS, GLONASS, Galileo, and other satellite navigation systems.
 
 ### GPS Signal Structure
 - **L1 C/A**: Civilian coarse acquisition code (public)
@@ -245,15 +216,12 @@ Newest allocation providing additional spectrum for high-capacity applications.
 ### Other GNSS Systems
 Modern receivers typically support multiple satellite constellations for improved accuracy and availability.
 
-"""
-            readme_content += "| System | Frequency (MHz) | Signal | Purpose |\n"
-            readme_content += "|--------|----------------|--------|----------|\n"
-            for entry in entries:
-                freq_range = f"{entry['Frequency_Start_MHz']:.2f}"
-                readme_content += f"| {entry['Band']} | {freq_range} | Navigation | {entry['Primary_Use']} |\n"
-        
-        elif service_type == 'Time Standard':
-            readme_content += """Time and frequency standard stations providing precise time signals for synchronization and calibration purposes.
+""",
+        table([("System", "{Band}"), ("Frequency (MHz)", "{range}"), ("Signal", "Navigation"), ("Purpose", "{Primary_Use}")],
+              "|--------|----------------|--------|----------|", 'point 0.2'),
+    ],
+    'Time Standard': [
+        """Time and frequency standard stations providing precise time signals for synchronization and calibration purposes.
 
 ### WWV (Fort Collins, Colorado)
 Operated by NIST, provides continuous time signals with voice announcements and time codes.
@@ -264,33 +232,15 @@ Similar to WWV but with female voice announcements to distinguish from WWV.
 ### CHU (Ottawa, Canada)
 Operated by the National Research Council of Canada.
 
-"""
-            readme_content += "| Station | Frequency (MHz) | Location | Operator |\n"
-            readme_content += "|---------|----------------|----------|----------|\n"
-            for entry in entries:
-                freq_range = f"{entry['Frequency_Start_MHz']:.2f}"
-                station = entry['Band'].replace(' ', ' ').split()[0]
-                if 'WWV' in station:
-                    location = "Colorado" if station == "WWV" else "Hawaii"
-                    operator = "NIST"
-                else:
-                    location = "Canada"  
-                    operator = "NRC"
-                readme_content += f"| {station} | {freq_range} | {location} | {operator} |\n"
-        
-        else:
-            # Generic table for other service types
-            readme_content += "| Service | Frequency Range | Purpose |\n"
-            readme_content += "|---------|----------------|----------|\n"
-            for entry in entries:
-                if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz']:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.2f} MHz"
-                else:
-                    freq_range = f"{entry['Frequency_Start_MHz']:.1f} - {entry['Frequency_End_MHz']:.1f} MHz"
-                readme_content += f"| {entry['Band']} | {freq_range} | {entry['Primary_Use']} |\n"
-
-    # Add remaining sections
-    readme_content += """
+""",
+        table([("Station", "{station}"), ("Frequency (MHz)", "{range}"), ("Location", "{location}"), ("Operator", "{operator}")],
+              "|---------|----------------|----------|----------|", 'point 0.2'),
+    ],
+}
+
+# Static reference sections that follow the allocation tables, in order
+STATIC_SECTIONS = [
+    """
 ## Frequency Band Designations
 
 ### ITU Radio Frequency Bands
@@ -305,7 +255,8 @@ Operated by the National Research Council of Canada.
 | 9 | 300-3000 MHz | 100-10 cm | UHF (Ultra High Frequency) |
 | 10 | 3-30 GHz | 10-1 cm | SHF (Super High Frequency) |
 | 11 | 30-300 GHz | 10-1 mm | EHF (Extremely High Frequency) |
-
+""",
+    """
 ## Microwave and Satellite Frequency Bands
 
 ### IEEE Standard Radar Bands
@@ -322,7 +273,8 @@ Operated by the National Research Council of Canada.
 | Ku | 12-18 GHz | 1.67-2.5 cm | Satellite TV, police radar |
 | K | 18-27 GHz | 1.11-1.67 cm | Radar, satellite communication |
 | Ka | 27-40 GHz | 0.75-1.11 cm | High-resolution radar, 5G |
-
+""",
+    """
 ## Audio and Musical Frequencies
 
 ### Musical Note Frequencies (4th Octave - Concert Pitch A440)
@@ -363,7 +315,8 @@ Operated by the National Research Council of Canada.
 - **FM Radio**: 20 Hz - 15 kHz
 - **CD Quality**: 20 Hz - 22.05 kHz
 - **High-Resolution Audio**: 20 Hz - 40+ kHz
-
+""",
+    """
 ## Database Usage and Applications
 
 ### Frequency Lookup Examples
@@ -423,7 +376,8 @@ This frequency database serves multiple applications:
 - Interoperability planning
 - Backup communication systems
 - Public safety coordination
-
+""",
+    """
 ## Data Sources and Verification
 
 All frequency data in this database has been researched and verified against authoritative sources:
@@ -448,7 +402,8 @@ All frequency data in this database has been researched and verified against aut
 - Last verified: December 2024
 - Sources current as of: December 2024
 - Regular updates planned for regulatory changes
-
+""",
+    """
 ## Technical Specifications
 
 ### Database Schema
@@ -473,6 +428,7 @@ CREATE TABLE Frequencies (
 - **idx_frequency_range**: Optimizes frequency range queries
 - **idx_service_type**: Optimizes service type filtering  
 - **idx_band**: Optimizes band name searches
+- **Frequencies_RTree**: R*Tree index for point and overlap lookups on frequency ranges
 
 ### File Formats
 
@@ -492,7 +448,8 @@ CREATE TABLE Frequencies (
 - Formatted for readability
 - Summary statistics included
 - Compatible with Microsoft Excel 2007+
-
+""",
+    """
 ## License and Usage
 
 ### Educational and Reference Use
@@ -516,7 +473,8 @@ This frequency data compilation is provided for educational and reference purpos
 - Safety-critical applications without verification
 - Commercial purposes without proper licensing
 - Real-time applications requiring current data
-
+""",
+    """
 ## Contributing and Updates
 
 ### Reporting Issues
@@ -546,18 +504,140 @@ For new frequency allocations or missing services:
 **Total Frequency Allocations**: 91 verified entries  
 **Coverage**: DC to 40+ GHz across all major services
 """
+]
+
+class _RowContext(dict):
+    """Template context for one entry; derived fields are computed on first use."""
+
+    def __init__(self, entry, range_text):
+        super().__init__(entry, range=range_text)
+        self.entry = entry
+
+    def __missing__(self, key):
+        value = DERIVED_FIELDS[key](self.entry)
+        self[key] = value
+        return value
+
+def format_range(entry, range_format):
+    """Format an entry's frequency or frequency range."""
+    single, span = RANGE_FORMATS[range_format]
+    template = single if entry['Frequency_Start_MHz'] == entry['Frequency_End_MHz'] else span
+    return template.format(start=entry['Frequency_Start_MHz'], end=entry['Frequency_End_MHz'])
+
+def render_table(out, spec, entries):
+    """Append a declared table for the entries it selects; nothing if it selects none."""
+    rows = [entry for entry in entries if ROW_FILTERS[spec['rows']](entry)]
+    if not rows:
+        return
+    out.append(spec['heading'])
+    out.append("| " + " | ".join(header for header, _ in spec['columns']) + " |\n")
+    out.append(spec['rule'] + "\n")
+    templates = [template for _, template in spec['columns']]
+    for entry in rows:
+        context = _RowContext(entry, format_range(entry, spec['range']))
+        out.append("| " + " | ".join(template.format_map(context) for template in templates) + " |\n")
+
+def render_service_section(out, service_type, entries):
+    """Append one service's heading, text blocks and tables."""
+    out.append(f"\n## {service_type}\n\n")
+    for block in SERVICE_LAYOUTS.get(service_type, DEFAULT_LAYOUT):
+        if isinstance(block, str):
+            out.append(block)
+        else:
+            render_table(out, block, entries)
 
-    return readme_content
-
-def main():
+def group_by_service(data):
+    """Group entries by Service_Type, each group sorted by start frequency."""
+    service_groups = {}
+    for entry in data:
+        service_groups.setdefault(entry['Service_Type'], []).append(entry)
+    for entries in service_groups.values():
+        entries.sort(key=lambda x: x['Frequency_Start_MHz'])
+    return service_groups
+
+def render_header(out, service_groups):
+    out.append(HEADER)
+
+def render_allocations(out, service_groups):
+    ordered = [s for s in SERVICE_TYPE_ORDER if s in service_groups]
+    ordered += sorted(s for s in service_groups if s not in SERVICE_TYPE_ORDER)
+    for service_type in ordered:
+        render_service_section(out, service_type, service_groups[service_type])
+
+def render_coverage(out, service_groups):
+    data = [entry for entries in service_groups.values() for entry in entries]
+    frequency_coverage.render_coverage_section(out, frequency_coverage.SpectrumCoverage(data), SERVICE_TYPE_ORDER)
+
+def render_static_sections(out, service_groups):
+    out.extend(STATIC_SECTIONS)
+
+# README sections in document order: (name, renderer appending to the output list)
+SECTIONS = [
+    ("header", render_header),
+    ("allocations", render_allocations),
+    ("coverage", render_coverage),
+    ("reference", render_static_sections),
+]
+
+# Rendered sections by dataset version and section name
+_section_cache = QueryCache(maxsize=64)
+
+def render_section(name, data=None):
+    """
+    Render a single named README section on its own.
+
+    Sections are cached by name and dataset hash, so rendering one again for
+    unchanged data is a lookup.
+    """
+    if data is None:
+        data = get_enhanced_frequency_data()
+    renderer = dict(SECTIONS)[name]
+
+    def render():
+        out = []
+        renderer(out, group_by_service(data))
+        return "".join(out)
+
+    _section_cache.set_version(dataset_version(data))
+    return _section_cache.get(name, render)
+
+def generate_comprehensive_readme(data=None):
+    """Generate a comprehensive README with all frequency data."""
+    
+    if data is None:
+        data = get_enhanced_frequency_data()
+    
+    service_groups = group_by_service(data)
+    out = []
+    for name, renderer in SECTIONS:
+        with span("readme.section", section=name):
+            renderer(out, service_groups)
+    return "".join(out)
+
+def main(argv=None):
     """Generate the comprehensive README."""
-    content = generate_comprehensive_readme()
+    parser = argparse.ArgumentParser(description="Generate README.md from the frequency data.")
+    parser.add_argument("--force", action="store_true", help="rebuild README.md even if it is up to date")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    with profiling(args):
+        manifest = BuildManifest()
+        # Layouts and static sections live at module level, so the whole module is hashed
+        with span("load data"):
+            inputs = inputs_hash(dataset_hash(get_enhanced_frequency_data()), sys.modules[__name__], frequency_coverage)
+        build_artifact(manifest, "readme", "README.md", inputs, write_readme, args.force)
+        manifest.save()
+
+def write_readme(filename="README.md", data=None):
+    """Write the comprehensive README to a file."""
+    content = generate_comprehensive_readme(data)
     
-    with open('README.md', 'w') as f:
+    with open(filename, 'w') as f:
         f.write(content)
     
     print("Generated comprehensive README.md with complete frequency information")
     print(f"README size: {len(content):,} characters")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic frequency allocations for scale testing.
+
+Rows have the exact schema of get_enhanced_frequency_data() and are derived
+from the real allocations: each one picks a real allocation as its template
+(weighted by Service_Type, so the real skew is kept), lands a log-normal
+distance away from it in frequency and inherits its service and use. Output
+is a generator, so any number of rows streams to CSV or straight into the
+SQLite bulk loader without being held in memory.
+
+Examples:
+    python generate_synthetic_data.py --rows 1000000 --csv synthetic.csv
+    python generate_synthetic_data.py --rows 10000000 --sqlite synthetic.db --overlap 4
+"""
+
+import argparse
+import csv
+import math
+import random
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from typing import Iterator, Dict, Any, Optional
+
+from enhance_frequency_data import FREQUENCY_COLUMNS, get_enhanced_frequency_data
+
+SPEED_OF_LIGHT_M_MHZ = 299.792458
+# Spread of synthetic allocations around their template, in decades of frequency
+POSITION_SPREAD_DECADES = 0.25
+
+
+def wavelength_label(frequency_mhz):
+    """Nominal wavelength in the style of the amateur band names, e.g. '2 meters'."""
+    meters = float(f"{SPEED_OF_LIGHT_M_MHZ / frequency_mhz:.2g}")
+    if meters >= 1:
+        return f"{meters:g} meters"
+    return f"{meters * 100:g} centimeters"
+
+
+def synthetic_rows(count: int, seed: int = 0, overlap: float = 2.0, point_fraction: Optional[float] = None,
+                   skew: float = 1.0) -> Iterator[Dict[str, Any]]:
+    """
+    Yield count synthetic allocation rows, deterministically for a given seed.
+
+    overlap is the average number of ranged allocations covering a frequency
+    across the occupied spectrum (on a log scale, as the real bands are).
+    point_fraction is the share of single-frequency allocations (start == end);
+    by default it matches the real data. skew is applied as an exponent to the
+    real per-service counts: 1 keeps the real distribution, 0 makes services
+    uniform and larger values concentrate rows in the biggest services.
+    """
+    rng = random.Random(seed)
+    data = get_enhanced_frequency_data()
+    if point_fraction is None:
+        point_fraction = sum(r['Frequency_Start_MHz'] == r['Frequency_End_MHz'] for r in data) / len(data)
+
+    # Template weights: each service's real count raised to skew, shared among its rows
+    service_counts = Counter(r['Service_Type'] for r in data)
+    weights = [service_counts[r['Service_Type']] ** skew / service_counts[r['Service_Type']] for r in data]
+    cumulative = list(accumulate(weights))
+    total_weight = cumulative[-1]
+
+    lowest = min(r['Frequency_Start_MHz'] for r in data)
+    highest = max(r['Frequency_End_MHz'] for r in data)
+    span_decades = math.log10(highest) - math.log10(lowest) + 2 * POSITION_SPREAD_DECADES
+    # Mean log-width so that the ranged allocations stack overlap deep over the span
+    mean_width_decades = overlap * span_decades / max(count * (1 - point_fraction), 1)
+
+    for i in range(count):
+        template = data[bisect_right(cumulative, rng.random() * total_weight)]
+        centre = math.log10(template['Frequency_Start_MHz']) + rng.gauss(0.0, POSITION_SPREAD_DECADES)
+        start = round(10 ** centre, 6)
+        if rng.random() < point_fraction:
+            end = start
+        else:
+            end = round(10 ** (centre + rng.expovariate(1.0 / mean_width_decades)), 6)
+
+        wavelength = template['Wavelength']
+        if wavelength.endswith("meters"):
+            wavelength = wavelength_label(start)
+        yield {
+            'Band': f"{template['Band']} #{i + 1}",
+            'Frequency_Start_MHz': start,
+            'Frequency_End_MHz': end,
+            'Wavelength': wavelength,
+            'Primary_Use': template['Primary_Use'],
+            'Service_Type': template['Service_Type'],
+        }
+
+
+def write_synthetic_csv(filename: str, count: int, **options) -> int:
+    """Stream count synthetic rows to a CSV file laid out like frequency_data.csv."""
+    written = 0
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FREQUENCY_COLUMNS)
+        writer.writeheader()
+        for row in synthetic_rows(count, **options):
+            writer.writerow(row)
+            written += 1
+    print(f"CSV file '{filename}' created with {written:,} synthetic entries")
+    return written
+
+
+def main():
+    """Generate a synthetic dataset as CSV, SQLite or both."""
+    parser = argparse.ArgumentParser(description="Generate seeded synthetic frequency allocations.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--overlap", type=float, default=2.0,
+                        help="average allocations covering a frequency (default: 2)")
+    parser.add_argument("--point-fraction", type=float, default=None,
+                        help="share of single-frequency allocations (default: as in the real data)")
+    parser.add_argument("--skew", type=float, default=1.0,
+                        help="exponent on the real Service_Type counts (0 = uniform, default: 1)")
+    parser.add_argument("--csv", help="write rows to this CSV file")
+    parser.add_argument("--sqlite", help="bulk load rows into this SQLite database")
+    args = parser.parse_args()
+
+    if not args.csv and not args.sqlite:
+        parser.error("give --csv and/or --sqlite")
+    options = dict(seed=args.seed, overlap=args.overlap, point_fraction=args.point_fraction, skew=args.skew)
+
+    if args.csv:
+        write_synthetic_csv(args.csv, args.rows, **options)
+    if args.sqlite:
+        from generate_databases import bulk_load_frequencies
+        loaded = bulk_load_frequencies(synthetic_rows(args.rows, **options), args.sqlite,
+                                       progress_every=max(args.rows // 10, 1) if args.rows >= 100_000 else None)
+        print(f"SQLite database '{args.sqlite}' created with {loaded:,} synthetic entries")
+
+
+if __name__ == "__main__":
+    main()